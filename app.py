@@ -3,27 +3,25 @@ from flask_cors import CORS
 # from flask_mail import Mail
 # from src.utils.email_service import EmailService
 from src.shared.utils.file_handler import FileHandler
+from src.shared.utils.json_provider import ORJSONProvider
 from src.core.database.db import init_app, get_db
 from src.api.router import register_features
-from config import get_config
-from datetime import datetime
-from flask.json.provider import DefaultJSONProvider 
+from src.core.dependencies.containers import create_container
+from src.core.startup import load_environment, cli_enabled, startup_profile
 import os
 
-class CustomJSONProvider(DefaultJSONProvider):
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.strftime('%Y-%m-%dT%H:%M:%S')
-        return super().default(obj)
-
 def create_app(config_name: str = None, features_config: dict = None, testing: bool = False):
     app = Flask(__name__, instance_relative_config=True)
 
-    app.json_provider_class = CustomJSONProvider
+    # app.json se crea en Flask.__init__: asignar la instancia (la clase ya no se usaría)
+    app.json = ORJSONProvider(app)
 
+    # .env antes de importar config (sus clases leen las variables al definirse)
+    load_environment()
     if testing:
         os.environ['FLASK_ENV'] = 'testing'
     
+    from config import get_config
     config_class = get_config()
     app.config.from_object(config_class)
 
@@ -36,11 +34,22 @@ def create_app(config_name: str = None, features_config: dict = None, testing: b
     # Inicializar base de datos y migraciones
     init_app(app)
 
+    # Contenedor de dependencias (antes de registrar features para el wiring)
+    app.container = create_container(app)
+
     # from src.routes.health import create_health_routes
     # from src.routes.auth import create_auth_routes
     features_to_register = ['auth']  # Solo auth por ahora
     registered_features = register_features(app, features_to_register)
 
+    if cli_enabled(app):
+        app.cli.add_command(startup_profile)
+
+    if app.config.get('LAZY_STARTUP'):
+        # Sin banners ni listado de rutas (`flask routes` las muestra)
+        app.logger.info("Aplicación iniciada: features %s", registered_features)
+        return app
+
     print("\n" + "="*50)
     print("🚀 Aplicación Flask iniciada")
     print("="*50)
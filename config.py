@@ -1,21 +1,17 @@
-from dotenv import load_dotenv
 import os
 
-# Cargar el archivo .env principal primero
-load_dotenv()
-
-# Obtener el entorno después de cargar .env
-environment = os.getenv('FLASK_ENV', 'local')
-
-# Intentar cargar archivo específico del entorno si existe
-env_file = f'.env.{environment}'
-if os.path.exists(env_file):
-    load_dotenv(env_file, override=True)
+# Las variables de .env / .env.<FLASK_ENV> las carga load_environment()
+# (src/core/startup.py) en create_app, antes de importar este módulo
 
 DATABASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
 class Config:
     """Configuración base para todos los entornos"""
+
+    @classmethod
+    def validate(cls):
+        """Comprobaciones del entorno (se ejecutan en get_config, no al importar)"""
+        pass
     
     # Configuración general
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
@@ -33,11 +29,99 @@ class Config:
     JWT_ALGORITHM = os.getenv("ALGORITHM", "HS256")
     JWT_ACCESS_TOKEN_EXPIRES = int(os.getenv("EXPIRES_TOKEN_SESSION", 1440))  # 24 horas
     JWT_RESET_TOKEN_EXPIRES = int(os.getenv("EXPIRES_TOKEN_EMAIL", 30))  # 30 minutos
+    JWT_ISSUER = os.getenv("JWT_ISSUER")
+    JWT_AUDIENCE = os.getenv("JWT_AUDIENCE")
+    JWT_CODEC = os.getenv("JWT_CODEC", "auto")  # auto (HMAC rápido para HS*), hmac o jose
+    JWT_VERIFIED_CACHE_SIZE = int(os.getenv("JWT_VERIFIED_CACHE_SIZE", 10000))  # 0 = sin caché
+    JWT_VERIFIED_CACHE_MAX_TOKEN_BYTES = int(os.getenv("JWT_VERIFIED_CACHE_MAX_TOKEN_BYTES", 4096))
+    # Firma asimétrica (ALGORITHM=EdDSA/RS256/ES256): claves rotadas con kid y JWKS público
+    # (JWT_KEYS_FILE relativo a app.instance_path: la app y `flask auth rotate-keys` comparten fichero)
+    JWT_KEYS_FILE = os.getenv("JWT_KEYS_FILE", "jwt_keys.json")
+    JWT_KEY_ROTATION_DAYS = int(os.getenv("JWT_KEY_ROTATION_DAYS", 30))  # flask auth rotate-keys
+    JWT_KEY_PUBLISH_AHEAD = int(os.getenv("JWT_KEY_PUBLISH_AHEAD", 600))  # segundos publicada antes de firmar
+    JWT_KEY_RETAIN_SECONDS = int(os.getenv("JWT_KEY_RETAIN_SECONDS", 2592000))  # vida máxima de un token
+    JWT_JWKS_MAX_AGE = int(os.getenv("JWT_JWKS_MAX_AGE", 300))  # Cache-Control del JWKS
+
+    # Arranque diferido: sin conexión a la BD, banners ni Flask-Migrate al crear la app
+    # (el pool conecta en la primera consulta); ver `flask startup-profile`
+    LAZY_STARTUP = os.getenv("LAZY_STARTUP", "false").lower() == "true"
+
+    # Configuración de passwords
+    PASSWORD_ALGORITHM = os.getenv("PASSWORD_ALGORITHM", "argon2")
+    # Perfil de costes calibrado por host (flask auth calibrate-hashing)
+    # (PASSWORD_HASH_PROFILES_FILE relativo a app.instance_path, como JWT_KEYS_FILE)
+    PASSWORD_HASH_PROFILE = os.getenv("PASSWORD_HASH_PROFILE")  # None = costes por defecto
+    PASSWORD_HASH_PROFILES_FILE = os.getenv("PASSWORD_HASH_PROFILES_FILE", "hashing_profiles.json")
+    # Pool de hashing por worker: hilos = presupuesto de memoria / memoria por hash
+    PASSWORD_HASH_MEMORY_BUDGET_MB = int(os.getenv("PASSWORD_HASH_MEMORY_BUDGET_MB", 1024))
+    PASSWORD_HASH_MAX_WORKERS = int(os.getenv("PASSWORD_HASH_MAX_WORKERS", 0)) or None  # None = según CPUs
+    PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", 64))  # peticiones en espera
+    PASSWORD_HASH_MAX_WAIT = float(os.getenv("PASSWORD_HASH_MAX_WAIT", 2.0))  # segundos máximos en cola
+
+    # Revocación de access tokens (logout): denylist por jti + filtro de Bloom por worker
+    AUTH_REVOCATION_CAPACITY = int(os.getenv("AUTH_REVOCATION_CAPACITY", 100000))  # revocaciones vigentes esperadas
+    AUTH_REVOCATION_ERROR_RATE = float(os.getenv("AUTH_REVOCATION_ERROR_RATE", 0.001))  # falsos positivos (van a BD)
+    AUTH_REVOCATION_REFRESH_SECONDS = float(os.getenv("AUTH_REVOCATION_REFRESH_SECONDS", 2))  # retraso entre workers
+    AUTH_REVOCATION_REBUILD_SECONDS = float(os.getenv("AUTH_REVOCATION_REBUILD_SECONDS", 600))
+    AUTH_REVOCATION_MODE = os.getenv("AUTH_REVOCATION_MODE", "bloom")  # "full": consulta la tabla en cada petición
+
+    # Máximo de tokens por llamada a /introspect/batch
+    AUTH_INTROSPECT_MAX_TOKENS = int(os.getenv("AUTH_INTROSPECT_MAX_TOKENS", 100))
+
+    # Rate limiting de /login y /register antes de parsear o hashear (429 + Retry-After)
+    # Tabla mmap compartida por los workers del host; sin fichero, una tabla por worker
+    # (ruta relativa a app.instance_path, no al directorio de trabajo)
+    AUTH_RATE_LIMIT_ENABLED = os.getenv("AUTH_RATE_LIMIT_ENABLED", "true").lower() == "true"
+    AUTH_RATE_LIMIT_FILE = os.getenv("AUTH_RATE_LIMIT_FILE", "auth_rate_limits.bin") or None
+    AUTH_RATE_LIMIT_SLOTS = int(os.getenv("AUTH_RATE_LIMIT_SLOTS", 65536))  # claves simultáneas (16 bytes cada una)
+    AUTH_RATE_LIMIT_PER_IP = os.getenv("AUTH_RATE_LIMIT_PER_IP", "30/minute")  # "off" desactiva
+    AUTH_RATE_LIMIT_PER_EMAIL = os.getenv("AUTH_RATE_LIMIT_PER_EMAIL", "10/minute")
+    AUTH_RATE_LIMIT_GLOBAL = os.getenv("AUTH_RATE_LIMIT_GLOBAL", "100/second")  # por host
+    AUTH_RATE_LIMIT_PROXY_HOPS = int(os.getenv("AUTH_RATE_LIMIT_PROXY_HOPS", 0))  # proxies propios (X-Forwarded-For)
+
+    # Control de admisión por worker: concurrencia máxima por clase de endpoint; el
+    # límite real se adapta (AIMD) a la latencia objetivo y el exceso recibe 503 + Retry-After
+    AUTH_ADMISSION_ENABLED = os.getenv("AUTH_ADMISSION_ENABLED", "true").lower() == "true"
+    AUTH_ADMISSION_CREDENTIALS_MAX = int(os.getenv("AUTH_ADMISSION_CREDENTIALS_MAX", 32))  # /login, /register
+    AUTH_ADMISSION_CREDENTIALS_TARGET_MS = float(os.getenv("AUTH_ADMISSION_CREDENTIALS_TARGET_MS", 500))
+    AUTH_ADMISSION_TOKENS_MAX = int(os.getenv("AUTH_ADMISSION_TOKENS_MAX", 128))  # /logout, /verify, /introspect
+    AUTH_ADMISSION_TOKENS_TARGET_MS = float(os.getenv("AUTH_ADMISSION_TOKENS_TARGET_MS", 100))
+    AUTH_ADMISSION_ADMIN_MAX = int(os.getenv("AUTH_ADMISSION_ADMIN_MAX", 2))  # importaciones simultáneas
+
+    # Bloqueo por intentos fallidos de login
+    AUTH_MAX_FAILED_LOGIN_ATTEMPTS = int(os.getenv("AUTH_MAX_FAILED_LOGIN_ATTEMPTS", 5))
+    AUTH_LOCKOUT_MINUTES = int(os.getenv("AUTH_LOCKOUT_MINUTES", 15))
+
+    # Caché en proceso de usuarios (token_required -> find_by_id)
+    AUTH_USER_CACHE_SIZE = int(os.getenv("AUTH_USER_CACHE_SIZE", 10000))
+    AUTH_USER_CACHE_TTL = float(os.getenv("AUTH_USER_CACHE_TTL", 30))  # segundos
+
+    # Administradores: emails verificados con acceso a /admin/* (separados por comas)
+    AUTH_ADMIN_EMAILS = frozenset(
+        email.strip().lower() for email in os.getenv("AUTH_ADMIN_EMAILS", "").split(",") if email.strip()
+    )
+
+    # Importación masiva de usuarios (POST /admin/users/import, desactivada por defecto)
+    AUTH_ADMIN_IMPORT_ENABLED = os.getenv("AUTH_ADMIN_IMPORT_ENABLED", "false").lower() == "true"
+    AUTH_IMPORT_BATCH_SIZE = int(os.getenv("AUTH_IMPORT_BATCH_SIZE", 1000))  # filas por COPY
+    AUTH_IMPORT_HASH_WORKERS = int(os.getenv("AUTH_IMPORT_HASH_WORKERS", 0)) or None  # None = nº de CPUs
     
     # URLs base
     FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
     BASE_URL = os.getenv("BASE_URL", "http://localhost:5000")
 
+    # Pool de conexiones PostgreSQL (uno por proceso/worker)
+    DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", 5))  # pool_size
+    DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", 10))  # pool_size + max_overflow
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))  # segundos de espera por conexión
+    DB_POOL_MAX_AGE = int(os.getenv("DB_POOL_MAX_AGE", 1800))  # pool_recycle, 30 minutos
+    DB_POOL_HEALTH_CHECK = os.getenv("DB_POOL_HEALTH_CHECK", "true").lower() == "true"  # pool_pre_ping
+
+    # Réplicas de lectura (URLs separadas por comas)
+    DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+    DB_REPLICA_EJECT_SECONDS = float(os.getenv("DB_REPLICA_EJECT_SECONDS", 30))  # tiempo fuera de rotación tras un fallo
+    DB_READ_YOUR_WRITES_WINDOW = float(os.getenv("DB_READ_YOUR_WRITES_WINDOW", 5))  # segundos leyendo del primario tras escribir
+
 class LocalConfig(Config):
     """Configuración para entorno local"""
     DEBUG = True
@@ -65,16 +149,21 @@ class ProductionConfig(Config):
     
     # Base de datos PostgreSQL de producción (debe venir de variable de entorno)
     DATABASE_URL = os.getenv("DATABASE_URL")
+
+    # Workers que escalan en caliente: arranque diferido por defecto
+    LAZY_STARTUP = os.getenv("LAZY_STARTUP", "true").lower() == "true"
     
-    # Validar que existan las variables críticas en producción
-    if not DATABASE_URL:
-        raise ValueError("DATABASE_URL es requerida en producción")
-    
-    if not os.getenv("JWT_KEY"):
-        raise ValueError("JWT_KEY es requerida en producción")
-    
-    if not os.getenv("SECRET_KEY"):
-        raise ValueError("SECRET_KEY es requerida en producción")
+    @classmethod
+    def validate(cls):
+        """Validar que existan las variables críticas en producción"""
+        if not cls.DATABASE_URL:
+            raise ValueError("DATABASE_URL es requerida en producción")
+        
+        if not os.getenv("JWT_KEY") and os.getenv("ALGORITHM", "HS256").startswith("HS"):
+            raise ValueError("JWT_KEY es requerida en producción")
+        
+        if not os.getenv("SECRET_KEY"):
+            raise ValueError("SECRET_KEY es requerida en producción")
 
 class TestingConfig(Config):
     """Configuración para pruebas"""
@@ -99,4 +188,6 @@ config = {
 def get_config():
     """Obtiene la configuración basada en la variable de entorno FLASK_ENV"""
     env = os.getenv('FLASK_ENV', 'local')
-    return config.get(env, config['default'])
\ No newline at end of file
+    config_class = config.get(env, config['default'])
+    config_class.validate()
+    return config_class
\ No newline at end of file
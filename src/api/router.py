@@ -1,6 +1,25 @@
 # src/api/router.py
+import importlib
+import sys
 from flask import Flask
-from typing import List, Dict, Optional, Callable
+from typing import Any, List, Dict, Optional, Callable
+from src.core.startup import cli_enabled
+
+# Manifiesto de features ("módulo:atributo"): se importa solo el módulo del
+# blueprint y los comandos CLI solo cuando hacen falta. `wire` es el paquete
+# cuyos módulos ya cargados se conectan al contenedor de dependencias
+FEATURE_MANIFEST: Dict[str, Dict[str, Any]] = {
+    'auth': {
+        'blueprint': 'src.features.auth.presentation.api.v1.endpoints:auth_bp',
+        'cli': 'src.features.auth.presentation.cli:auth_cli',
+        'wire': 'src.features.auth.presentation',
+    },
+}
+
+def resolve(reference: str) -> Any:
+    """Importar un objeto a partir de una referencia `paquete.modulo:atributo`"""
+    module_name, _, attribute = reference.partition(':')
+    return getattr(importlib.import_module(module_name), attribute)
 
 class FeatureRouter:
     """Router que registra todas las features"""
@@ -14,6 +33,9 @@ class FeatureRouter:
         if not enabled:
             return False
         
+        if feature_name in FEATURE_MANIFEST:
+            return self._register_from_manifest(feature_name, FEATURE_MANIFEST[feature_name])
+        
         try:
             # Importar la feature
             module = __import__(
@@ -31,14 +53,20 @@ class FeatureRouter:
             
             blueprint = None
             for bp_name in blueprint_names:
-                if hasattr(module, bp_name):
+                if getattr(module, bp_name, None) is not None:
                     blueprint = getattr(module, bp_name)
                     break
             
+            # Registrar comandos CLI de la feature si los expone
+            cli_group = getattr(module, f'{feature_name}_cli', None) if cli_enabled(self.app) else None
+            if cli_group is not None:
+                self.app.cli.add_command(cli_group)
+            
             if blueprint:
                 self.app.register_blueprint(blueprint)
+                self._wire(f"src.features.{feature_name}.presentation")
                 self.registered_features.append(feature_name)
-                print(f"✅ Feature '{feature_name}' registrada")
+                self._report(f"✅ Feature '{feature_name}' registrada")
                 return True
             else:
                 print(f"⚠️  Feature '{feature_name}' no tiene blueprint")
@@ -48,6 +76,39 @@ class FeatureRouter:
             print(f"❌ Feature '{feature_name}' no encontrada: {e}")
             return False
     
+    def _register_from_manifest(self, feature_name: str, manifest: Dict[str, Any]) -> bool:
+        """Registrar una feature declarada en FEATURE_MANIFEST"""
+        try:
+            blueprint = resolve(manifest['blueprint'])
+            if manifest.get('cli') and cli_enabled(self.app):
+                self.app.cli.add_command(resolve(manifest['cli']))
+        except (ImportError, AttributeError) as e:
+            print(f"❌ Feature '{feature_name}' no encontrada: {e}")
+            return False
+        
+        self.app.register_blueprint(blueprint)
+        self._wire(manifest.get('wire'))
+        self.registered_features.append(feature_name)
+        self._report(f"✅ Feature '{feature_name}' registrada")
+        return True
+    
+    def _wire(self, package: Optional[str]) -> None:
+        """Conectar al contenedor los módulos ya importados del paquete (Provide[...])"""
+        container = getattr(self.app, 'container', None)
+        if container is None or not package:
+            return
+        modules = [
+            module for name, module in list(sys.modules.items())
+            if module is not None and (name == package or name.startswith(package + '.'))
+        ]
+        container.wire(modules=modules)
+    
+    def _report(self, message: str) -> None:
+        if self.app.config.get('LAZY_STARTUP'):
+            self.app.logger.info(message)
+        else:
+            print(message)
+    
     def register_many(self, features_config: Dict[str, bool]) -> List[str]:
         """Registrar múltiples features"""
         successful = []
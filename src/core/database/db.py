@@ -1,61 +1,148 @@
 import os
 from flask import g, current_app
-import psycopg2
 from urllib.parse import quote_plus
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.orm import declarative_base, sessionmaker, scoped_session, Session
-from flask_migrate import Migrate
+from sqlalchemy import create_engine
+from src.core.database.routing import ReplicaSet, RoutingSession
+from src.core.startup import cli_enabled
 
-# Instancia global de SQLAlchemy para migraciones
-db = SQLAlchemy()
-migrate = Migrate()
-Base = declarative_base()
+# Instancia global de SQLAlchemy: un único engine (y pool) por proceso
+# compartido por los repositorios, get_db() y las migraciones.
+# RoutingSession envía las lecturas marcadas como read-only a las réplicas
+db = SQLAlchemy(session_options={"class_": RoutingSession})
+Base = db.Model
+
+def _normalize_database_url(database_url: str) -> str:
+    """Normalizar la URL de PostgreSQL (esquema y SSL)"""
+    if database_url.startswith("postgres://"):
+        database_url = database_url.replace("postgres://", "postgresql://", 1)
+
+    # Agregar SSL si es necesario
+    sslmode_require = os.getenv('SSL_MODE', '') == 'require'
+    if sslmode_require and 'sslmode=' not in database_url:
+        separator = '?' if '?' not in database_url else '&'
+        database_url += f"{separator}sslmode=require"
+
+    return database_url
+
+def _is_sqlite(database_url: str) -> bool:
+    return database_url.startswith('sqlite')
+
+def _engine_options(config, database_url: str = '') -> dict:
+    """Opciones del QueuePool a partir de la configuración"""
+    if _is_sqlite(database_url):
+        # SQLite (solo tests/desarrollo): dejar los valores por defecto
+        return {}
+
+    pool_size = config.get('DB_POOL_MIN_SIZE', 5)
+    max_size = max(config.get('DB_POOL_MAX_SIZE', 10), pool_size)
+
+    return {
+        'pool_size': pool_size,
+        'max_overflow': max_size - pool_size,
+        'pool_timeout': config.get('DB_POOL_TIMEOUT', 30),
+        'pool_recycle': config.get('DB_POOL_MAX_AGE', 1800),
+        'pool_pre_ping': config.get('DB_POOL_HEALTH_CHECK', True),
+    }
+
+def _init_replicas(app) -> ReplicaSet:
+    """Crear los engines de las réplicas de lectura (DATABASE_REPLICA_URLS)"""
+    engines = []
+    for replica_url in app.config.get('DATABASE_REPLICA_URLS') or []:
+        replica_url = _normalize_database_url(replica_url)
+        engines.append(create_engine(replica_url, **_engine_options(app.config, replica_url)))
+
+    return ReplicaSet(engines, eject_seconds=app.config.get('DB_REPLICA_EJECT_SECONDS', 30.0))
+
+def get_replica_stats() -> dict:
+    """Estadísticas del enrutamiento a réplicas"""
+    replicas = current_app.extensions.get('db_replicas')
+    return replicas.stats() if replicas else {}
+
+def get_pool_stats() -> dict:
+    """Estadísticas del pool de conexiones del proceso actual"""
+    pool = db.engine.pool
+    if not hasattr(pool, 'checkedout'):
+        return {"status": pool.status()}
+
+    return {
+        "pid": os.getpid(),
+        "size": pool.size(),
+        "idle": pool.checkedin(),
+        "in_use": pool.checkedout(),
+        "overflow": pool.overflow(),
+        # max_overflow configurado (el pool no lo expone públicamente)
+        "max_size": pool.size() + current_app.config['SQLALCHEMY_ENGINE_OPTIONS'].get('max_overflow', 10),
+        "timeout": pool.timeout(),
+        "status": pool.status(),
+    }
 
 def get_db():
+    """Conexión DBAPI (psycopg2) tomada del pool del engine de SQLAlchemy"""
     if 'db' not in g:
-        database_url = current_app.config.get('DATABASE_URL')
-        
-        if not database_url:
-            raise ValueError("DATABASE_URL no está configurada")
-        
-        # Detectar tipo de base de datos
-        if database_url.startswith('postgresql') or database_url.startswith('postgres'):
-            # Configuración para PostgreSQL
-            if database_url.startswith("postgres://"):
-                database_url = database_url.replace("postgres://", "postgresql://", 1)
-            
-            # Agregar SSL si es necesario
-            sslmode_require = os.getenv('SSL_MODE', '') == 'require'
-            if sslmode_require and 'sslmode=' not in database_url:
-                separator = '?' if '?' not in database_url else '&'
-                database_url += f"{separator}sslmode=require"
-            
-            g.db = psycopg2.connect(database_url)
-            g.db_type = 'postgresql'
-        else:
-            raise ValueError(f"Tipo de base de datos no soportado: {database_url}")
+        g.db = db.engine.raw_connection()
+        g.db_type = db.engine.dialect.name
     
     return g.db
 
 def close_db(e=None):
-    db = g.pop('db', None)
-    if db is not None:
-        db.close()
+    db_connection = g.pop('db', None)
+    if db_connection is not None:
+        if e is not None and _is_operational_error(e):
+            # Conexión posiblemente rota: no devolverla al pool
+            db_connection.invalidate()
+        else:
+            # Devuelve la conexión al pool en lugar de cerrarla
+            db_connection.close()
+
+def _is_operational_error(e) -> bool:
+    # psycopg2 solo se importa si el request terminó con una excepción
+    import psycopg2
+    return isinstance(e, psycopg2.OperationalError)
+
+def _init_migrate(app) -> None:
+    """Flask-Migrate (y alembic) solo para `flask db ...`"""
+    from flask_migrate import Migrate
+    Migrate(app, db)
 
 def init_app(app):
     """Inicializa la base de datos con la aplicación Flask"""
     
-    # Configurar SQLAlchemy para migraciones
-    app.config['SQLALCHEMY_DATABASE_URI'] = app.config.get('DATABASE_URL')
+    database_url = app.config.get('DATABASE_URL')
+
+    if not database_url:
+        raise ValueError("DATABASE_URL no está configurada")
+
+    # Detectar tipo de base de datos (SQLite solo para tests)
+    if not (database_url.startswith('postgresql') or database_url.startswith('postgres') or _is_sqlite(database_url)):
+        raise ValueError(f"Tipo de base de datos no soportado: {database_url}")
+
+    # Configurar SQLAlchemy (engine único con QueuePool)
+    database_url = _normalize_database_url(database_url)
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_url
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', _engine_options(app.config, database_url))
     
-    # Inicializar SQLAlchemy y Flask-Migrate
+    # Inicializar SQLAlchemy y Flask-Migrate.
+    # db.session es una sesión por request: Flask-SQLAlchemy la elimina en el
+    # teardown del app context y devuelve su conexión al pool
     db.init_app(app)
-    migrate.init_app(app, db)
+    if cli_enabled(app):
+        _init_migrate(app)
+
+    # Réplicas de lectura (opcionales)
+    app.extensions['db_replicas'] = _init_replicas(app)
     
-    # Mantener el sistema actual para compatibilidad
+    # Mantener get_db() para compatibilidad (usa el mismo pool)
     app.teardown_appcontext(close_db)
 
+    if app.config.get('LAZY_STARTUP'):
+        # Sin conexión ni banners: el engine conecta en la primera consulta,
+        # así un worker arranca aunque la BD no responda en ese momento
+        app.logger.info("Base de datos configurada (conexión diferida al primer uso)")
+        return
+
     with app.app_context():
         # Importar modelos para que Flask-Migrate los detecte
         # from src.models.sqlalchemy_models import (
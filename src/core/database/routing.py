@@ -0,0 +1,151 @@
+# src/core/database/routing.py
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Dict, List, Optional
+
+from flask import current_app, has_app_context
+from flask_sqlalchemy.session import Session as FlaskSession
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class ReplicaSet:
+    """Réplicas de lectura con round-robin y expulsión temporal por fallos"""
+
+    def __init__(self, engines: List[Engine], eject_seconds: float = 30.0):
+        self.engines = engines
+        self.eject_seconds = eject_seconds
+        self._cycle = itertools.cycle(range(len(engines))) if engines else None
+        self._ejected_until: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._stats = {"routed": 0, "ejections": 0, "fallbacks": 0}
+
+        for engine in engines:
+            event.listen(engine, "handle_error", self._on_error)
+
+    def choose(self) -> Optional[Engine]:
+        """Siguiente réplica sana o None si no hay ninguna disponible"""
+        if not self.engines:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.engines)):
+                index = next(self._cycle)
+                if self._ejected_until.get(index, 0) <= now:
+                    self._ejected_until.pop(index, None)
+                    self._stats["routed"] += 1
+                    return self.engines[index]
+
+            self._stats["fallbacks"] += 1
+            return None
+
+    def eject(self, engine: Engine) -> None:
+        """Sacar una réplica de la rotación durante `eject_seconds`"""
+        try:
+            index = self.engines.index(engine)
+        except ValueError:
+            return
+
+        with self._lock:
+            self._ejected_until[index] = time.monotonic() + self.eject_seconds
+            self._stats["ejections"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "replicas": len(self.engines),
+                "healthy": sum(
+                    1 for index in range(len(self.engines))
+                    if self._ejected_until.get(index, 0) <= now
+                ),
+                **self._stats,
+            }
+
+    def dispose(self) -> None:
+        for engine in self.engines:
+            engine.dispose()
+
+    def _on_error(self, context) -> None:
+        # Errores de conexión o desconexiones expulsan la réplica; los errores
+        # de SQL (constraints, sintaxis...) no dicen nada de su salud
+        original = context.original_exception
+        is_operational = type(original).__name__ in ("OperationalError", "InterfaceError")
+        if context.is_disconnect or is_operational:
+            self.eject(context.engine)
+
+
+class RoutingSession(FlaskSession):
+    """Sesión que envía las lecturas marcadas como read-only a las réplicas
+
+    Las escrituras (y cualquier lectura no marcada) van al primario. Tras una
+    escritura en la sesión (es decir, en el mismo request), las lecturas se
+    mantienen en el primario durante la ventana read-your-writes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self._use_replica():
+            replicas = _get_replicas()
+            replica = replicas.choose() if replicas else None
+            if replica is not None:
+                return replica
+
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _use_replica(self) -> bool:
+        if self._flushing or not self.info.get("read_only"):
+            return False
+
+        last_write = self.info.get("last_write_at")
+        if last_write is None:
+            return True
+
+        window = current_app.config.get("DB_READ_YOUR_WRITES_WINDOW", 5.0)
+        return time.monotonic() - last_write >= window
+
+
+def _get_replicas() -> Optional[ReplicaSet]:
+    if not has_app_context():
+        return None
+    return current_app.extensions.get("db_replicas")
+
+
+def mark_write(session) -> None:
+    """Registrar una escritura (activa la ventana read-your-writes)"""
+    session.info["last_write_at"] = time.monotonic()
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _after_flush(session, flush_context):
+    mark_write(session)
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _on_orm_execute(orm_execute_state):
+    # UPDATE/DELETE/INSERT masivos no pasan por flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        mark_write(orm_execute_state.session)
+
+
+@contextmanager
+def read_only(session):
+    """Marcar las consultas del bloque como aptas para una réplica"""
+    previous = session.info.get("read_only", False)
+    session.info["read_only"] = True
+    try:
+        yield session
+    finally:
+        session.info["read_only"] = previous
+
+
+def replica_read(method):
+    """Decorator para métodos de repositorio de solo lectura (usa self.db_session)"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with read_only(self.db_session):
+            return method(self, *args, **kwargs)
+    return wrapper
@@ -1,13 +1,30 @@
 # src/core/dependencies/containers.py
+import os
 from dependency_injector import containers, providers
+from src.core.database.db import db
 from src.features.auth.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from src.features.auth.infrastructure.repositories.cached_user_repository import CachedUserRepository, UserCache
+from src.features.auth.infrastructure.repositories.revoked_token_repository_impl import RevokedTokenRepositoryImpl
 from src.features.auth.infrastructure.services.security.password_hasher import PasswordHasher
+from src.features.auth.infrastructure.services.security.parallel_hasher import ParallelPasswordHasher
+from src.features.auth.infrastructure.services.security.hashing_executor import HashingExecutor
+from src.features.auth.infrastructure.services.security.hashing_profile import load_profile
+from src.features.auth.infrastructure.services.security.password_rehasher import PasswordRehasher
 from src.features.auth.infrastructure.services.security.jwt_handler import JWTService
+from src.features.auth.infrastructure.services.security.jwt_codecs import create_codec
+from src.features.auth.infrastructure.services.security.token_cache import create_token_cache
+from src.features.auth.infrastructure.services.security.key_ring import create_key_ring
+from src.features.auth.infrastructure.services.security.token_denylist import TokenDenylist
+from src.features.auth.infrastructure.services.security.token_epochs import TokenEpochMap
+from src.features.auth.infrastructure.services.security.rate_limiter import SharedRateLimiter, RateLimitPolicy
+from src.features.auth.infrastructure.services.admission_controller import create_admission_controller
 from src.features.auth.application.use_cases.login_user import LoginUserUseCase
 from src.features.auth.application.use_cases.register_user import RegisterUserUseCase
+from src.features.auth.application.use_cases.bulk_import_users import BulkImportUsersUseCase
 # from src.features.auth.application.use_cases.refresh_token import RefreshTokenUseCase
-# from src.features.auth.application.use_cases.logout_user import LogoutUserUseCase
-# from src.features.auth.application.use_cases.verify_token import VerifyTokenUseCase
+from src.features.auth.application.use_cases.logout_user import LogoutUserUseCase
+from src.features.auth.application.use_cases.verify_token import VerifyTokenUseCase
+from src.features.auth.application.use_cases.introspect_tokens import IntrospectTokensUseCase
 
 class AuthContainer(containers.DeclarativeContainer):
     """Contenedor para feature auth"""
@@ -16,16 +33,102 @@ class AuthContainer(containers.DeclarativeContainer):
     config = providers.Configuration()
     db_session = providers.Dependency()
     
+    # Caché de usuarios por id (una por proceso)
+    user_cache = providers.Singleton(
+        UserCache,
+        maxsize=config.auth.user_cache_size,
+        ttl=config.auth.user_cache_ttl,
+        primary_window=config.auth.user_cache_primary_window
+    )
+    
     # Repositorios
-    user_repository = providers.Factory(
+    # Sin caché: también lo usa el mapa de épocas de tokens
+    user_repository_impl = providers.Factory(
         UserRepositoryImpl,
         db_session=db_session
     )
     
+    # Época de tokens por usuario (una por proceso)
+    token_epochs = providers.Singleton(
+        TokenEpochMap,
+        repository_factory=user_repository_impl.provider,
+        refresh_interval=config.auth.revocation_refresh_seconds
+    )
+    
+    user_repository = providers.Factory(
+        CachedUserRepository,
+        repository=user_repository_impl,
+        cache=user_cache,
+        token_epochs=token_epochs
+    )
+    
+    revoked_token_repository = providers.Factory(
+        RevokedTokenRepositoryImpl,
+        db_session=db_session
+    )
+    
     # Servicios
+    hashing_profile = providers.Singleton(
+        load_profile,
+        path=config.auth.password_hash_profiles_file,
+        name=config.auth.password_hash_profile
+    )
+    
     password_hasher = providers.Singleton(
         PasswordHasher,
-        algorithm=config.auth.password_algorithm
+        algorithm=config.auth.password_algorithm,
+        profile=hashing_profile
+    )
+    
+    # Pool acotado para hash/verify en requests (dimensionado por memoria)
+    hashing_executor = providers.Singleton(
+        HashingExecutor,
+        memory_budget_mb=config.auth.hashing_memory_budget_mb,
+        memory_per_hash_kib=password_hasher.provided.memory_cost_kib,
+        threads_per_hash=password_hasher.provided.threads_per_hash,
+        max_workers=config.auth.hashing_max_workers,
+        max_queue=config.auth.hashing_max_queue,
+        max_wait=config.auth.hashing_max_wait
+    )
+    
+    # Rehash en segundo plano tras login (repositorio nuevo por tarea)
+    password_rehasher = providers.Singleton(
+        PasswordRehasher,
+        password_hasher=password_hasher,
+        hashing_executor=hashing_executor,
+        repository_factory=user_repository.provider
+    )
+    
+    # Pool de procesos por importación (se cierra al terminar)
+    parallel_hasher = providers.Factory(
+        ParallelPasswordHasher,
+        algorithm=config.auth.password_algorithm,
+        workers=config.auth.import_hash_workers,
+        profile=hashing_profile
+    )
+    
+    # Claves de firma EdDSA/RS256/ES256 (None con HS*)
+    jwt_key_ring = providers.Singleton(
+        create_key_ring,
+        path=config.auth.jwt_keys_file,
+        algorithm=config.auth.jwt_algorithm,
+        publish_ahead=config.auth.jwt_key_publish_ahead,
+        retain=config.auth.jwt_key_retain_seconds
+    )
+    
+    jwt_codec = providers.Singleton(
+        create_codec,
+        backend=config.auth.jwt_codec,
+        key=config.auth.jwt_secret_key,
+        algorithm=config.auth.jwt_algorithm,
+        key_ring=jwt_key_ring
+    )
+    
+    # Payloads verificados por digest del token (None = desactivada)
+    token_cache = providers.Singleton(
+        create_token_cache,
+        maxsize=config.auth.token_cache_size,
+        max_token_bytes=config.auth.token_cache_max_token_bytes
     )
     
     jwt_service = providers.Singleton(
@@ -33,7 +136,48 @@ class AuthContainer(containers.DeclarativeContainer):
         secret_key=config.auth.jwt_secret_key,
         algorithm=config.auth.jwt_algorithm,
         issuer=config.auth.jwt_issuer,
-        audience=config.auth.jwt_audience
+        audience=config.auth.jwt_audience,
+        codec=jwt_codec,
+        token_cache=token_cache
+    )
+    
+    # Revocación por jti: tabla + filtro de Bloom por proceso
+    token_denylist = providers.Singleton(
+        TokenDenylist,
+        repository_factory=revoked_token_repository.provider,
+        capacity=config.auth.revocation_capacity,
+        error_rate=config.auth.revocation_error_rate,
+        refresh_interval=config.auth.revocation_refresh_seconds,
+        rebuild_interval=config.auth.revocation_rebuild_seconds,
+        mode=config.auth.revocation_mode
+    )
+    
+    # Límites de /login y /register: tabla mmap compartida por los workers del host
+    rate_limiter = providers.Singleton(
+        SharedRateLimiter,
+        path=config.auth.rate_limit_file,
+        slots=config.auth.rate_limit_slots
+    )
+    
+    rate_limit_policy = providers.Singleton(
+        RateLimitPolicy,
+        limiter=rate_limiter,
+        per_ip=config.auth.rate_limit_per_ip,
+        per_email=config.auth.rate_limit_per_email,
+        global_limit=config.auth.rate_limit_global,
+        proxy_hops=config.auth.rate_limit_proxy_hops,
+        enabled=config.auth.rate_limit_enabled
+    )
+    
+    # Control de admisión del blueprint: límites de concurrencia adaptativos por worker
+    admission_controller = providers.Singleton(
+        create_admission_controller,
+        enabled=config.auth.admission_enabled,
+        credentials_max=config.auth.admission_credentials_max,
+        credentials_target_ms=config.auth.admission_credentials_target_ms,
+        tokens_max=config.auth.admission_tokens_max,
+        tokens_target_ms=config.auth.admission_tokens_target_ms,
+        admin_max=config.auth.admission_admin_max
     )
     
     # Casos de uso
@@ -41,13 +185,26 @@ class AuthContainer(containers.DeclarativeContainer):
         LoginUserUseCase,
         user_repository=user_repository,
         token_service=jwt_service,
-        password_hasher=password_hasher
+        password_hasher=password_hasher,
+        hashing_executor=hashing_executor,
+        max_failed_attempts=config.auth.max_failed_login_attempts,
+        lockout_minutes=config.auth.lockout_minutes,
+        password_rehasher=password_rehasher
     )
     
     register_use_case = providers.Factory(
         RegisterUserUseCase,
         user_repository=user_repository,
-        password_hasher=password_hasher
+        password_hasher=password_hasher,
+        hashing_executor=hashing_executor
+    )
+    
+    bulk_import_users_use_case = providers.Factory(
+        BulkImportUsersUseCase,
+        user_repository=user_repository,
+        password_hasher=password_hasher,
+        parallel_hasher=parallel_hasher,
+        batch_size=config.auth.import_batch_size
     )
     
     # refresh_token_use_case = providers.Factory(
@@ -56,16 +213,28 @@ class AuthContainer(containers.DeclarativeContainer):
     #     token_service=jwt_service
     # )
     
-    # logout_use_case = providers.Factory(
-    #     LogoutUserUseCase,
-    #     user_repository=user_repository,
-    #     token_service=jwt_service
-    # )
+    logout_use_case = providers.Factory(
+        LogoutUserUseCase,
+        user_repository=user_repository,
+        token_service=jwt_service,
+        token_denylist=token_denylist
+    )
     
-    # verify_token_use_case = providers.Factory(
-    #     VerifyTokenUseCase,
-    #     token_service=jwt_service
-    # )
+    verify_token_use_case = providers.Factory(
+        VerifyTokenUseCase,
+        token_service=jwt_service,
+        token_denylist=token_denylist,
+        token_epochs=token_epochs
+    )
+    
+    introspect_tokens_use_case = providers.Factory(
+        IntrospectTokensUseCase,
+        user_repository=user_repository,
+        token_service=jwt_service,
+        token_denylist=token_denylist,
+        token_epochs=token_epochs,
+        max_tokens=config.auth.introspect_max_tokens
+    )
 
 class MainContainer(containers.DeclarativeContainer):
     """Contenedor principal"""
@@ -73,8 +242,74 @@ class MainContainer(containers.DeclarativeContainer):
     # Configuración
     config = providers.Configuration()
     
-    # Database session (compartida entre features)
-    db_session = providers.Dependency()
+    # Database session (compartida entre features): sesión por request de
+    # Flask-SQLAlchemy sobre el engine único del proceso
+    db_session = providers.Object(db.session)
     
     # Features
-    auth = providers.Container(AuthContainer, db_session=db_session, config=config.auth)
\ No newline at end of file
+    auth = providers.Container(
+        AuthContainer,
+        db_session=db_session,
+        config=config
+    )
+
+def instance_file(app, path):
+    """Ruta relativa de la configuración -> dentro de app.instance_path"""
+    if path and not os.path.isabs(path):
+        return os.path.join(app.instance_path, path)
+    return path
+
+def create_container(app) -> MainContainer:
+    """Crear el contenedor principal a partir de la configuración de Flask"""
+    container = MainContainer()
+    container.config.from_dict({
+        "auth": {
+            "password_algorithm": app.config.get("PASSWORD_ALGORITHM", "argon2"),
+            "jwt_secret_key": app.config.get("JWT_SECRET_KEY"),
+            "jwt_algorithm": app.config.get("JWT_ALGORITHM", "HS256"),
+            "jwt_issuer": app.config.get("JWT_ISSUER"),
+            "jwt_audience": app.config.get("JWT_AUDIENCE"),
+            "jwt_codec": app.config.get("JWT_CODEC", "auto"),
+            "token_cache_size": app.config.get("JWT_VERIFIED_CACHE_SIZE", 10000),
+            "token_cache_max_token_bytes": app.config.get("JWT_VERIFIED_CACHE_MAX_TOKEN_BYTES", 4096),
+            "jwt_keys_file": instance_file(app, app.config.get("JWT_KEYS_FILE", "jwt_keys.json")),
+            "jwt_key_publish_ahead": app.config.get("JWT_KEY_PUBLISH_AHEAD", 600),
+            "jwt_key_retain_seconds": app.config.get("JWT_KEY_RETAIN_SECONDS", 2592000),
+            "revocation_capacity": app.config.get("AUTH_REVOCATION_CAPACITY", 100000),
+            "revocation_error_rate": app.config.get("AUTH_REVOCATION_ERROR_RATE", 0.001),
+            "revocation_refresh_seconds": app.config.get("AUTH_REVOCATION_REFRESH_SECONDS", 2.0),
+            "revocation_rebuild_seconds": app.config.get("AUTH_REVOCATION_REBUILD_SECONDS", 600.0),
+            "revocation_mode": app.config.get("AUTH_REVOCATION_MODE", "bloom"),
+            "introspect_max_tokens": app.config.get("AUTH_INTROSPECT_MAX_TOKENS", 100),
+            "rate_limit_enabled": app.config.get("AUTH_RATE_LIMIT_ENABLED", True),
+            "rate_limit_file": instance_file(app, app.config.get("AUTH_RATE_LIMIT_FILE")),
+            "rate_limit_slots": app.config.get("AUTH_RATE_LIMIT_SLOTS", 65536),
+            "rate_limit_per_ip": app.config.get("AUTH_RATE_LIMIT_PER_IP", "30/minute"),
+            "rate_limit_per_email": app.config.get("AUTH_RATE_LIMIT_PER_EMAIL", "10/minute"),
+            "rate_limit_global": app.config.get("AUTH_RATE_LIMIT_GLOBAL", "100/second"),
+            "rate_limit_proxy_hops": app.config.get("AUTH_RATE_LIMIT_PROXY_HOPS", 0),
+            "admission_enabled": app.config.get("AUTH_ADMISSION_ENABLED", True),
+            "admission_credentials_max": app.config.get("AUTH_ADMISSION_CREDENTIALS_MAX", 32),
+            "admission_credentials_target_ms": app.config.get("AUTH_ADMISSION_CREDENTIALS_TARGET_MS", 500),
+            "admission_tokens_max": app.config.get("AUTH_ADMISSION_TOKENS_MAX", 128),
+            "admission_tokens_target_ms": app.config.get("AUTH_ADMISSION_TOKENS_TARGET_MS", 100),
+            "admission_admin_max": app.config.get("AUTH_ADMISSION_ADMIN_MAX", 2),
+            "max_failed_login_attempts": app.config.get("AUTH_MAX_FAILED_LOGIN_ATTEMPTS", 5),
+            "lockout_minutes": app.config.get("AUTH_LOCKOUT_MINUTES", 15),
+            "password_hash_profile": app.config.get("PASSWORD_HASH_PROFILE"),
+            "password_hash_profiles_file": instance_file(app, app.config.get("PASSWORD_HASH_PROFILES_FILE")),
+            "hashing_memory_budget_mb": app.config.get("PASSWORD_HASH_MEMORY_BUDGET_MB", 1024),
+            "hashing_max_workers": app.config.get("PASSWORD_HASH_MAX_WORKERS"),
+            "hashing_max_queue": app.config.get("PASSWORD_HASH_MAX_QUEUE", 64),
+            "hashing_max_wait": app.config.get("PASSWORD_HASH_MAX_WAIT", 2.0),
+            "user_cache_size": app.config.get("AUTH_USER_CACHE_SIZE", 10000),
+            "user_cache_ttl": app.config.get("AUTH_USER_CACHE_TTL", 30),
+            # Tras invalidar, rellenar desde el primario mientras dure la ventana read-your-writes
+            "user_cache_primary_window": app.config.get("DB_READ_YOUR_WRITES_WINDOW", 5),
+            "import_batch_size": app.config.get("AUTH_IMPORT_BATCH_SIZE", 1000),
+            "import_hash_workers": app.config.get("AUTH_IMPORT_HASH_WORKERS"),
+        }
+    })
+    # El wiring de cada feature lo hace el router al registrarla (solo los
+    # módulos importados según FEATURE_MANIFEST)
+    return container
\ No newline at end of file
@@ -0,0 +1,128 @@
+# src/core/startup.py
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+import click
+from flask import Flask, current_app
+
+# Módulos pesados que un arranque diferido (LAZY_STARTUP) no debería cargar.
+# email_validator no está: los DTOs compilan su validador al importarse para
+# que la primera petición no pague ese coste
+HEAVY_MODULES = (
+    "jose", "cryptography", "argon2", "bcrypt",
+    "psycopg2", "flask_migrate", "alembic",
+)
+
+# Arranque en frío de un worker: importar app y crear la aplicación (sin contexto de click)
+_PROFILE_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+create_app()
+created = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "create_app_ms": (created - imported) * 1000,
+    "loaded": sorted(name for name in %r if name in sys.modules),
+}))
+"""
+
+_environment_loaded = False
+
+def load_environment() -> str:
+    """Cargar .env y .env.<FLASK_ENV> (una vez, al crear la app; no al importar config)"""
+    global _environment_loaded
+    if not _environment_loaded:
+        from dotenv import load_dotenv
+
+        # Cargar el archivo .env principal primero
+        load_dotenv()
+        # Intentar cargar archivo específico del entorno si existe
+        env_file = f".env.{os.getenv('FLASK_ENV', 'local')}"
+        if os.path.exists(env_file):
+            load_dotenv(env_file, override=True)
+        _environment_loaded = True
+    return os.getenv('FLASK_ENV', 'local')
+
+def cli_enabled(app: Flask) -> bool:
+    """Registrar comandos CLI y Flask-Migrate
+
+    Siempre sin LAZY_STARTUP; con LAZY_STARTUP solo si la app se crea desde
+    `flask ...` (un worker de gunicorn no los necesita).
+    """
+    return not app.config.get('LAZY_STARTUP') or click.get_current_context(silent=True) is not None
+
+def parse_importtime(output: str) -> List[Dict[str, Any]]:
+    """Filas de `python -X importtime`: módulo, tiempo propio y acumulado (ms)"""
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # cabecera
+        rows.append({
+            "module": fields[2].strip(),
+            "self_ms": int(fields[0]) / 1000,
+            "cumulative_ms": int(fields[1]) / 1000,
+        })
+    return rows
+
+def profile_startup(root_path: str, lazy: Optional[bool] = None) -> Dict[str, Any]:
+    """Medir un arranque en frío en un proceso nuevo"""
+    env = dict(os.environ)
+    if lazy is not None:
+        env['LAZY_STARTUP'] = 'true' if lazy else 'false'
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROFILE_SCRIPT % (HEAVY_MODULES,)],
+        cwd=root_path, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise click.ClickException("create_app falló:\n" + "\n".join(errors[-20:]))
+
+    summary = json.loads(result.stdout.strip().splitlines()[-1])
+    modules = parse_importtime(result.stderr)
+    summary.update({
+        "lazy_startup": env.get('LAZY_STARTUP'),
+        "modules": modules,
+        "module_count": len(modules),
+        "self_total_ms": sum(row["self_ms"] for row in modules),
+    })
+    return summary
+
+@click.command('startup-profile')
+@click.option('--top', default=25, show_default=True, help='Módulos mostrados')
+@click.option('--sort', 'sort_by', type=click.Choice(['cumulative', 'self']), default='cumulative',
+              show_default=True, help='Ordenar por tiempo acumulado o propio')
+@click.option('--lazy/--eager', default=None, help='Forzar LAZY_STARTUP en la medición')
+@click.option('--json', 'as_json', is_flag=True, help='Salida JSON (para registrar el arranque en frío)')
+def startup_profile(top: int, sort_by: str, lazy: Optional[bool], as_json: bool):
+    """Tiempo de importación por módulo de un arranque en frío (python -X importtime)"""
+    summary = profile_startup(current_app.root_path, lazy)
+    key = f"{sort_by}_ms"
+    slowest = sorted(summary["modules"], key=lambda row: row[key], reverse=True)[:top]
+
+    if as_json:
+        click.echo(json.dumps({**summary, "modules": slowest}, indent=2))
+        return
+
+    click.echo(
+        f"⏱️  Arranque en frío: import {summary['import_ms']:.1f} ms + create_app "
+        f"{summary['create_app_ms']:.1f} ms (LAZY_STARTUP={summary['lazy_startup'] or 'config'})"
+    )
+    click.echo(f"📦 Módulos importados: {summary['module_count']} ({summary['self_total_ms']:.1f} ms propios)")
+    click.echo(f"🐢 Top {len(slowest)} por tiempo {'acumulado' if sort_by == 'cumulative' else 'propio'}:")
+    click.echo(f"   {'acumulado':>10} {'propio':>9}  módulo")
+    for row in slowest:
+        click.echo(f"   {row['cumulative_ms']:>7.1f} ms {row['self_ms']:>6.1f} ms  {row['module']}")
+
+    deferred = [name for name in HEAVY_MODULES if name not in summary["loaded"]]
+    if deferred:
+        click.echo(f"💤 Sin cargar al arrancar: {', '.join(deferred)}")
+    if summary["loaded"]:
+        click.echo(f"⚠️  Cargados al arrancar: {', '.join(summary['loaded'])}")
@@ -2,14 +2,18 @@
 """
 Feature de Autenticación
 """
+import importlib
 
-# Importar blueprint desde endpoints
-try:
-    from .presentation.api.v1.endpoints import auth_bp
-    __all__ = ['auth_bp']
-except ImportError as e:
-    print(f"⚠️  Error importando auth_bp: {e}")
-    auth_bp = None
-    __all__ = []
+# Blueprints y comandos CLI se importan al pedirlos (el router los resuelve
+# desde FEATURE_MANIFEST; importar el paquete no carga las vistas)
+_EXPORTS = {
+    'auth_bp': '.presentation.api.v1.endpoints',
+    'auth_cli': '.presentation.cli',
+}
 
-    
\ No newline at end of file
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,20 @@
-from pydantic import BaseModel, EmailStr, Field, validator
+import re
+from pydantic import AfterValidator, BaseModel, EmailStr, Field, field_validator, model_validator
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Annotated, Optional, Dict, Any, List
+from ...domain.value_objects.email import EMAIL_PATTERN
+
+USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]+$')
+
+def validate_email_format(v: str) -> str:
+    """Regla de formato del value object Email, aplicada al validar el DTO
+    (después se construye con Email.trusted, sin repetirla)"""
+    if not EMAIL_PATTERN.match(v):
+        raise ValueError('Invalid email address')
+    return v
+
+# Email de entrada que acabará en la entidad User
+DomainEmail = Annotated[EmailStr, AfterValidator(validate_email_format)]
 
 class LoginRequestDTO(BaseModel):
     """DTO para request de login"""
@@ -16,24 +30,48 @@ class LoginResponseDTO(BaseModel):
     expires_in: int
     user: Dict[str, Any]
 
+def validate_username(v: str) -> str:
+    """Regla común de username (registro e importación)"""
+    if not USERNAME_PATTERN.match(v):
+        raise ValueError('Username can only contain letters, numbers and underscores')
+    return v
+
+_PASSWORD_RULES = (
+    (re.compile(r'[A-Z]'), 'Must contain uppercase letter'),
+    (re.compile(r'[a-z]'), 'Must contain lowercase letter'),
+    (re.compile(r'[0-9]'), 'Must contain number'),
+    (re.compile(r'[^A-Za-z0-9]'), 'Must contain special character'),
+)
+
+def validate_password_strength(v: str) -> str:
+    """Fortaleza mínima del password de registro"""
+    for pattern, message in _PASSWORD_RULES:
+        if not pattern.search(v):
+            raise ValueError(message)
+    return v
+
 class RegisterRequestDTO(BaseModel):
-    """DTO para request de registro"""
-    email: EmailStr
+    """DTO para request de registro (única validación del cuerpo de /register)"""
+    email: DomainEmail
     username: str = Field(..., min_length=3, max_length=50)
     password: str = Field(..., min_length=8)
     confirm_password: str = Field(..., min_length=8)
     
-    @validator('username')
-    def validate_username(cls, v):
-        if not v.replace('_', '').isalnum():
-            raise ValueError('Username can only contain letters, numbers and underscores')
-        return v
+    @field_validator('username')
+    @classmethod
+    def check_username(cls, v: str) -> str:
+        return validate_username(v)
+    
+    @field_validator('password')
+    @classmethod
+    def check_password_strength(cls, v: str) -> str:
+        return validate_password_strength(v)
     
-    @validator('confirm_password')
-    def passwords_match(cls, v, values):
-        if 'password' in values and v != values['password']:
+    @model_validator(mode='after')
+    def passwords_match(self):
+        if self.password != self.confirm_password:
             raise ValueError('Passwords do not match')
-        return v
+        return self
 
 class RegisterResponseDTO(BaseModel):
     """DTO para response de registro"""
@@ -68,4 +106,54 @@ class VerifyTokenResponseDTO(BaseModel):
     is_valid: bool
     user_id: Optional[str] = None
     email: Optional[str] = None
-    expires_at: Optional[datetime] = None
\ No newline at end of file
+    expires_at: Optional[datetime] = None
+
+class IntrospectBatchRequestDTO(BaseModel):
+    """DTO para request de introspección en lote (gateways)"""
+    tokens: List[str] = Field(..., min_length=1)
+
+class IntrospectResultDTO(BaseModel):
+    """DTO con el resultado de un token (cacheable por el gateway hasta `exp`)"""
+    active: bool
+    user_id: Optional[str] = None
+    email: Optional[str] = None
+    username: Optional[str] = None
+    is_verified: Optional[bool] = None
+    exp: Optional[int] = None
+    error: Optional[str] = None
+
+class IntrospectBatchResponseDTO(BaseModel):
+    """DTO para response de introspección en lote (mismo orden que la request)"""
+    results: List[IntrospectResultDTO]
+
+class ImportUserRowDTO(BaseModel):
+    """DTO para una fila de importación masiva (password en claro o ya hasheado)"""
+    email: DomainEmail
+    username: str = Field(..., min_length=3, max_length=50)
+    password: Optional[str] = Field(default=None, min_length=8)
+    hashed_password: Optional[str] = None
+    is_verified: bool = False
+    
+    @field_validator('username')
+    @classmethod
+    def check_username(cls, v: str) -> str:
+        return validate_username(v)
+    
+    @model_validator(mode='after')
+    def password_or_hash(self):
+        if bool(self.password) == bool(self.hashed_password):
+            raise ValueError('Exactly one of password or hashed_password is required')
+        return self
+
+class ImportRowErrorDTO(BaseModel):
+    """Error de una fila de la importación"""
+    line: int
+    email: Optional[str] = None
+    error: str
+
+class BulkImportReportDTO(BaseModel):
+    """Resultado de la importación masiva"""
+    total: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[ImportRowErrorDTO] = Field(default_factory=list)
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import Optional, List, Tuple, Iterator
+from datetime import datetime
+
+class IRevokedTokenRepository(ABC):
+    """Interface/Port para la denylist persistente de tokens revocados"""
+    
+    @abstractmethod
+    def revoke(self, jti: str, user_id: Optional[str], expires_at: datetime) -> bool:
+        """Revocar un token hasta su expiración (idempotente); True si es nueva"""
+        pass
+    
+    @abstractmethod
+    def is_revoked(self, jti: str) -> bool:
+        """Comprobar si un jti está revocado y aún no ha expirado"""
+        pass
+    
+    @abstractmethod
+    def iter_active(self, batch_size: int = 10000) -> Iterator[Tuple[str, datetime]]:
+        """Recorrer (jti, revoked_at) de las revocaciones no expiradas"""
+        pass
+    
+    @abstractmethod
+    def revoked_since(
+        self, since: datetime, limit: int = 10000, after_jti: Optional[str] = None
+    ) -> List[Tuple[str, datetime]]:
+        """(jti, revoked_at) revocados desde `since`, en orden (revoked_at, jti)
+
+        Con `after_jti`, solo las filas posteriores a (since, after_jti): cursor
+        de paginación que no salta filas con el mismo revoked_at
+        """
+        pass
+    
+    @abstractmethod
+    def prune_expired(self, before: Optional[datetime] = None, batch_size: int = 10000) -> int:
+        """Eliminar revocaciones de tokens ya expirados"""
+        pass
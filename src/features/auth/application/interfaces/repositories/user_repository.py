@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Tuple, Set, Iterator
+from datetime import datetime, timedelta
 from ....domain.entities.user import User
 
 class IUserRepository(ABC):
@@ -11,8 +12,23 @@ class IUserRepository(ABC):
         pass
     
     @abstractmethod
-    def find_by_id(self, user_id: str) -> Optional[User]:
-        """Buscar usuario por ID"""
+    def create(self, user: User) -> User:
+        """Crear usuario nuevo en una sola sentencia (falla si email/username existen)"""
+        pass
+    
+    @abstractmethod
+    def bulk_create(self, users: List[User]) -> Set[str]:
+        """Insertar un lote de usuarios ignorando duplicados; devuelve los ids insertados"""
+        pass
+    
+    @abstractmethod
+    def find_by_id(self, user_id: str, primary: bool = False) -> Optional[User]:
+        """Buscar usuario por ID (primary=True: sin réplicas, p. ej. tras una escritura)"""
+        pass
+    
+    @abstractmethod
+    def find_by_ids(self, user_ids: List[str]) -> Dict[str, User]:
+        """Buscar varios usuarios en una sola consulta (por id; ids inexistentes se omiten)"""
         pass
     
     @abstractmethod
@@ -46,7 +62,65 @@ class IUserRepository(ABC):
         pass
     
     @abstractmethod
-    def add_refresh_token(self, user_id: str, token: str) -> None:
+    def update_password_hash(self, user_id: str, expected_hash: str, new_hash: str) -> bool:
+        """Reemplazar el hash solo si sigue siendo `expected_hash` (compare-and-set)"""
+        pass
+    
+    @abstractmethod
+    def iter_token_epochs(self, batch_size: int = 10000) -> Iterator[Tuple[str, int, datetime]]:
+        """Recorrer (user_id, token_epoch, token_epoch_at) de usuarios con época > 0"""
+        pass
+    
+    @abstractmethod
+    def token_epochs_since(
+        self, since: datetime, limit: int = 10000, after_id: Optional[str] = None
+    ) -> List[Tuple[str, int, datetime]]:
+        """(user_id, token_epoch, token_epoch_at) cambiados desde `since`, en orden (token_epoch_at, id)
+
+        Con `after_id`, solo las filas posteriores a (since, after_id): cursor
+        de paginación que no salta filas con el mismo token_epoch_at
+        """
+        pass
+    
+    @abstractmethod
+    def iter_password_hashes(self, batch_size: int = 10000) -> Iterator[str]:
+        """Recorrer los hashes almacenados en streaming (informes)"""
+        pass
+    
+    @abstractmethod
+    def record_login(
+        self,
+        user_id: str,
+        refresh_token: str,
+        expires_at: Optional[datetime] = None,
+        family_id: Optional[str] = None,
+        device: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Registrar login exitoso (reset de intentos, last_login y refresh token) en una sentencia
+        
+        None si la cuenta está bloqueada (o no existe): no se escribe nada
+        """
+        pass
+    
+    @abstractmethod
+    def register_failed_login(
+        self,
+        user_id: str,
+        max_attempts: int = User.MAX_FAILED_LOGIN_ATTEMPTS,
+        lockout: timedelta = User.LOCKOUT_DURATION
+    ) -> Optional[Tuple[int, Optional[datetime]]]:
+        """Incrementar atómicamente los intentos fallidos; None si la cuenta está bloqueada"""
+        pass
+    
+    @abstractmethod
+    def add_refresh_token(
+        self,
+        user_id: str,
+        token: str,
+        expires_at: Optional[datetime] = None,
+        family_id: Optional[str] = None,
+        device: Optional[str] = None
+    ) -> None:
         """Agregar token de refresh"""
         pass
     
@@ -58,4 +132,19 @@ class IUserRepository(ABC):
     @abstractmethod
     def has_refresh_token(self, user_id: str, token: str) -> bool:
         """Verificar si usuario tiene token de refresh"""
+        pass
+    
+    @abstractmethod
+    def revoke_refresh_token_family(self, family_id: str) -> int:
+        """Revocar todos los tokens de refresh de una familia/dispositivo"""
+        pass
+    
+    @abstractmethod
+    def revoke_all_refresh_tokens(self, user_id: str) -> int:
+        """Revocar todos los tokens de refresh de un usuario"""
+        pass
+    
+    @abstractmethod
+    def prune_expired_refresh_tokens(self, before: Optional[datetime] = None, batch_size: int = 10000) -> int:
+        """Eliminar en bloque los tokens de refresh expirados"""
         pass
\ No newline at end of file
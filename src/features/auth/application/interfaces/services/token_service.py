@@ -20,6 +20,11 @@ class ITokenService(ABC):
         """Verificar y decodificar token"""
         pass
     
+    @abstractmethod
+    def invalidate_token(self, token: str) -> None:
+        """Olvidar cualquier verificación cacheada del token (revocación)"""
+        pass
+    
     @abstractmethod
     def decode_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Decodificar token sin verificar"""
@@ -0,0 +1,67 @@
+from uuid import UUID
+from ...domain.entities.user import User
+from ...domain.value_objects.email import Email
+from ...infrastructure.models.user_model import UserModel
+
+def normalize_email(email) -> str:
+    """Forma canónica (minúsculas) con la que se guarda y se busca el email"""
+    return str(email).strip().lower()
+
+class UserMapper:
+    """Mapper entre la entidad User y el modelo SQLAlchemy"""
+
+    @staticmethod
+    def to_model(user: User) -> UserModel:
+        """Convertir entidad de dominio a modelo"""
+        return UserModel(
+            id=UUID(user.id) if user.id else None,
+            email=normalize_email(user.email),
+            username=user.username,
+            hashed_password=user.hashed_password,
+            is_active=user.is_active,
+            is_verified=user.is_verified,
+            last_login=user.last_login,
+            failed_login_attempts=user.failed_login_attempts,
+            locked_until=user.locked_until,
+            token_epoch=user.token_epoch,
+            token_epoch_at=user.token_epoch_at,
+            created_at=user.created_at,
+            updated_at=user.updated_at
+        )
+
+    @staticmethod
+    def to_entity(user_model: UserModel) -> User:
+        """Convertir modelo a entidad de dominio"""
+        return User(
+            id=str(user_model.id),
+            email=Email.trusted(user_model.email),  # validado al guardarse
+            username=user_model.username,
+            hashed_password=user_model.hashed_password,
+            is_active=user_model.is_active,
+            is_verified=user_model.is_verified,
+            last_login=user_model.last_login,
+            failed_login_attempts=user_model.failed_login_attempts or 0,
+            locked_until=user_model.locked_until,
+            token_epoch=user_model.token_epoch or 0,
+            token_epoch_at=user_model.token_epoch_at,
+            created_at=user_model.created_at,
+            updated_at=user_model.updated_at
+        )
+
+    @staticmethod
+    def update_model(user_model: UserModel, user: User) -> UserModel:
+        """Copiar el estado de la entidad sobre un modelo existente"""
+        user_model.email = normalize_email(user.email)
+        user_model.username = user.username
+        user_model.hashed_password = user.hashed_password
+        user_model.is_active = user.is_active
+        user_model.is_verified = user.is_verified
+        user_model.last_login = user.last_login
+        user_model.failed_login_attempts = user.failed_login_attempts
+        user_model.locked_until = user.locked_until
+        # La época nunca retrocede (una entidad obsoleta no reactiva tokens)
+        if user.token_epoch > (user_model.token_epoch or 0):
+            user_model.token_epoch = user.token_epoch
+            user_model.token_epoch_at = user.token_epoch_at
+        user_model.updated_at = user.updated_at
+        return user_model
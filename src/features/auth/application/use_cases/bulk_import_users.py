@@ -0,0 +1,135 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
+from pydantic import ValidationError
+from ...domain.entities.user import User
+from ...domain.value_objects.email import Email
+from ...domain.exceptions.auth_exceptions import AuthException
+from ...application.dto.auth_dto import ImportUserRowDTO, ImportRowErrorDTO, BulkImportReportDTO
+from ...application.interfaces.repositories.user_repository import IUserRepository
+
+# (número de línea, fila leída, error de lectura)
+ImportRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+class BulkImportUsersUseCase:
+    """Caso de uso: Importación masiva de usuarios
+
+    Valida cada fila, hashea los passwords en claro en paralelo (lote a
+    lote) y escribe cada lote con una única operación del repositorio.
+    Las filas inválidas o duplicadas quedan en el reporte sin abortar la
+    importación.
+    """
+
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        password_hasher: Any,
+        parallel_hasher: Any,
+        batch_size: int = 1000
+    ):
+        self.user_repository = user_repository
+        self.password_hasher = password_hasher
+        self.parallel_hasher = parallel_hasher
+        self.batch_size = batch_size
+
+    def execute(self, rows: Iterable[ImportRow]) -> BulkImportReportDTO:
+        """
+        Ejecutar la importación
+
+        Args:
+            rows: Filas (línea, datos, error de lectura) en streaming
+
+        Returns:
+            BulkImportReportDTO: Totales y errores por fila
+        """
+        report = BulkImportReportDTO()
+        batch: List[Tuple[int, ImportUserRowDTO]] = []
+
+        with self.parallel_hasher as hasher:
+            for line, data, read_error in rows:
+                report.total += 1
+                row = self._validate(line, data, read_error, report)
+                if row is None:
+                    continue
+
+                batch.append((line, row))
+                if len(batch) >= self.batch_size:
+                    self._import_batch(batch, hasher, report)
+                    batch = []
+
+            if batch:
+                self._import_batch(batch, hasher, report)
+
+        return report
+
+    def _validate(
+        self,
+        line: int,
+        data: Optional[Dict[str, Any]],
+        read_error: Optional[str],
+        report: BulkImportReportDTO
+    ) -> Optional[ImportUserRowDTO]:
+        if read_error:
+            _fail(report, line, None, read_error)
+            return None
+
+        try:
+            row = ImportUserRowDTO.model_validate(data)
+        except ValidationError as e:
+            _fail(report, line, data.get('email'), _validation_message(e))
+            return None
+
+        if row.hashed_password and not self.password_hasher.is_supported_hash(row.hashed_password):
+            _fail(report, line, row.email, "Unsupported password hash format")
+            return None
+
+        return row
+
+    def _import_batch(
+        self,
+        batch: List[Tuple[int, ImportUserRowDTO]],
+        hasher: Any,
+        report: BulkImportReportDTO
+    ) -> None:
+        # 1. Hash de los passwords en claro del lote (en paralelo)
+        hashes = iter(hasher.hash_many([row.password for _, row in batch if row.password]))
+
+        # 2. Crear entidades (id generado aquí para casar el resultado con la fila)
+        users: List[Tuple[int, User]] = []
+        for line, row in batch:
+            hashed_password = row.hashed_password or next(hashes)
+            try:
+                user = User(
+                    id=str(uuid4()),
+                    email=Email.trusted(row.email),
+                    username=row.username,
+                    hashed_password=hashed_password,
+                    is_verified=row.is_verified
+                )
+            except AuthException as e:
+                _fail(report, line, row.email, str(e))
+                continue
+            users.append((line, user))
+
+        # 3. Escribir el lote; los que no vuelven ya existían
+        try:
+            inserted = self.user_repository.bulk_create([user for _, user in users])
+        except Exception as e:
+            for line, user in users:
+                _fail(report, line, str(user.email), str(e))
+            return
+
+        for line, user in users:
+            if user.id in inserted:
+                report.imported += 1
+            else:
+                _fail(report, line, str(user.email), "Email or username already exists")
+
+def _fail(report: BulkImportReportDTO, line: int, email: Optional[str], error: str) -> None:
+    report.failed += 1
+    report.errors.append(ImportRowErrorDTO(line=line, email=email, error=error))
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}"
+        for item in error.errors()
+    )
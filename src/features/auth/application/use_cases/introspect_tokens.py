@@ -0,0 +1,77 @@
+from typing import Tuple, Optional, Dict, Any
+from ...application.dto.auth_dto import (
+    IntrospectBatchRequestDTO, IntrospectBatchResponseDTO, IntrospectResultDTO
+)
+from ...application.interfaces.repositories.user_repository import IUserRepository
+from ...application.interfaces.services.token_service import ITokenService
+
+class IntrospectTokensUseCase:
+    """Caso de uso: Introspección de varios access tokens en una llamada
+    
+    Cada token se verifica en memoria (firma, claims, denylist) y los
+    usuarios de todos los tokens válidos se cargan en una sola consulta.
+    """
+    
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        token_service: ITokenService,
+        token_denylist: Any,  # TokenDenylist implementación
+        token_epochs: Any,  # TokenEpochMap implementación
+        max_tokens: int = 100
+    ):
+        self.user_repository = user_repository
+        self.token_service = token_service
+        self.token_denylist = token_denylist
+        self.token_epochs = token_epochs
+        self.max_tokens = max_tokens
+    
+    def execute(self, request: IntrospectBatchRequestDTO) -> Tuple[Optional[IntrospectBatchResponseDTO], Optional[str]]:
+        """
+        Ejecutar introspección en lote
+        
+        Returns:
+            Tuple[Optional[IntrospectBatchResponseDTO], Optional[str]]: (response, error_message)
+        """
+        if len(request.tokens) > self.max_tokens:
+            return None, f"At most {self.max_tokens} tokens per batch"
+        
+        # 1. Verificar cada token distinto (sin I/O en el caso común)
+        payloads: Dict[str, Optional[Dict[str, Any]]] = {}
+        errors: Dict[str, str] = {}
+        for token in dict.fromkeys(request.tokens):
+            payload = self.token_service.verify_token(token)
+            if not payload or payload.get("type") != "access" or not payload.get("sub"):
+                errors[token] = "Invalid or expired token"
+            elif (payload.get("jti") and self.token_denylist.is_revoked(payload["jti"])) \
+                    or not self.token_epochs.is_current(payload):
+                errors[token] = "Token has been revoked"
+            else:
+                payloads[token] = payload
+        
+        # 2. Usuarios de todos los tokens válidos en un solo WHERE id IN (...)
+        users = self.user_repository.find_by_ids([payload["sub"] for payload in payloads.values()])
+        
+        # 3. Resultado por token, en el orden de la request
+        results = {}
+        for token in dict.fromkeys(request.tokens):
+            if token in errors:
+                results[token] = IntrospectResultDTO(active=False, error=errors[token])
+                continue
+            
+            payload = payloads[token]
+            user = users.get(payload["sub"])
+            if not user or not user.is_active:
+                results[token] = IntrospectResultDTO(active=False, error="User not found or inactive")
+                continue
+            
+            results[token] = IntrospectResultDTO(
+                active=True,
+                user_id=user.id,
+                email=str(user.email),
+                username=user.username,
+                is_verified=user.is_verified,
+                exp=payload.get("exp")
+            )
+        
+        return IntrospectBatchResponseDTO(results=[results[token] for token in request.tokens]), None
@@ -1,12 +1,16 @@
+import uuid
+from concurrent.futures import Executor
 from typing import Tuple, Optional, Dict, Any
 from datetime import datetime, timedelta
+from ...domain.entities.user import User
 from ...application.dto.auth_dto import LoginRequestDTO, LoginResponseDTO
 from ...application.interfaces.repositories.user_repository import IUserRepository
 from ...application.interfaces.services.token_service import ITokenService
 from ...domain.exceptions.auth_exceptions import (
     InvalidCredentialsException,
     AccountLockedException,
-    UserNotFoundException
+    UserNotFoundException,
+    HashingOverloadedException
 )
 
 class LoginUserUseCase:
@@ -16,11 +20,19 @@ class LoginUserUseCase:
         self,
         user_repository: IUserRepository,
         token_service: ITokenService,
-        password_hasher: Any  # PasswordHasher implementación
+        password_hasher: Any,  # PasswordHasher implementación
+        hashing_executor: Executor,  # Pool acotado de hashing (backpressure)
+        max_failed_attempts: int = User.MAX_FAILED_LOGIN_ATTEMPTS,
+        lockout_minutes: int = 15,
+        password_rehasher: Optional[Any] = None  # PasswordRehasher implementación
     ):
         self.user_repository = user_repository
         self.token_service = token_service
         self.password_hasher = password_hasher
+        self.hashing_executor = hashing_executor
+        self.max_failed_attempts = max_failed_attempts
+        self.lockout_duration = timedelta(minutes=lockout_minutes)
+        self.password_rehasher = password_rehasher
     
     def execute(self, request: LoginRequestDTO) -> Tuple[Optional[LoginResponseDTO], Optional[str]]:
         """
@@ -35,26 +47,29 @@ class LoginUserUseCase:
             if not user:
                 raise UserNotFoundException()
             
-            # 2. Verificar si la cuenta está bloqueada
+            # 2. Atajo si la lectura ya ve el bloqueo (puede venir de una réplica
+            # con retraso: el UPDATE del paso 5 es quien lo hace cumplir)
             if user.is_locked():
                 raise AccountLockedException()
             
-            # 3. Verificar password
-            if not self.password_hasher.verify(request.password, user.hashed_password):
-                user.login_failed()
-                self.user_repository.save(user)
+            # 3. Verificar password en el pool de hashing
+            is_valid = self.hashing_executor.run(
+                self.password_hasher.verify, request.password, user.hashed_password
+            )
+            if not is_valid:
+                # Incremento atómico con ventana de bloqueo (sin reescribir el usuario)
+                self.user_repository.register_failed_login(
+                    user.id, self.max_failed_attempts, self.lockout_duration
+                )
                 raise InvalidCredentialsException()
             
-            # 4. Login exitoso
-            user.login_successful()
-            self.user_repository.save(user)
-            
-            # 5. Generar tokens
+            # 4. Generar tokens
             token_data = {
                 "sub": user.id,
                 "email": str(user.email),
                 "username": user.username,
-                "is_verified": user.is_verified
+                "is_verified": user.is_verified,
+                "epc": user.token_epoch
             }
             
             access_token = self.token_service.create_access_token(
@@ -62,13 +77,28 @@ class LoginUserUseCase:
                 expires_in=86400 if request.remember_me else 900  # 24h o 15min
             )
             
+            refresh_expires_in = 2592000 if request.remember_me else 604800  # 30d o 7d
             refresh_token = self.token_service.create_refresh_token(
                 {"sub": user.id},
-                expires_in=2592000 if request.remember_me else 604800  # 30d o 7d
+                expires_in=refresh_expires_in
             )
             
-            # 6. Guardar refresh token
-            self.user_repository.add_refresh_token(user.id, refresh_token)
+            # 5. Login exitoso: reset de intentos, last_login y refresh token
+            # (nueva familia por login) en una sola sentencia y un commit. Sin
+            # fila, la cuenta se bloqueó entre la lectura y aquí: no hay tokens
+            login = self.user_repository.record_login(
+                user.id,
+                refresh_token,
+                expires_at=datetime.utcnow() + timedelta(seconds=refresh_expires_in),
+                family_id=str(uuid.uuid4())
+            )
+            if not login:
+                raise AccountLockedException()
+            
+            # 6. Migrar hashes con algoritmo/costes antiguos (en segundo plano; el
+            # login ya está confirmado y PasswordRehasher no propaga errores)
+            if self.password_rehasher and self.password_rehasher.needs_rehash(user.hashed_password):
+                self.password_rehasher.schedule(user.id, request.password, user.hashed_password)
             
             # 7. Crear respuesta
             response = LoginResponseDTO(
@@ -76,17 +106,14 @@ class LoginUserUseCase:
                 refresh_token=refresh_token,
                 token_type="bearer",
                 expires_in=86400 if request.remember_me else 900,
-                user={
-                    "id": user.id,
-                    "email": str(user.email),
-                    "username": user.username,
-                    "is_verified": user.is_verified,
-                    "is_active": user.is_active
-                }
+                user=login
             )
             
             return response, None
             
+        except HashingOverloadedException:
+            # Sin capacidad de hashing: la vista responde 503 + Retry-After
+            raise
         except Exception as e:
             # Manejar excepciones específicas
             error_message = str(e)
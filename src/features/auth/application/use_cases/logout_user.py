@@ -0,0 +1,44 @@
+from typing import Tuple, Optional, Any
+from datetime import datetime
+from ...application.dto.auth_dto import LogoutRequestDTO
+from ...application.interfaces.repositories.user_repository import IUserRepository
+from ...application.interfaces.services.token_service import ITokenService
+
+class LogoutUserUseCase:
+    """Caso de uso: Logout de usuario (revoca el access token por jti)"""
+    
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        token_service: ITokenService,
+        token_denylist: Any  # TokenDenylist implementación
+    ):
+        self.user_repository = user_repository
+        self.token_service = token_service
+        self.token_denylist = token_denylist
+    
+    def execute(self, request: LogoutRequestDTO, access_token: str) -> Tuple[bool, Optional[str]]:
+        """
+        Ejecutar logout
+        
+        Returns:
+            Tuple[bool, Optional[str]]: (success, error_message)
+        """
+        # 1. El access token debe ser válido (la vista ya lo verificó)
+        payload = self.token_service.verify_token(access_token)
+        if not payload or payload.get("type") != "access":
+            return False, "Invalid or expired token"
+        
+        user_id = payload.get("sub")
+        
+        # 2. Revocar hasta su expiración (tokens anteriores sin jti caducan solos)
+        jti = payload.get("jti")
+        if jti:
+            self.token_denylist.revoke(jti, user_id, datetime.utcfromtimestamp(payload["exp"]))
+        self.token_service.invalidate_token(access_token)
+        
+        # 3. Cerrar también la sesión de refresh si se envía
+        if request.refresh_token:
+            self.user_repository.remove_refresh_token(user_id, request.refresh_token)
+        
+        return True, None
@@ -1,10 +1,11 @@
+from concurrent.futures import Executor
 from typing import Tuple, Optional, Dict, Any
 from datetime import datetime
 from ...domain.entities.user import User
 from ...domain.value_objects.email import Email
+from ...domain.exceptions.auth_exceptions import HashingOverloadedException
 from ...application.dto.auth_dto import RegisterRequestDTO, RegisterResponseDTO
 from ...application.interfaces.repositories.user_repository import IUserRepository
-from ...domain.exceptions.auth_exceptions import EmailAlreadyExistsException
 
 class RegisterUserUseCase:
     """Caso de uso: Registrar usuario"""
@@ -13,10 +14,12 @@ class RegisterUserUseCase:
         self,
         user_repository: IUserRepository,
         password_hasher: Any,
+        hashing_executor: Executor,  # Pool acotado de hashing (backpressure)
         event_publisher: Optional[Any] = None
     ):
         self.user_repository = user_repository
         self.password_hasher = password_hasher
+        self.hashing_executor = hashing_executor
         self.event_publisher = event_publisher
     
     def execute(self, request: RegisterRequestDTO) -> Tuple[Optional[RegisterResponseDTO], Optional[str]]:
@@ -27,34 +30,29 @@ class RegisterUserUseCase:
             Tuple[Optional[RegisterResponseDTO], Optional[str]]: (response, error_message)
         """
         try:
-            # 1. Verificar si email ya existe
-            if self.user_repository.exists_by_email(request.email):
-                raise EmailAlreadyExistsException()
-            
-            # 2. Verificar si username ya existe
-            if self.user_repository.exists_by_username(request.username):
-                return None, "Username already exists"
-            
-            # 3. Hash password
-            hashed_password = self.password_hasher.hash(request.password)
+            # 1. Hash password en el pool de hashing
+            hashed_password, _ = self.hashing_executor.run(
+                self.password_hasher.hash, request.password
+            )
             
-            # 4. Crear entidad de dominio
+            # 2. Crear entidad de dominio (el DTO ya validó el formato del email)
             user = User(
-                email=Email(request.email),
+                email=Email.trusted(request.email),
                 username=request.username,
                 hashed_password=hashed_password
             )
             
-            # 5. Guardar usuario
-            saved_user = self.user_repository.save(user)
+            # 3. Guardar usuario: un único INSERT; las constraints únicas
+            # detectan email/username duplicados sin consultas previas
+            saved_user = self.user_repository.create(user)
             
-            # 6. Publicar evento si hay publisher
+            # 4. Publicar evento si hay publisher
             if self.event_publisher:
                 events = saved_user.pull_events()
                 for event in events:
                     self.event_publisher.publish(event)
             
-            # 7. Crear respuesta
+            # 5. Crear respuesta
             response = RegisterResponseDTO(
                 id=saved_user.id,
                 email=str(saved_user.email),
@@ -65,5 +63,8 @@ class RegisterUserUseCase:
             
             return response, None
             
+        except HashingOverloadedException:
+            # Sin capacidad de hashing: la vista responde 503 + Retry-After
+            raise
         except Exception as e:
             return None, str(e)
\ No newline at end of file
@@ -0,0 +1,39 @@
+from typing import Tuple, Optional, Any
+from datetime import datetime
+from ...application.dto.auth_dto import VerifyTokenRequestDTO, VerifyTokenResponseDTO
+from ...application.interfaces.services.token_service import ITokenService
+
+class VerifyTokenUseCase:
+    """Caso de uso: Verificar un access token (firma, claims y revocación)"""
+    
+    def __init__(
+        self,
+        token_service: ITokenService,
+        token_denylist: Any,  # TokenDenylist implementación
+        token_epochs: Any  # TokenEpochMap implementación
+    ):
+        self.token_service = token_service
+        self.token_denylist = token_denylist
+        self.token_epochs = token_epochs
+    
+    def execute(self, request: VerifyTokenRequestDTO) -> Tuple[Optional[VerifyTokenResponseDTO], Optional[str]]:
+        """
+        Ejecutar verificación
+        
+        Returns:
+            Tuple[Optional[VerifyTokenResponseDTO], Optional[str]]: (response, error_message)
+        """
+        payload = self.token_service.verify_token(request.token)
+        if not payload or payload.get("type") != "access":
+            return None, "Invalid or expired token"
+        
+        jti = payload.get("jti")
+        if (jti and self.token_denylist.is_revoked(jti)) or not self.token_epochs.is_current(payload):
+            return None, "Token has been revoked"
+        
+        return VerifyTokenResponseDTO(
+            is_valid=True,
+            user_id=payload.get("sub"),
+            email=payload.get("email"),
+            expires_at=datetime.utcfromtimestamp(payload["exp"]) if "exp" in payload else None
+        ), None
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional, List
 from ...domain.value_objects.email import Email
 from ...domain.value_objects.password import Password
@@ -10,6 +10,10 @@ from ...domain.exceptions.auth_exceptions import InvalidUserException
 class User:
     """Entidad User para autenticación"""
     
+    # Política de bloqueo por intentos fallidos (ventana temporal)
+    MAX_FAILED_LOGIN_ATTEMPTS = 5
+    LOCKOUT_DURATION = timedelta(minutes=15)
+    
     email: Email
     username: str
     hashed_password: str
@@ -17,8 +21,11 @@ class User:
     is_active: bool = True
     is_verified: bool = False
     last_login: Optional[datetime] = None
-    refresh_tokens: List[str] = field(default_factory=list)
     failed_login_attempts: int = 0
+    locked_until: Optional[datetime] = None
+    # Se incrementa para invalidar todos los tokens emitidos (claim `epc`)
+    token_epoch: int = 0
+    token_epoch_at: Optional[datetime] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
     
@@ -33,13 +40,15 @@ class User:
         if len(self.username) < 3:
             raise InvalidUserException("Username must be at least 3 characters")
         
-        if not self.email.is_valid():
+        # Un Email es válido por construcción (validado al crearse o Email.trusted)
+        if not isinstance(self.email, Email):
             raise InvalidUserException("Invalid email address")
     
     def login_successful(self):
         """Manejar login exitoso"""
         self.last_login = datetime.utcnow()
         self.failed_login_attempts = 0
+        self.locked_until = None
         self.updated_at = datetime.utcnow()
         
         # Registrar evento
@@ -51,29 +60,20 @@ class User:
     
     def login_failed(self):
         """Manejar intento de login fallido"""
+        now = datetime.utcnow()
+        if self.locked_until is not None and self.locked_until <= now:
+            # El bloqueo anterior expiró: empieza una nueva ventana
+            self.failed_login_attempts = 0
+            self.locked_until = None
+        
         self.failed_login_attempts += 1
-        self.updated_at = datetime.utcnow()
+        if self.failed_login_attempts >= self.MAX_FAILED_LOGIN_ATTEMPTS:
+            self.locked_until = now + self.LOCKOUT_DURATION
+        self.updated_at = now
     
     def is_locked(self) -> bool:
         """Verificar si la cuenta está bloqueada por intentos fallidos"""
-        return self.failed_login_attempts >= 5
-    
-    def add_refresh_token(self, token: str):
-        """Agregar token de refresh a la lista"""
-        if token not in self.refresh_tokens:
-            self.refresh_tokens.append(token)
-            self.updated_at = datetime.utcnow()
-    
-    def remove_refresh_token(self, token: str):
-        """Remover token de refresh"""
-        if token in self.refresh_tokens:
-            self.refresh_tokens.remove(token)
-            self.updated_at = datetime.utcnow()
-    
-    def clear_all_refresh_tokens(self):
-        """Limpiar todos los tokens de refresh"""
-        self.refresh_tokens.clear()
-        self.updated_at = datetime.utcnow()
+        return self.locked_until is not None and self.locked_until > datetime.utcnow()
     
     def verify_email(self):
         """Verificar email del usuario"""
@@ -83,8 +83,18 @@ class User:
     def deactivate(self):
         """Desactivar cuenta"""
         self.is_active = False
-        self.updated_at = datetime.utcnow()
-        self.clear_all_refresh_tokens()
+        self.revoke_tokens()
+    
+    def change_password(self, hashed_password: str):
+        """Cambiar password (invalida las sesiones abiertas)"""
+        self.hashed_password = hashed_password
+        self.revoke_tokens()
+    
+    def revoke_tokens(self):
+        """Invalidar todos los tokens emitidos hasta ahora"""
+        self.token_epoch += 1
+        self.token_epoch_at = datetime.utcnow()
+        self.updated_at = self.token_epoch_at
     
     def _register_event(self, event):
         """Registrar evento de dominio"""
@@ -50,4 +50,27 @@ class InvalidTokenException(AuthException):
 class EmailAlreadyExistsException(AuthException):
     """Email ya registrado"""
     def __init__(self, message: str = "Email already exists"):
-        super().__init__(message, "EMAIL_EXISTS")
\ No newline at end of file
+        super().__init__(message, "EMAIL_EXISTS")
+
+class UsernameAlreadyExistsException(AuthException):
+    """Username ya registrado"""
+    def __init__(self, message: str = "Username already exists"):
+        super().__init__(message, "USERNAME_EXISTS")
+
+class HashingOverloadedException(AuthException):
+    """Pool de hashing saturado (cola llena o espera máxima superada)"""
+    def __init__(self, message: str = "Authentication service is busy, retry later", retry_after: int = 1):
+        self.retry_after = retry_after
+        super().__init__(message, "HASHING_OVERLOADED")
+
+class RateLimitExceededException(AuthException):
+    """Demasiadas peticiones para la IP, el email o el host"""
+    def __init__(self, message: str = "Too many requests, retry later", retry_after: int = 1):
+        self.retry_after = retry_after
+        super().__init__(message, "RATE_LIMITED")
+
+class ServiceOverloadedException(AuthException):
+    """Límite de concurrencia del endpoint alcanzado (load shedding)"""
+    def __init__(self, message: str = "Service is over capacity, retry later", retry_after: int = 1):
+        self.retry_after = retry_after
+        super().__init__(message, "OVERLOADED")
@@ -3,6 +3,8 @@ from dataclasses import dataclass
 from typing import Optional
 from ...domain.exceptions.auth_exceptions import InvalidEmailException
 
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 @dataclass(frozen=True)
 class Email:
     """Value Object para email"""
@@ -12,10 +14,16 @@ class Email:
         if not self.is_valid():
             raise InvalidEmailException(f"Invalid email address: {self.value}")
     
+    @classmethod
+    def trusted(cls, value: str) -> "Email":
+        """Email ya validado (DTO de entrada, token firmado, base de datos): sin repetir la regex"""
+        email = object.__new__(cls)
+        object.__setattr__(email, 'value', value)
+        return email
+    
     def is_valid(self) -> bool:
         """Validar formato de email"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, self.value))
+        return bool(EMAIL_PATTERN.match(self.value))
     
     def get_domain(self) -> str:
         """Obtener dominio del email"""
@@ -0,0 +1,23 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from ..models.user_model import UserModel
+
+def add_lockout_column(engine: Engine) -> bool:
+    """
+    Añadir users.locked_until (bloqueo temporal por intentos fallidos) a una base existente
+
+    Columna nullable sin default: ADD COLUMN no reescribe la tabla. Los
+    bloqueos anteriores no tenían ventana, así que nadie queda bloqueado al
+    migrar. Idempotente.
+
+    Returns:
+        bool: True si se añadió la columna
+    """
+    table = UserModel.__tablename__
+    existing = {column['name'] for column in inspect(engine).get_columns(table)}
+    if 'locked_until' in existing:
+        return False
+    
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text(f"ALTER TABLE {table} ADD COLUMN locked_until TIMESTAMP"))
+    return True
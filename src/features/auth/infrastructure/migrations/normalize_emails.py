@@ -0,0 +1,109 @@
+from collections import defaultdict
+from typing import Any, Dict, List
+from uuid import UUID
+from sqlalchemy import select, delete, update, func, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from ..models.user_model import UserModel
+
+EMAIL_INDEX = 'uq_users_email_lower'
+LEGACY_EMAIL_INDEX = 'ix_users_email'
+
+def find_duplicate_emails(session: Session) -> Dict[str, List[UUID]]:
+    """
+    Usuarios que colisionan al pasar el email a minúsculas
+
+    Returns:
+        Dict[str, List[UUID]]: email -> ids; el primero es el que se conserva
+        (último login más reciente y, a igualdad, el más antiguo)
+    """
+    lowered = func.lower(UserModel.email)
+    colliding = select(lowered).group_by(lowered).having(func.count() > 1)
+    rows = session.execute(
+        select(lowered.label('email'), UserModel.id)
+        .where(lowered.in_(colliding))
+        .order_by(lowered, UserModel.last_login.desc().nulls_last(), UserModel.created_at)
+    ).all()
+    
+    duplicates: Dict[str, List[UUID]] = defaultdict(list)
+    for email, user_id in rows:
+        duplicates[email].append(user_id)
+    return dict(duplicates)
+
+def normalize_emails(session: Session, engine: Engine, dry_run: bool = False, batch_size: int = 10000) -> Dict[str, Any]:
+    """
+    Migración de datos a email en minúsculas con índice único lower(email)
+    
+    1. Elimina los duplicados case-insensitive (conserva uno por email)
+    2. Pasa a minúsculas los emails existentes, por lotes
+    3. Crea uq_users_email_lower y elimina el índice único antiguo
+    """
+    duplicates = find_duplicate_emails(session)
+    removed = [user_id for user_ids in duplicates.values() for user_id in user_ids[1:]]
+    pending = session.scalar(
+        select(func.count()).select_from(UserModel).where(UserModel.email != func.lower(UserModel.email))
+    )
+    
+    summary = {
+        "duplicate_groups": len(duplicates),
+        "duplicates_removed": len(removed),
+        "emails_lowercased": pending,
+        "duplicates": {email: [str(user_id) for user_id in user_ids] for email, user_ids in duplicates.items()},
+        "index_created": False,
+    }
+    if dry_run:
+        return summary
+    
+    # 1. Duplicados (sus refresh tokens se borran en cascada)
+    for start in range(0, len(removed), batch_size):
+        session.execute(
+            delete(UserModel)
+            .where(UserModel.id.in_(removed[start:start + batch_size]))
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+    
+    # 2. Backfill por lotes para no mantener bloqueada toda la tabla
+    while True:
+        batch = (
+            select(UserModel.id)
+            .where(UserModel.email != func.lower(UserModel.email))
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = session.execute(
+            update(UserModel)
+            .where(UserModel.id.in_(batch))
+            .values(email=func.lower(UserModel.email))
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        if result.rowcount < batch_size:
+            break
+    
+    # 3. Índices
+    create_email_index(engine)
+    summary["index_created"] = True
+    return summary
+
+def create_email_index(engine: Engine) -> None:
+    """Crear el índice funcional (CONCURRENTLY en PostgreSQL) y retirar el antiguo"""
+    table = UserModel.__tablename__
+    is_postgres = engine.dialect.name == 'postgresql'
+    concurrently = 'CONCURRENTLY ' if is_postgres else ''
+    
+    # CREATE/DROP INDEX CONCURRENTLY no admite transacción
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        if is_postgres:
+            # Un CREATE INDEX CONCURRENTLY fallido deja un índice INVALID
+            is_valid = connection.execute(text(
+                "SELECT i.indisvalid FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid "
+                "WHERE c.relname = :name"
+            ), {"name": EMAIL_INDEX}).scalar()
+            if is_valid is False:
+                connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {EMAIL_INDEX}"))
+        
+        connection.execute(text(
+            f"CREATE UNIQUE INDEX {concurrently}IF NOT EXISTS {EMAIL_INDEX} ON {table} (lower(email))"
+        ))
+        connection.execute(text(f"DROP INDEX {concurrently}IF EXISTS {LEGACY_EMAIL_INDEX}"))
@@ -0,0 +1,34 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from ..models.user_model import UserModel
+
+TOKEN_EPOCH_INDEX = 'ix_users_token_epoch_at'
+
+def add_token_epoch_columns(engine: Engine) -> bool:
+    """
+    Añadir users.token_epoch y users.token_epoch_at a una base existente
+
+    ADD COLUMN con default constante no reescribe la tabla (PostgreSQL 11+)
+    y el índice se crea CONCURRENTLY. Idempotente.
+
+    Returns:
+        bool: True si se añadieron columnas
+    """
+    table = UserModel.__tablename__
+    is_postgres = engine.dialect.name == 'postgresql'
+    concurrently = 'CONCURRENTLY ' if is_postgres else ''
+    existing = {column['name'] for column in inspect(engine).get_columns(table)}
+    
+    # CREATE INDEX CONCURRENTLY no admite transacción
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        added = False
+        if 'token_epoch' not in existing:
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN token_epoch INTEGER NOT NULL DEFAULT 0"))
+            added = True
+        if 'token_epoch_at' not in existing:
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN token_epoch_at TIMESTAMP"))
+            added = True
+        connection.execute(text(
+            f"CREATE INDEX {concurrently}IF NOT EXISTS {TOKEN_EPOCH_INDEX} ON {table} (token_epoch_at)"
+        ))
+    return added
@@ -0,0 +1,25 @@
+import hashlib
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from src.core.database.db import Base
+
+class RefreshTokenModel(Base):
+    """Modelo SQLAlchemy para refresh tokens (uno por fila, indexado por hash)"""
+    __tablename__ = "refresh_tokens"
+    
+    # SHA-256 del token: nunca se guarda el token en claro
+    token_hash = Column(String(64), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    family_id = Column(String(36), nullable=True, index=True)
+    device = Column(String(255), nullable=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    @staticmethod
+    def hash_token(token: str) -> str:
+        """Hash usado como clave del token"""
+        return hashlib.sha256(token.encode()).hexdigest()
+    
+    def __repr__(self):
+        return f"<RefreshToken(user_id={self.user_id}, family_id={self.family_id}, expires_at={self.expires_at})>"
@@ -0,0 +1,18 @@
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from src.core.database.db import Base
+
+class RevokedTokenModel(Base):
+    """Modelo SQLAlchemy para la denylist de access tokens (por jti)"""
+    __tablename__ = "revoked_tokens"
+    
+    jti = Column(String(64), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
+    # La entrada deja de importar cuando el token caduca (se purga después)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    # Cursor de la recarga incremental del filtro en cada worker
+    revoked_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    
+    def __repr__(self):
+        return f"<RevokedToken(jti={self.jti}, user_id={self.user_id}, expires_at={self.expires_at})>"
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, JSON, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, Integer, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from src.core.database.db import Base
@@ -9,16 +9,24 @@ class UserModel(Base):
     __tablename__ = "users"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    email = Column(String(255), unique=True, nullable=False, index=True)
+    # Se guarda en minúsculas; la unicidad y las búsquedas usan lower(email)
+    email = Column(String(255), nullable=False)
     username = Column(String(50), unique=True, nullable=False, index=True)
     hashed_password = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True)
     is_verified = Column(Boolean, default=False)
     last_login = Column(DateTime, nullable=True)
-    refresh_tokens = Column(JSON, default=list)
     failed_login_attempts = Column(Integer, default=0)
+    locked_until = Column(DateTime, nullable=True)
+    # Época de tokens (claim `epc`); token_epoch_at es el cursor de recarga de cada worker
+    token_epoch = Column(Integer, nullable=False, default=0, server_default="0")
+    token_epoch_at = Column(DateTime, nullable=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        Index('uq_users_email_lower', func.lower(email), unique=True),
+    )
+    
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, username={self.username})>"
\ No newline at end of file
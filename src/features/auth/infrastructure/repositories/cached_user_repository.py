@@ -0,0 +1,225 @@
+import copy
+import threading
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Tuple, Set, Iterator
+from cachetools import TTLCache
+from ...domain.entities.user import User
+from ...application.interfaces.repositories.user_repository import IUserRepository
+
+class UserCache:
+    """Caché en proceso (LRU + TTL) de usuarios por id, con métricas
+
+    Es local a cada worker: la invalidación explícita solo alcanza al
+    proceso que hace la escritura, así que el TTL acota cuánto tarda el
+    resto de workers en ver un cambio (p. ej. una desactivación).
+
+    Cada invalidación recibe una generación: quien rellena la caché tras un
+    fallo toma `fill_ticket()` antes de leer y `set()` descarta el usuario
+    si entretanto se invalidó (lectura anterior a la escritura). Durante
+    `primary_window` segundos tras invalidar, el relleno lee del primario.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 30.0, primary_window: float = 5.0):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        # user_id -> generación de su última invalidación (reciente)
+        self._invalidated: TTLCache = TTLCache(maxsize=maxsize, ttl=max(primary_window, 1.0))
+        self._generation = 0
+        self._cleared_at = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0, "stale_fills": 0}
+
+    def get(self, user_id: str) -> Optional[User]:
+        with self._lock:
+            user = self._cache.get(user_id)
+            self._stats["hits" if user is not None else "misses"] += 1
+        return _copy_user(user) if user is not None else None
+
+    def fill_ticket(self, user_id: str) -> Tuple[int, bool]:
+        """Generación actual y si `user_id` se invalidó hace poco (leer del primario)"""
+        with self._lock:
+            return self._generation, user_id in self._invalidated
+
+    def set(self, user: User, generation: Optional[int] = None) -> bool:
+        """Guardar el usuario, salvo que se invalidara después de `generation`"""
+        with self._lock:
+            if generation is not None and (
+                self._cleared_at > generation or self._invalidated.get(user.id, -1) > generation
+            ):
+                self._stats["stale_fills"] += 1
+                return False
+            self._cache[user.id] = _copy_user(user)
+            return True
+
+    def invalidate(self, user_id: str) -> None:
+        with self._lock:
+            self._generation += 1
+            self._invalidated[user_id] = self._generation
+            if self._cache.pop(user_id, None) is not None:
+                self._stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._cleared_at = self._generation
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                "size": self._cache.currsize,
+                "maxsize": self._cache.maxsize,
+                "ttl": self._cache.ttl,
+                "hit_ratio": round(self._stats["hits"] / lookups, 4) if lookups else None,
+                **self._stats,
+            }
+
+def _copy_user(user: User) -> User:
+    # Copia para que los cambios del llamador (y sus eventos) no alteren la caché
+    user_copy = copy.copy(user)
+    user_copy._events = []
+    return user_copy
+
+class CachedUserRepository(IUserRepository):
+    """Repositorio de usuarios con caché de identidad delante de find_by_id
+
+    Delega todo en el repositorio real; cualquier escritura sobre un
+    usuario (save, delete, login...) invalida su entrada. Si el usuario
+    cambia de época de tokens (desactivación, cambio de password) se
+    aplica también al mapa de épocas de este worker.
+    """
+
+    def __init__(self, repository: IUserRepository, cache: UserCache, token_epochs: Optional[Any] = None):
+        self.repository = repository
+        self.cache = cache
+        self.token_epochs = token_epochs  # TokenEpochMap implementación
+
+    def find_by_id(self, user_id: str, primary: bool = False) -> Optional[User]:
+        user = None if primary else self.cache.get(user_id)
+        if user is not None:
+            return user
+
+        # Generación antes de leer: una invalidación durante la lectura gana
+        generation, invalidated = self.cache.fill_ticket(user_id)
+        user = self.repository.find_by_id(user_id, primary=primary or invalidated)
+        if user is not None:
+            self.cache.set(user, generation)
+        return user
+
+    def find_by_ids(self, user_ids: List[str]) -> Dict[str, User]:
+        users: Dict[str, User] = {}
+        missing: List[str] = []
+        for user_id in dict.fromkeys(user_ids):
+            user = self.cache.get(user_id)
+            if user is not None:
+                users[user_id] = user
+            else:
+                missing.append(user_id)
+
+        # Solo los que no están en caché, en una consulta
+        if missing:
+            generation, _ = self.cache.fill_ticket(missing[0])
+            found = self.repository.find_by_ids(missing)
+            for user in found.values():
+                self.cache.set(user, generation)
+            users.update(found)
+        return users
+
+    def save(self, user: User) -> User:
+        # Cubre deactivate(), cambios de password, verificación...
+        if user.id:
+            self.cache.invalidate(user.id)
+        saved_user = self.repository.save(user)
+        self.cache.invalidate(saved_user.id)
+        if self.token_epochs is not None:
+            self.token_epochs.observe(saved_user.id, saved_user.token_epoch)
+        return saved_user
+
+    def create(self, user: User) -> User:
+        return self.repository.create(user)
+
+    def bulk_create(self, users: List[User]) -> Set[str]:
+        return self.repository.bulk_create(users)
+
+    def find_by_email(self, email: str) -> Optional[User]:
+        return self.repository.find_by_email(email)
+
+    def find_by_username(self, username: str) -> Optional[User]:
+        return self.repository.find_by_username(username)
+
+    def exists_by_email(self, email: str) -> bool:
+        return self.repository.exists_by_email(email)
+
+    def exists_by_username(self, username: str) -> bool:
+        return self.repository.exists_by_username(username)
+
+    def delete(self, user_id: str) -> bool:
+        self.cache.invalidate(user_id)
+        return self.repository.delete(user_id)
+
+    def update_last_login(self, user_id: str) -> None:
+        self.repository.update_last_login(user_id)
+        self.cache.invalidate(user_id)
+
+    def update_password_hash(self, user_id: str, expected_hash: str, new_hash: str) -> bool:
+        updated = self.repository.update_password_hash(user_id, expected_hash, new_hash)
+        self.cache.invalidate(user_id)
+        return updated
+
+    def iter_password_hashes(self, batch_size: int = 10000) -> Iterator[str]:
+        return self.repository.iter_password_hashes(batch_size)
+
+    def iter_token_epochs(self, batch_size: int = 10000) -> Iterator[Tuple[str, int, datetime]]:
+        return self.repository.iter_token_epochs(batch_size)
+
+    def token_epochs_since(
+        self, since: datetime, limit: int = 10000, after_id: Optional[str] = None
+    ) -> List[Tuple[str, int, datetime]]:
+        return self.repository.token_epochs_since(since, limit, after_id)
+
+    def record_login(
+        self,
+        user_id: str,
+        refresh_token: str,
+        expires_at: Optional[datetime] = None,
+        family_id: Optional[str] = None,
+        device: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        login = self.repository.record_login(user_id, refresh_token, expires_at, family_id, device)
+        self.cache.invalidate(user_id)
+        return login
+
+    def register_failed_login(
+        self,
+        user_id: str,
+        max_attempts: int = User.MAX_FAILED_LOGIN_ATTEMPTS,
+        lockout: timedelta = User.LOCKOUT_DURATION
+    ) -> Optional[Tuple[int, Optional[datetime]]]:
+        result = self.repository.register_failed_login(user_id, max_attempts, lockout)
+        self.cache.invalidate(user_id)
+        return result
+
+    def add_refresh_token(
+        self,
+        user_id: str,
+        token: str,
+        expires_at: Optional[datetime] = None,
+        family_id: Optional[str] = None,
+        device: Optional[str] = None
+    ) -> None:
+        self.repository.add_refresh_token(user_id, token, expires_at, family_id, device)
+
+    def remove_refresh_token(self, user_id: str, token: str) -> bool:
+        return self.repository.remove_refresh_token(user_id, token)
+
+    def has_refresh_token(self, user_id: str, token: str) -> bool:
+        return self.repository.has_refresh_token(user_id, token)
+
+    def revoke_refresh_token_family(self, family_id: str) -> int:
+        return self.repository.revoke_refresh_token_family(family_id)
+
+    def revoke_all_refresh_tokens(self, user_id: str) -> int:
+        return self.repository.revoke_all_refresh_tokens(user_id)
+
+    def prune_expired_refresh_tokens(self, before: Optional[datetime] = None, batch_size: int = 10000) -> int:
+        return self.repository.prune_expired_refresh_tokens(before, batch_size)
@@ -0,0 +1,96 @@
+from datetime import datetime
+from typing import Optional, List, Tuple, Iterator
+from uuid import UUID
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.orm import Session
+from src.core.database.routing import mark_write
+from ...application.interfaces.repositories.revoked_token_repository import IRevokedTokenRepository
+from ..models.revoked_token_model import RevokedTokenModel
+from .user_repository_impl import dialect_insert
+
+class RevokedTokenRepositoryImpl(IRevokedTokenRepository):
+    """Implementación de la denylist con SQLAlchemy
+    
+    Siempre lee del primario: una réplica con retraso dejaría pasar
+    tokens recién revocados.
+    """
+    
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+    
+    def revoke(self, jti: str, user_id: Optional[str], expires_at: datetime) -> bool:
+        try:
+            user_uuid = UUID(user_id) if user_id else None
+        except ValueError:
+            user_uuid = None
+        
+        result = self.db_session.execute(
+            dialect_insert(self.db_session, RevokedTokenModel).values(
+                jti=jti,
+                user_id=user_uuid,
+                expires_at=expires_at,
+                revoked_at=datetime.utcnow()
+            ).on_conflict_do_nothing(index_elements=[RevokedTokenModel.jti])
+        )
+        self.db_session.commit()
+        mark_write(self.db_session)
+        return result.rowcount > 0
+    
+    def is_revoked(self, jti: str) -> bool:
+        return bool(self.db_session.query(
+            self.db_session.query(RevokedTokenModel).filter(
+                RevokedTokenModel.jti == jti,
+                RevokedTokenModel.expires_at > datetime.utcnow()
+            ).exists()
+        ).scalar())
+    
+    def iter_active(self, batch_size: int = 10000) -> Iterator[Tuple[str, datetime]]:
+        result = self.db_session.execute(
+            select(RevokedTokenModel.jti, RevokedTokenModel.revoked_at)
+            .where(RevokedTokenModel.expires_at > datetime.utcnow())
+            .execution_options(yield_per=batch_size)
+        )
+        for jti, revoked_at in result:
+            yield jti, revoked_at
+    
+    def revoked_since(
+        self, since: datetime, limit: int = 10000, after_jti: Optional[str] = None
+    ) -> List[Tuple[str, datetime]]:
+        if after_jti is None:
+            condition = RevokedTokenModel.revoked_at >= since
+        else:
+            # Keyset (revoked_at, jti)
+            condition = or_(
+                RevokedTokenModel.revoked_at > since,
+                and_(RevokedTokenModel.revoked_at == since, RevokedTokenModel.jti > after_jti)
+            )
+        rows = self.db_session.execute(
+            select(RevokedTokenModel.jti, RevokedTokenModel.revoked_at)
+            .where(condition)
+            .order_by(RevokedTokenModel.revoked_at, RevokedTokenModel.jti)
+            .limit(limit)
+        ).all()
+        return [(jti, revoked_at) for jti, revoked_at in rows]
+    
+    def prune_expired(self, before: Optional[datetime] = None, batch_size: int = 10000) -> int:
+        """Eliminar en lotes para no bloquear la tabla"""
+        before = before or datetime.utcnow()
+        total = 0
+        
+        while True:
+            batch = (
+                select(RevokedTokenModel.jti)
+                .where(RevokedTokenModel.expires_at <= before)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = self.db_session.execute(
+                delete(RevokedTokenModel)
+                .where(RevokedTokenModel.jti.in_(batch))
+                .execution_options(synchronize_session=False)
+            )
+            self.db_session.commit()
+            total += result.rowcount
+            
+            if result.rowcount < batch_size:
+                return total
@@ -1,63 +1,200 @@
-from typing import Optional, List
+import csv
+import io
+from typing import Optional, List, Dict, Any, Tuple, Set, Iterator
+from sqlalchemy import select, delete, insert, update, literal, case, func, and_, or_, String, DateTime
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from src.core.database.routing import replica_read, read_only, mark_write
 from uuid import UUID
 from ...domain.entities.user import User
 from ...domain.value_objects.email import Email
+from ...domain.exceptions.auth_exceptions import (
+    AuthException,
+    EmailAlreadyExistsException,
+    UsernameAlreadyExistsException
+)
 from ...application.interfaces.repositories.user_repository import IUserRepository
-# from ...application.mappers.user_mapper import UserMapper
+from ...application.mappers.user_mapper import UserMapper, normalize_email
 from ..models.user_model import UserModel
-import datetime
+from ..models.refresh_token_model import RefreshTokenModel
+from datetime import datetime, timedelta
+
+DEFAULT_REFRESH_TOKEN_TTL = timedelta(days=30)
+
+# Campos que necesita la respuesta de login
+LOGIN_FIELDS = (
+    UserModel.id,
+    UserModel.email,
+    UserModel.username,
+    UserModel.is_verified,
+    UserModel.is_active,
+)
+
+# Columnas que escribe la importación masiva (COPY)
+IMPORT_COLUMNS = (
+    'id',
+    'email',
+    'username',
+    'hashed_password',
+    'is_active',
+    'is_verified',
+    'failed_login_attempts',
+    'created_at',
+    'updated_at',
+)
+
+# Índices únicos de users -> excepción de dominio
+# (ix_users_email solo existe en bases aún sin migrar a uq_users_email_lower)
+UNIQUE_CONSTRAINT_EXCEPTIONS = {
+    'uq_users_email_lower': EmailAlreadyExistsException,
+    'ix_users_email': EmailAlreadyExistsException,
+    'ix_users_username': UsernameAlreadyExistsException,
+}
 
 class UserRepositoryImpl(IUserRepository):
     """Implementación del repositorio de usuarios con SQLAlchemy"""
     
-    # def __init__(self, db_session: Session):
-    #     self.db_session = db_session
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+    
+    def save(self, user: User) -> User:
+        user_model = None
+        
+        if user.id:
+            # Actualizar usuario existente
+            user_model = self.db_session.get(UserModel, UUID(user.id))
+            if user_model:
+                UserMapper.update_model(user_model, user)
+        
+        if user_model is None:
+            # Crear nuevo usuario
+            user_model = UserMapper.to_model(user)
+            self.db_session.add(user_model)
+        
+        self.db_session.commit()
+        self.db_session.refresh(user_model)
+        
+        return UserMapper.to_entity(user_model)
+    
+    def create(self, user: User) -> User:
+        # INSERT ... RETURNING: las constraints únicas sustituyen a los
+        # exists_by_* previos (sin round-trips extra ni carrera entre ellos)
+        statement = insert(UserModel).returning(UserModel)
+        try:
+            user_model = self.db_session.scalars(statement, [insert_values(user)]).one()
+            # Mapear antes del commit: después la instancia expira y leerla
+            # volvería a hacer un SELECT de la fila recién insertada
+            saved_user = UserMapper.to_entity(user_model)
+            self.db_session.commit()
+        except IntegrityError as e:
+            self.db_session.rollback()
+            raise unique_violation_exception(e) or e
+        
+        return saved_user
     
-    # def save(self, user: User) -> User:
-    #     user_model = UserMapper.to_model(user)
+    def bulk_create(self, users: List[User]) -> Set[str]:
+        """Insertar un lote de usuarios ignorando duplicados
         
-    #     if user.id:
-    #         # Actualizar usuario existente
-    #         existing = self.db_session.query(UserModel).filter_by(id=user.id).first()
-    #         if existing:
-    #             for key, value in user_model.__dict__.items():
-    #                 if not key.startswith('_'):
-    #                     setattr(existing, key, value)
-    #             user_model = existing
-    #         else:
-    #             self.db_session.add(user_model)
-    #     else:
-    #         # Crear nuevo usuario
-    #         self.db_session.add(user_model)
+        Returns:
+            Set[str]: ids de los usuarios insertados (los ausentes ya existían)
+        """
+        if not users:
+            return set()
+        
+        rows = [import_values(user) for user in users]
+        try:
+            if self.db_session.get_bind().dialect.name == 'postgresql':
+                inserted = self._copy_users(rows)
+            else:
+                result = self.db_session.execute(
+                    dialect_insert(self.db_session, UserModel)
+                    .on_conflict_do_nothing()
+                    .returning(UserModel.id),
+                    rows
+                )
+                inserted = {str(user_id) for user_id in result.scalars()}
+            self.db_session.commit()
+        except Exception:
+            self.db_session.rollback()
+            raise
         
-    #     self.db_session.commit()
-    #     self.db_session.refresh(user_model)
+        mark_write(self.db_session)
+        return inserted
+    
+    def _copy_users(self, rows: List[Dict[str, Any]]) -> Set[str]:
+        """COPY del lote a una tabla temporal + INSERT ... SELECT ON CONFLICT DO NOTHING"""
+        table = UserModel.__tablename__
+        columns = ', '.join(IMPORT_COLUMNS)
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([row[column] for column in IMPORT_COLUMNS])
+        buffer.seek(0)
+        
+        # Cursor de psycopg2 sobre la conexión (y transacción) de la sesión
+        cursor = self.db_session.connection().connection.cursor()
+        try:
+            cursor.execute(
+                f"CREATE TEMP TABLE {table}_import (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            cursor.copy_expert(f"COPY {table}_import ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {table}_import "
+                f"ON CONFLICT DO NOTHING RETURNING id"
+            )
+            return {str(user_id) for (user_id,) in cursor.fetchall()}
+        finally:
+            cursor.close()
+    
+    def find_by_id(self, user_id: str, primary: bool = False) -> Optional[User]:
+        try:
+            user_uuid = UUID(user_id)
+        except ValueError:
+            return None
         
-    #     return UserMapper.to_entity(user_model)
+        if primary:
+            # populate_existing: no devolver la instancia ya cargada de la sesión
+            user_model = self.db_session.get(UserModel, user_uuid, populate_existing=True)
+        else:
+            with read_only(self.db_session):
+                user_model = self.db_session.get(UserModel, user_uuid)
+        return UserMapper.to_entity(user_model) if user_model else None
     
-    # def find_by_id(self, user_id: str) -> Optional[User]:
-    #     try:
-    #         user_uuid = UUID(user_id)
-    #     except ValueError:
-    #         return None
+    @replica_read
+    def find_by_ids(self, user_ids: List[str]) -> Dict[str, User]:
+        user_uuids = set()
+        for user_id in user_ids:
+            try:
+                user_uuids.add(UUID(user_id))
+            except ValueError:
+                continue
+        if not user_uuids:
+            return {}
         
-    #     user_model = self.db_session.query(UserModel).filter_by(id=user_uuid).first()
-    #     return UserMapper.to_entity(user_model) if user_model else None
+        # Un único WHERE id IN (...) por lote
+        user_models = self.db_session.query(UserModel).filter(UserModel.id.in_(user_uuids)).all()
+        return {str(user_model.id): UserMapper.to_entity(user_model) for user_model in user_models}
     
-    # def find_by_email(self, email: str) -> Optional[User]:
-    #     user_model = self.db_session.query(UserModel).filter_by(email=email).first()
-    #     return UserMapper.to_entity(user_model) if user_model else None
+    @replica_read
+    def find_by_email(self, email: str) -> Optional[User]:
+        user_model = self.db_session.query(UserModel).filter(email_matches(email)).first()
+        return UserMapper.to_entity(user_model) if user_model else None
     
-    # def find_by_username(self, username: str) -> Optional[User]:
-    #     user_model = self.db_session.query(UserModel).filter_by(username=username).first()
-    #     return UserMapper.to_entity(user_model) if user_model else None
+    @replica_read
+    def find_by_username(self, username: str) -> Optional[User]:
+        user_model = self.db_session.query(UserModel).filter_by(username=username).first()
+        return UserMapper.to_entity(user_model) if user_model else None
     
+    @replica_read
     def exists_by_email(self, email: str) -> bool:
         return self.db_session.query(
-            self.db_session.query(UserModel).filter_by(email=email).exists()
+            self.db_session.query(UserModel).filter(email_matches(email)).exists()
         ).scalar()
     
+    @replica_read
     def exists_by_username(self, username: str) -> bool:
         return self.db_session.query(
             self.db_session.query(UserModel).filter_by(username=username).exists()
@@ -84,20 +221,125 @@ class UserRepositoryImpl(IUserRepository):
             user_model.last_login = datetime.utcnow()
             self.db_session.commit()
     
-    def add_refresh_token(self, user_id: str, token: str) -> None:
+    def update_password_hash(self, user_id: str, expected_hash: str, new_hash: str) -> bool:
+        try:
+            user_uuid = UUID(user_id)
+        except ValueError:
+            return False
+        
+        # Compare-and-set: si el hash cambió entretanto (p. ej. cambio de
+        # password) no se pisa el valor nuevo
+        result = self.db_session.execute(
+            password_hash_update(user_uuid, expected_hash, new_hash)
+        )
+        self.db_session.commit()
+        mark_write(self.db_session)
+        return result.rowcount > 0
+    
+    def iter_password_hashes(self, batch_size: int = 10000) -> Iterator[str]:
+        # Generador: el contexto read-only se abre aquí y no en un decorator
+        # para que cubra la consulta, que se ejecuta en la primera iteración
+        with read_only(self.db_session):
+            result = self.db_session.execute(
+                select(UserModel.hashed_password).execution_options(yield_per=batch_size)
+            )
+            yield from result.scalars()
+    
+    def iter_token_epochs(self, batch_size: int = 10000) -> Iterator[Tuple[str, int, datetime]]:
+        # Siempre del primario: una réplica atrasada dejaría pasar tokens invalidados
+        result = self.db_session.execute(
+            select(UserModel.id, UserModel.token_epoch, UserModel.token_epoch_at)
+            .where(UserModel.token_epoch > 0)
+            .execution_options(yield_per=batch_size)
+        )
+        for user_id, token_epoch, token_epoch_at in result:
+            yield str(user_id), token_epoch, token_epoch_at
+    
+    def token_epochs_since(
+        self, since: datetime, limit: int = 10000, after_id: Optional[str] = None
+    ) -> List[Tuple[str, int, datetime]]:
+        if after_id is None:
+            condition = UserModel.token_epoch_at >= since
+        else:
+            # Keyset (token_epoch_at, id)
+            condition = or_(
+                UserModel.token_epoch_at > since,
+                and_(UserModel.token_epoch_at == since, UserModel.id > UUID(after_id))
+            )
+        rows = self.db_session.execute(
+            select(UserModel.id, UserModel.token_epoch, UserModel.token_epoch_at)
+            .where(condition)
+            .order_by(UserModel.token_epoch_at, UserModel.id)
+            .limit(limit)
+        ).all()
+        return [(str(user_id), token_epoch, token_epoch_at) for user_id, token_epoch, token_epoch_at in rows]
+    
+    def register_failed_login(
+        self,
+        user_id: str,
+        max_attempts: int = User.MAX_FAILED_LOGIN_ATTEMPTS,
+        lockout: timedelta = User.LOCKOUT_DURATION
+    ) -> Optional[Tuple[int, Optional[datetime]]]:
+        try:
+            user_uuid = UUID(user_id)
+        except ValueError:
+            return None
+        
+        # Incremento atómico en la base de datos (sin read-modify-write)
+        row = self.db_session.execute(
+            failed_login_update(user_uuid, max_attempts, lockout)
+        ).first()
+        self.db_session.commit()
+        mark_write(self.db_session)
+        return (row.failed_login_attempts, row.locked_until) if row else None
+    
+    def add_refresh_token(
+        self,
+        user_id: str,
+        token: str,
+        expires_at: Optional[datetime] = None,
+        family_id: Optional[str] = None,
+        device: Optional[str] = None
+    ) -> None:
         try:
             user_uuid = UUID(user_id)
         except ValueError:
             return
         
-        user_model = self.db_session.query(UserModel).filter_by(id=user_uuid).first()
-        if user_model:
-            if not user_model.refresh_tokens:
-                user_model.refresh_tokens = []
-            
-            if token not in user_model.refresh_tokens:
-                user_model.refresh_tokens.append(token)
-                self.db_session.commit()
+        # Una fila por token: INSERT indexado en lugar de reescribir el usuario
+        self.db_session.execute(refresh_token_insert(
+            self.db_session, user_uuid, token, expires_at, family_id, device
+        ))
+        self.db_session.commit()
+    
+    def record_login(
+        self,
+        user_id: str,
+        refresh_token: str,
+        expires_at: Optional[datetime] = None,
+        family_id: Optional[str] = None,
+        device: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            user_uuid = UUID(user_id)
+        except ValueError:
+            return None
+        
+        if self.db_session.get_bind().dialect.name == 'postgresql':
+            # Una sentencia: UPDATE ... RETURNING + INSERT del token como CTEs
+            row = self.db_session.execute(record_login_statement(
+                self.db_session, user_uuid, refresh_token, expires_at, family_id, device
+            )).mappings().first()
+        else:
+            row = self.db_session.execute(login_update(user_uuid)).mappings().first()
+            if row:
+                self.db_session.execute(refresh_token_insert(
+                    self.db_session, user_uuid, refresh_token, expires_at, family_id, device
+                ))
+        
+        self.db_session.commit()
+        mark_write(self.db_session)
+        return login_fields(row) if row else None
     
     def remove_refresh_token(self, user_id: str, token: str) -> bool:
         try:
@@ -105,23 +347,226 @@ class UserRepositoryImpl(IUserRepository):
         except ValueError:
             return False
         
-        user_model = self.db_session.query(UserModel).filter_by(id=user_uuid).first()
-        if user_model and user_model.refresh_tokens and token in user_model.refresh_tokens:
-            user_model.refresh_tokens.remove(token)
-            self.db_session.commit()
-            return True
-        
-        return False
+        result = self.db_session.execute(
+            delete(RefreshTokenModel).where(
+                RefreshTokenModel.token_hash == RefreshTokenModel.hash_token(token),
+                RefreshTokenModel.user_id == user_uuid
+            )
+        )
+        self.db_session.commit()
+        return result.rowcount > 0
     
+    @replica_read
     def has_refresh_token(self, user_id: str, token: str) -> bool:
         try:
             user_uuid = UUID(user_id)
         except ValueError:
             return False
         
-        user_model = self.db_session.query(UserModel).filter_by(id=user_uuid).first()
-        return bool(
-            user_model and 
-            user_model.refresh_tokens and 
-            token in user_model.refresh_tokens
-        )
\ No newline at end of file
+        # Búsqueda por clave primaria (hash del token)
+        return bool(self.db_session.query(
+            self.db_session.query(RefreshTokenModel).filter(
+                RefreshTokenModel.token_hash == RefreshTokenModel.hash_token(token),
+                RefreshTokenModel.user_id == user_uuid,
+                RefreshTokenModel.expires_at > datetime.utcnow()
+            ).exists()
+        ).scalar())
+    
+    def revoke_refresh_token_family(self, family_id: str) -> int:
+        result = self.db_session.execute(
+            delete(RefreshTokenModel).where(RefreshTokenModel.family_id == family_id)
+        )
+        self.db_session.commit()
+        return result.rowcount
+    
+    def revoke_all_refresh_tokens(self, user_id: str) -> int:
+        try:
+            user_uuid = UUID(user_id)
+        except ValueError:
+            return 0
+        
+        result = self.db_session.execute(
+            delete(RefreshTokenModel).where(RefreshTokenModel.user_id == user_uuid)
+        )
+        self.db_session.commit()
+        return result.rowcount
+    
+    def prune_expired_refresh_tokens(self, before: Optional[datetime] = None, batch_size: int = 10000) -> int:
+        """Eliminar tokens expirados en lotes para no bloquear la tabla"""
+        before = before or datetime.utcnow()
+        total = 0
+        
+        while True:
+            batch = (
+                select(RefreshTokenModel.token_hash)
+                .where(RefreshTokenModel.expires_at <= before)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = self.db_session.execute(
+                delete(RefreshTokenModel)
+                .where(RefreshTokenModel.token_hash.in_(batch))
+                .execution_options(synchronize_session=False)
+            )
+            self.db_session.commit()
+            total += result.rowcount
+            
+            if result.rowcount < batch_size:
+                return total
+
+def email_matches(email: str):
+    """Comparación case-insensitive que usa el índice funcional uq_users_email_lower"""
+    return func.lower(UserModel.email) == normalize_email(email)
+
+def dialect_insert(db_session, model):
+    """INSERT con soporte de ON CONFLICT según el dialecto activo"""
+    if db_session.get_bind().dialect.name == 'sqlite':
+        return sqlite_insert(model)
+    return pg_insert(model)
+
+def refresh_token_insert(
+    db_session,
+    user_uuid: UUID,
+    token: str,
+    expires_at: Optional[datetime] = None,
+    family_id: Optional[str] = None,
+    device: Optional[str] = None
+):
+    """INSERT idempotente de un refresh token"""
+    return dialect_insert(db_session, RefreshTokenModel).values(
+        token_hash=RefreshTokenModel.hash_token(token),
+        user_id=user_uuid,
+        family_id=family_id,
+        device=device,
+        expires_at=expires_at or datetime.utcnow() + DEFAULT_REFRESH_TOKEN_TTL,
+        created_at=datetime.utcnow()
+    ).on_conflict_do_nothing(index_elements=[RefreshTokenModel.token_hash])
+
+def login_update(user_uuid: UUID):
+    """UPDATE de login exitoso que devuelve solo los campos de la respuesta
+
+    Como en failed_login_update, el WHERE excluye las cuentas bloqueadas: un
+    login correcto no puede borrar un bloqueo que un intento fallido
+    concurrente acaba de poner. Sin fila, la cuenta está bloqueada.
+    """
+    now = datetime.utcnow()
+    return (
+        update(UserModel)
+        .where(
+            UserModel.id == user_uuid,
+            or_(UserModel.locked_until.is_(None), UserModel.locked_until <= now)
+        )
+        .values(failed_login_attempts=0, locked_until=None, last_login=now, updated_at=now)
+        .returning(*LOGIN_FIELDS)
+    )
+
+def password_hash_update(user_uuid: UUID, expected_hash: str, new_hash: str):
+    """UPDATE condicionado al hash leído al verificar"""
+    return (
+        update(UserModel)
+        .where(UserModel.id == user_uuid, UserModel.hashed_password == expected_hash)
+        .values(hashed_password=new_hash, updated_at=datetime.utcnow())
+    )
+
+def failed_login_update(user_uuid: UUID, max_attempts: int, lockout: timedelta):
+    """UPDATE atómico del contador de intentos fallidos con ventana de bloqueo
+
+    El WHERE excluye las cuentas bloqueadas: si no devuelve fila, la cuenta
+    sigue bloqueada (o no existe). Un bloqueo expirado reinicia el contador.
+    """
+    now = datetime.utcnow()
+    lock_expired = and_(UserModel.locked_until.is_not(None), UserModel.locked_until <= now)
+    attempts = case(
+        (lock_expired, 1),
+        else_=func.coalesce(UserModel.failed_login_attempts, 0) + 1
+    )
+    
+    return (
+        update(UserModel)
+        .where(
+            UserModel.id == user_uuid,
+            or_(UserModel.locked_until.is_(None), UserModel.locked_until <= now)
+        )
+        .values(
+            failed_login_attempts=attempts,
+            locked_until=case((attempts >= max_attempts, literal(now + lockout, DateTime)), else_=None),
+            updated_at=now
+        )
+        .returning(UserModel.failed_login_attempts, UserModel.locked_until)
+    )
+
+def record_login_statement(
+    db_session,
+    user_uuid: UUID,
+    refresh_token: str,
+    expires_at: Optional[datetime] = None,
+    family_id: Optional[str] = None,
+    device: Optional[str] = None
+):
+    """WITH logged_in AS (UPDATE ... RETURNING), new_token AS (INSERT ... SELECT) SELECT ..."""
+    logged_in = login_update(user_uuid).cte('logged_in')
+    
+    token_values = select(
+        literal(RefreshTokenModel.hash_token(refresh_token), String),
+        logged_in.c.id,
+        literal(family_id, String),
+        literal(device, String),
+        literal(expires_at or datetime.utcnow() + DEFAULT_REFRESH_TOKEN_TTL, DateTime),
+        literal(datetime.utcnow(), DateTime)
+    )
+    new_token = (
+        dialect_insert(db_session, RefreshTokenModel)
+        .from_select(
+            ['token_hash', 'user_id', 'family_id', 'device', 'expires_at', 'created_at'],
+            token_values
+        )
+        .on_conflict_do_nothing(index_elements=[RefreshTokenModel.token_hash])
+        .cte('new_token')
+    )
+    
+    return select(logged_in).add_cte(new_token)
+
+def login_fields(row) -> Dict[str, Any]:
+    return {
+        "id": str(row["id"]),
+        "email": row["email"],
+        "username": row["username"],
+        "is_verified": row["is_verified"],
+        "is_active": row["is_active"],
+    }
+
+def insert_values(user: User) -> dict:
+    """Valores del INSERT de un usuario nuevo"""
+    user_model = UserMapper.to_model(user)
+    return {
+        column.key: getattr(user_model, column.key)
+        for column in UserModel.__table__.columns
+        if getattr(user_model, column.key) is not None
+    }
+
+def import_values(user: User) -> dict:
+    """Fila de la importación masiva (mismas columnas en todas las filas)"""
+    user_model = UserMapper.to_model(user)
+    return {column: getattr(user_model, column) for column in IMPORT_COLUMNS}
+
+def unique_violation_exception(error: IntegrityError) -> Optional[AuthException]:
+    """Traducir la violación de unicidad a la excepción de dominio correspondiente"""
+    original = error.orig
+    # psycopg2 expone el nombre de la restricción en diag
+    constraint_name = getattr(getattr(original, 'diag', None), 'constraint_name', None)
+    if constraint_name in UNIQUE_CONSTRAINT_EXCEPTIONS:
+        return UNIQUE_CONSTRAINT_EXCEPTIONS[constraint_name]()
+    
+    # SQLite: "UNIQUE constraint failed: users.email" o "...: index 'uq_users_email_lower'"
+    message = str(original)
+    for index_name, exception_class in UNIQUE_CONSTRAINT_EXCEPTIONS.items():
+        if index_name in message:
+            return exception_class()
+    for column, exception_class in (
+        ('email', EmailAlreadyExistsException),
+        ('username', UsernameAlreadyExistsException),
+    ):
+        if f'users.{column}' in message or f'({column})' in message:
+            return exception_class()
+    
+    return None
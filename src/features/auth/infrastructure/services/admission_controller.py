@@ -0,0 +1,151 @@
+# src/features/auth/infrastructure/services/admission_controller.py
+import math
+import threading
+import time
+from typing import Any, Dict, Optional
+from ...domain.exceptions.auth_exceptions import ServiceOverloadedException
+
+class AdaptiveLimit:
+    """Límite de concurrencia adaptativo (AIMD guiado por latencia)
+
+    Cada `window` segundos (con al menos `min_samples` peticiones) se
+    compara la latencia media con `target_latency`:
+    - Por encima, o si hubo respuestas de sobrecarga (503/504): el límite
+      baja en proporción al exceso (gradiente target/latencia, entre
+      `backoff` y 0.5)
+    - Por debajo y con la concurrencia cerca del límite: sube en 1
+
+    Lo que supera el límite se rechaza al momento en lugar de esperar en
+    cola, así que las peticiones admitidas mantienen su latencia.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_limit: int,
+        target_latency: float,
+        min_limit: int = 1,
+        initial_limit: Optional[int] = None,
+        window: float = 1.0,
+        min_samples: int = 3,
+        backoff: float = 0.9
+    ):
+        self.name = name
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.target_latency = target_latency
+        self.window = window
+        self.min_samples = min_samples
+        self.backoff = backoff
+        self.limit = float(initial_limit or max(self.min_limit, self.max_limit // 2))
+        self._inflight = 0
+        self._lock = threading.Lock()
+        self._window_started = time.monotonic()
+        self._samples = 0
+        self._latency_total = 0.0
+        self._congested = 0
+        self._peak_inflight = 0
+        self._avg_latency = 0.0
+        self._stats = {"admitted": 0, "rejected": 0, "increases": 0, "decreases": 0}
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._inflight >= int(self.limit):
+                self._stats["rejected"] += 1
+                return False
+            self._inflight += 1
+            self._peak_inflight = max(self._peak_inflight, self._inflight)
+            self._stats["admitted"] += 1
+            return True
+
+    def release(self, latency: float, congested: bool = False, sample: bool = True) -> None:
+        """Liberar el hueco; con `sample=False` la latencia no cuenta (p. ej. un 429)"""
+        with self._lock:
+            self._inflight -= 1
+            if not sample:
+                return
+            self._samples += 1
+            self._latency_total += latency
+            self._congested += congested
+
+            now = time.monotonic()
+            if now - self._window_started >= self.window and self._samples >= self.min_samples:
+                self._update(now)
+
+    def retry_after(self) -> int:
+        """Segundos sugeridos al cliente rechazado (latencia media reciente, mínimo 1)"""
+        return max(1, math.ceil(self._avg_latency))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "limit": int(self.limit),
+                "max_limit": self.max_limit,
+                "inflight": self._inflight,
+                "target_ms": round(self.target_latency * 1000, 1),
+                "avg_latency_ms": round(self._avg_latency * 1000, 1),
+                **self._stats,
+            }
+
+    def _update(self, now: float) -> None:
+        avg_latency = self._latency_total / self._samples
+        if self._congested or avg_latency > self.target_latency:
+            factor = min(self.backoff, max(0.5, self.target_latency / avg_latency))
+            self.limit = max(self.min_limit, self.limit * factor)
+            self._stats["decreases"] += 1
+        elif self._peak_inflight * 2 >= self.limit and self.limit < self.max_limit:
+            # Solo crece si el límite se está usando
+            self.limit = min(self.max_limit, self.limit + 1)
+            self._stats["increases"] += 1
+
+        self._avg_latency = avg_latency
+        self._window_started = now
+        self._samples = 0
+        self._latency_total = 0.0
+        self._congested = 0
+        self._peak_inflight = self._inflight
+
+class AdmissionController:
+    """Control de admisión por clase de endpoint (un límite por proceso/worker)"""
+
+    def __init__(self, limits: Dict[str, AdaptiveLimit], enabled: bool = True):
+        self.limits = limits
+        self.enabled = enabled
+
+    def acquire(self, endpoint_class: str) -> Optional[AdaptiveLimit]:
+        """Admitir la petición o lanzar ServiceOverloadedException (503 + Retry-After)
+
+        Returns:
+            El límite a liberar con `release` (None si la clase no se controla)
+        """
+        limit = self.limits.get(endpoint_class) if self.enabled else None
+        if limit is None:
+            return None
+        if not limit.try_acquire():
+            raise ServiceOverloadedException(retry_after=limit.retry_after())
+        return limit
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            **{name: limit.stats() for name, limit in self.limits.items()},
+        }
+
+def create_admission_controller(
+    enabled: bool = True,
+    credentials_max: int = 32,
+    credentials_target_ms: float = 500,
+    tokens_max: int = 128,
+    tokens_target_ms: float = 100,
+    admin_max: int = 2
+) -> AdmissionController:
+    """Controlador con las clases de auth: credenciales (hash + BD), tokens y admin"""
+    return AdmissionController(
+        {
+            "credentials": AdaptiveLimit("credentials", credentials_max, credentials_target_ms / 1000),
+            "tokens": AdaptiveLimit("tokens", tokens_max, tokens_target_ms / 1000),
+            # Importaciones masivas: concurrencia fija
+            "admin": AdaptiveLimit("admin", admin_max, 60.0, min_limit=admin_max, initial_limit=admin_max),
+        },
+        enabled=enabled
+    )
@@ -0,0 +1,32 @@
+# src/features/auth/infrastructure/services/security/background_poller.py
+import threading
+import time
+from typing import Callable, Optional
+
+def start_poller(
+    app,
+    name: str,
+    interval: float,
+    tick: Callable[[], None],
+    on_error: Optional[Callable[[], None]] = None
+) -> threading.Thread:
+    """Hilo daemon por proceso que ejecuta `tick` cada `interval` segundos
+
+    Cada ejecución abre su propio app context (sesión de base de datos
+    independiente de los requests); un fallo se registra y se reintenta
+    en la siguiente vuelta.
+    """
+    def run() -> None:
+        while True:
+            time.sleep(interval)
+            try:
+                with app.app_context():
+                    tick()
+            except Exception:
+                if on_error:
+                    on_error()
+                app.logger.exception("%s refresh failed", name)
+
+    thread = threading.Thread(target=run, name=name, daemon=True)
+    thread.start()
+    return thread
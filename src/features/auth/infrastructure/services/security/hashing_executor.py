@@ -0,0 +1,132 @@
+import math
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional
+from ....domain.exceptions.auth_exceptions import HashingOverloadedException
+
+class HashingExecutor(Executor):
+    """Pool acotado para hash/verify de passwords con backpressure
+
+    El número de hilos sale del presupuesto de memoria (argon2 reserva
+    `memory_cost` por hash) y de los cores disponibles (cada hash usa
+    `parallelism` hilos). Cuando la cola está llena la petición se rechaza
+    al momento, y si una tarea espera en cola más de `max_wait` segundos
+    se descarta sin ejecutarse: en ambos casos HashingOverloadedException
+    (503 + Retry-After) en lugar de acumular memoria hasta el OOM.
+
+    Las peticiones usan `run()`: esperan como mucho `max_wait`
+    a que la tarea empiece; si sigue en cola se cancela y se rechaza.
+
+    argon2-cffi y bcrypt liberan el GIL, así que basta con hilos.
+    """
+
+    def __init__(
+        self,
+        memory_budget_mb: int = 1024,
+        memory_per_hash_kib: int = 102400,
+        threads_per_hash: int = 1,
+        max_workers: Optional[int] = None,
+        max_queue: int = 64,
+        max_wait: float = 2.0
+    ):
+        by_memory = max(1, (memory_budget_mb * 1024) // max(memory_per_hash_kib, 1))
+        by_cpu = max(1, (os.cpu_count() or 1) // max(threads_per_hash, 1))
+        self.workers = min(by_memory, max_workers or by_cpu)
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.retry_after = max(1, math.ceil(max_wait))
+
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="hashing")
+        self._slots = threading.BoundedSemaphore(self.workers + max_queue)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._stats = {"completed": 0, "rejected": 0, "expired": 0}
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._started = 0
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats["rejected"] += 1
+            raise HashingOverloadedException(retry_after=self.retry_after)
+
+        with self._lock:
+            self._queued += 1
+        try:
+            return self._pool.submit(self._run, time.monotonic(), fn, args, kwargs)
+        except Exception:
+            with self._lock:
+                self._queued -= 1
+            self._slots.release()
+            raise
+
+    def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Ejecutar `fn` en el pool y esperar el resultado (espera en cola acotada por max_wait)"""
+        future = self.submit(fn, *args, **kwargs)
+        try:
+            return future.result(timeout=self.max_wait)
+        except FutureTimeoutError:
+            self._expire(future)
+            # Ya en ejecución: termina en lo que tarda un hash
+            return future.result()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    @property
+    def queue_depth(self) -> int:
+        """Tareas esperando un hilo libre"""
+        with self._lock:
+            return self._queued
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "queue_depth": self._queued,
+                "running": self._running,
+                "avg_wait_ms": round(self._wait_total / self._started * 1000, 2) if self._started else 0.0,
+                "max_wait_ms": round(self._wait_max * 1000, 2),
+                **self._stats,
+            }
+
+    def _expire(self, future: Future) -> None:
+        """Cancelar una tarea que sigue en cola tras max_wait (HashingOverloadedException)"""
+        if not future.cancel():
+            return
+        # Una tarea cancelada no pasa por _run: liberar aquí su hueco
+        with self._lock:
+            self._queued -= 1
+            self._stats["expired"] += 1
+        self._slots.release()
+        raise HashingOverloadedException(retry_after=self.retry_after)
+
+    def _run(self, enqueued_at: float, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        waited = time.monotonic() - enqueued_at
+        with self._lock:
+            self._queued -= 1
+            self._started += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+            expired = waited > self.max_wait
+            if expired:
+                self._stats["expired"] += 1
+            else:
+                self._running += 1
+
+        try:
+            if expired:
+                # El cliente probablemente ya desistió: no gastar CPU ni memoria
+                raise HashingOverloadedException(retry_after=self.retry_after)
+            return fn(*args, **kwargs)
+        finally:
+            if not expired:
+                with self._lock:
+                    self._running -= 1
+                    self._stats["completed"] += 1
+            self._slots.release()
@@ -0,0 +1,151 @@
+import json
+import os
+import statistics
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Mínimos recomendados (OWASP): no bajar de aquí aunque el host sea lento
+MIN_ARGON2_MEMORY_KIB = 19 * 1024
+MIN_ARGON2_TIME_COST = 2
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 16
+MAX_ARGON2_TIME_COST = 10
+
+@dataclass
+class HashingProfile:
+    """Parámetros de coste de hashing calibrados para un tipo de host"""
+    name: str
+    algorithm: str = "argon2"
+    time_cost: int = 2
+    memory_cost: int = 102400  # KiB
+    parallelism: int = 8
+    bcrypt_rounds: int = 12
+    verify_ms: Optional[float] = None
+    cpu_count: Optional[int] = None
+    calibrated_at: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HashingProfile":
+        known = {key: value for key, value in data.items() if key in cls.__dataclass_fields__}
+        return cls(**known)
+
+def load_profiles(path: str) -> Dict[str, HashingProfile]:
+    """Leer los perfiles guardados (vacío si el fichero no existe)"""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        data = json.load(f)
+    return {name: HashingProfile.from_dict({**profile, "name": name}) for name, profile in data.items()}
+
+def load_profile(path: Optional[str], name: Optional[str]) -> Optional[HashingProfile]:
+    """Perfil configurado o None (valores por defecto de PasswordHasher)"""
+    if not name:
+        return None
+    profiles = load_profiles(path)
+    if name not in profiles:
+        raise ValueError(f"Hashing profile '{name}' not found in {path}")
+    return profiles[name]
+
+def save_profile(path: str, profile: HashingProfile) -> None:
+    """Añadir o reemplazar un perfil en el fichero JSON"""
+    profiles = {name: asdict(existing) for name, existing in load_profiles(path).items()}
+    profiles[profile.name] = asdict(profile)
+    for data in profiles.values():
+        data.pop("name", None)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(profiles, f, indent=2, sort_keys=True)
+
+def measure_verify_ms(hash_fn, verify_fn, samples: int = 5) -> float:
+    """Mediana de la latencia de verify (ms) para un hash recién generado"""
+    password = "calibration-Passw0rd!"
+    hashed = hash_fn(password)
+    timings: List[float] = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        verify_fn(hashed, password)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+def calibrate_argon2(
+    name: str,
+    target_ms: float,
+    memory_budget_mb: int,
+    parallelism: Optional[int] = None,
+    samples: int = 5
+) -> HashingProfile:
+    """
+    Elegir parámetros argon2 para este host
+
+    parallelism por defecto usa pocos lanes (los cores se reparten entre
+    peticiones concurrentes). memory_cost = presupuesto / hashes simultáneos
+    (un hash por grupo de `parallelism` cores), y time_cost el mayor cuya
+    verificación no supera `target_ms`.
+    """
+    from argon2 import PasswordHasher as Argon2Hasher
+
+    cpus = os.cpu_count() or 1
+    parallelism = parallelism or max(1, min(4, cpus // 8))
+    concurrent_hashes = max(1, cpus // parallelism)
+    memory_cost = max(MIN_ARGON2_MEMORY_KIB, (memory_budget_mb * 1024) // concurrent_hashes)
+
+    def verify_ms(time_cost: int, memory: int) -> float:
+        hasher = Argon2Hasher(time_cost=time_cost, memory_cost=memory, parallelism=parallelism)
+        return measure_verify_ms(hasher.hash, hasher.verify, samples)
+
+    # Si ni el mínimo de time_cost cabe en el objetivo, reducir memoria
+    time_cost = MIN_ARGON2_TIME_COST
+    latency = verify_ms(time_cost, memory_cost)
+    while latency > target_ms and memory_cost // 2 >= MIN_ARGON2_MEMORY_KIB:
+        memory_cost //= 2
+        latency = verify_ms(time_cost, memory_cost)
+
+    # Subir time_cost mientras el siguiente siga dentro del objetivo
+    while time_cost < MAX_ARGON2_TIME_COST:
+        next_latency = verify_ms(time_cost + 1, memory_cost)
+        if next_latency > target_ms:
+            break
+        time_cost, latency = time_cost + 1, next_latency
+
+    return HashingProfile(
+        name=name,
+        algorithm="argon2",
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+        verify_ms=round(latency, 2),
+        cpu_count=cpus,
+        calibrated_at=datetime.utcnow().isoformat()
+    )
+
+def calibrate_bcrypt(name: str, target_ms: float, samples: int = 3) -> HashingProfile:
+    """Elegir el mayor número de rondas bcrypt dentro de `target_ms`"""
+    import bcrypt
+
+    def verify_ms(rounds: int) -> float:
+        return measure_verify_ms(
+            lambda password: bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds)),
+            lambda hashed, password: bcrypt.checkpw(password.encode(), hashed),
+            samples
+        )
+
+    rounds = MIN_BCRYPT_ROUNDS
+    latency = verify_ms(rounds)
+    # Cada ronda extra duplica el coste: estimar antes de medir
+    while rounds < MAX_BCRYPT_ROUNDS and latency * 2 <= target_ms:
+        rounds += 1
+        latency = verify_ms(rounds)
+
+    return HashingProfile(
+        name=name,
+        algorithm="bcrypt",
+        bcrypt_rounds=rounds,
+        verify_ms=round(latency, 2),
+        cpu_count=os.cpu_count(),
+        calibrated_at=datetime.utcnow().isoformat()
+    )
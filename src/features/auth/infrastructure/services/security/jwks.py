@@ -0,0 +1,152 @@
+# src/features/auth/infrastructure/services/security/jwks.py
+import threading
+import time
+import urllib.request
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+import orjson
+from ....domain.exceptions.auth_exceptions import InvalidTokenException
+from .jwt_codecs import (
+    ASYMMETRIC_ALGORITHMS, JWTVerifier, asymmetric_verify, load_claims, split_token, _b64decode, _b64encode
+)
+
+def public_jwk(kid: str, algorithm: str, public_key: Any) -> Dict[str, str]:
+    """Clave pública en formato JWK (RFC 7517/8037)"""
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+    from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+    jwk = {"kid": kid, "alg": algorithm, "use": "sig"}
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        raw = public_key.public_bytes(Encoding.Raw, PublicFormat.Raw)
+        jwk.update({"kty": "OKP", "crv": "Ed25519", "x": _b64encode(raw).decode()})
+    elif isinstance(public_key, rsa.RSAPublicKey):
+        numbers = public_key.public_numbers()
+        jwk.update({"kty": "RSA", "n": _int_to_b64(numbers.n), "e": _int_to_b64(numbers.e)})
+    elif isinstance(public_key, ec.EllipticCurvePublicKey):
+        numbers = public_key.public_numbers()
+        jwk.update({"kty": "EC", "crv": "P-256", "x": _int_to_b64(numbers.x, 32), "y": _int_to_b64(numbers.y, 32)})
+    else:
+        raise ValueError(f"Unsupported public key: {type(public_key).__name__}")
+    return jwk
+
+def load_jwk(jwk: Dict[str, Any]) -> Any:
+    """Clave pública de `cryptography` a partir de un JWK"""
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+    kty = jwk.get("kty")
+    if kty == "OKP" and jwk.get("crv") == "Ed25519":
+        return ed25519.Ed25519PublicKey.from_public_bytes(_b64decode(jwk["x"]))
+    if kty == "RSA":
+        return rsa.RSAPublicNumbers(_b64_to_int(jwk["e"]), _b64_to_int(jwk["n"])).public_key()
+    if kty == "EC" and jwk.get("crv") == "P-256":
+        return ec.EllipticCurvePublicNumbers(
+            _b64_to_int(jwk["x"]), _b64_to_int(jwk["y"]), ec.SECP256R1()
+        ).public_key()
+    raise ValueError(f"Unsupported JWK: kty={kty} crv={jwk.get('crv')}")
+
+class JWKSVerifier(JWTVerifier):
+    """Verificación local de tokens firmados con claves publicadas en un JWKS
+
+    Las claves públicas se parsean una sola vez y se guardan por `kid`.
+    El JWKS se vuelve a pedir cuando caduca (`ttl`) o cuando llega un `kid`
+    desconocido (rotación), como mucho una vez cada `min_refresh_interval`
+    segundos para que tokens con kids inventados no generen tráfico. Si la
+    recarga falla se siguen usando las claves conocidas.
+
+    Solo verifica (no tiene claves privadas). Con JWTVerificationService
+    aplica las mismas reglas de claims que esta app en otros servicios:
+
+        verifier = JWKSVerifier.from_url("https://auth/api/v1/auth/.well-known/jwks.json")
+        tokens = JWTVerificationService(verifier, issuer, audience)
+    """
+
+    def __init__(
+        self,
+        fetch_jwks: Callable[[], Dict[str, Any]],
+        ttl: float = 300.0,
+        min_refresh_interval: float = 10.0,
+        algorithms: Iterable[str] = ASYMMETRIC_ALGORITHMS
+    ):
+        self.fetch_jwks = fetch_jwks
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.algorithms = frozenset(algorithms)
+        self.algorithm = ",".join(sorted(self.algorithms))
+        self._keys: Dict[str, Tuple[str, Any]] = {}
+        self._fetched_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 5.0, **kwargs) -> "JWKSVerifier":
+        """Verificador para otro servicio: JWKS por HTTP"""
+        def fetch() -> Dict[str, Any]:
+            with urllib.request.urlopen(url, timeout=timeout) as response:
+                return orjson.loads(response.read())
+        return cls(fetch, **kwargs)
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        header, signing_input, payload_segment, signature = split_token(token)
+        algorithm = header.get("alg")
+        kid = header.get("kid")
+        if algorithm not in self.algorithms or not isinstance(kid, str):
+            raise InvalidTokenException()
+
+        key = self.get_key(kid)
+        # El algoritmo lo fija la clave, no la cabecera del token
+        if key is None or key[0] != algorithm:
+            raise InvalidTokenException()
+        if not asymmetric_verify(key[1], algorithm, signing_input, signature):
+            raise InvalidTokenException()
+        return load_claims(payload_segment)
+
+    def get_key(self, kid: str) -> Optional[Tuple[str, Any]]:
+        """(algoritmo, clave pública) del kid, recargando el JWKS si hace falta"""
+        now = time.monotonic()
+        stale = self._fetched_at is None or now - self._fetched_at > self.ttl
+        key = self._keys.get(kid)
+        if key is not None and not stale:
+            return key
+
+        can_refresh = self._fetched_at is None or now - self._fetched_at > self.min_refresh_interval
+        if stale or can_refresh:
+            self.refresh()
+        return self._keys.get(kid)
+
+    def refresh(self) -> None:
+        with self._lock:
+            try:
+                jwks = self.fetch_jwks()
+            except Exception:
+                # Sin JWKS nuevo: mantener las claves conocidas y reintentar más tarde
+                self._fetched_at = time.monotonic()
+                return
+
+            keys: Dict[str, Tuple[str, Any]] = {}
+            for jwk in jwks.get("keys", []):
+                kid, algorithm = jwk.get("kid"), jwk.get("alg")
+                if not kid or algorithm not in self.algorithms or jwk.get("use", "sig") != "sig":
+                    continue
+                # Reutilizar las claves ya parseadas
+                known = self._keys.get(kid)
+                if known is not None and known[0] == algorithm:
+                    keys[kid] = known
+                    continue
+                try:
+                    keys[kid] = (algorithm, load_jwk(jwk))
+                except (KeyError, ValueError):
+                    continue
+
+            self._keys = keys
+            self._fetched_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "kids": sorted(self._keys),
+            "age_seconds": round(time.monotonic() - self._fetched_at, 1) if self._fetched_at else None,
+        }
+
+def _int_to_b64(value: int, length: Optional[int] = None) -> str:
+    length = length or max(1, (value.bit_length() + 7) // 8)
+    return _b64encode(value.to_bytes(length, "big")).decode()
+
+def _b64_to_int(value: str) -> int:
+    return int.from_bytes(_b64decode(value), "big")
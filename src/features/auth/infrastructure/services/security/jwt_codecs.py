@@ -0,0 +1,237 @@
+# src/features/auth/infrastructure/services/security/jwt_codecs.py
+import base64
+import hashlib
+import hmac
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+import orjson
+from ....domain.exceptions.auth_exceptions import InvalidTokenException
+
+HMAC_ALGORITHMS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+# Firmas asimétricas: cualquiera puede verificar con la clave pública (JWKS)
+# jose y cryptography se importan en el primer uso: con HS* (HMACCodec) no se cargan
+ASYMMETRIC_ALGORITHMS = ("EdDSA", "RS256", "ES256")
+
+class JWTVerifier(ABC):
+    """Verificación de la serialización compacta JWS (sin poder firmar)
+
+    Solo se ocupa de cabecera, firma y JSON de los claims; la validación
+    de claims (exp, nbf, iss, aud, type...) la hace JWTVerificationService
+    para que sea idéntica con cualquier backend.
+    """
+
+    algorithm: str
+
+    @abstractmethod
+    def decode(self, token: str) -> Dict[str, Any]:
+        """Verificar la firma y devolver los claims (InvalidTokenException si no es válido)"""
+        pass
+
+    def decode_unverified(self, token: str) -> Dict[str, Any]:
+        """Claims sin verificar la firma"""
+        try:
+            claims = orjson.loads(_b64decode(token.split(".")[1]))
+        except (IndexError, ValueError, orjson.JSONDecodeError):
+            raise InvalidTokenException()
+        if not isinstance(claims, dict):
+            raise InvalidTokenException()
+        return claims
+
+class JWTCodec(JWTVerifier):
+    """Verificador que además firma (clave privada o secreto compartido)"""
+
+    @abstractmethod
+    def encode(self, claims: Dict[str, Any]) -> str:
+        """Serializar y firmar los claims (valores ya JSON-compatibles)"""
+        pass
+
+class JoseCodec(JWTCodec):
+    """Backend python-jose (cualquier algoritmo soportado por jose)"""
+
+    def __init__(self, key: Any, algorithm: str = "HS256", kid: Optional[str] = None):
+        self.key = key
+        self.algorithm = algorithm
+        self.headers = {"kid": kid} if kid else None
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        from jose import jws
+        return jws.sign(claims, self.key, headers=self.headers, algorithm=self.algorithm)
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        from jose import jws
+        from jose.exceptions import JOSEError
+        try:
+            payload = jws.verify(token, self.key, [self.algorithm])
+            claims = orjson.loads(payload)
+        except (JOSEError, orjson.JSONDecodeError):
+            raise InvalidTokenException()
+        if not isinstance(claims, dict):
+            raise InvalidTokenException()
+        return claims
+
+class HMACCodec(JWTCodec):
+    """Camino rápido HS256/HS384/HS512
+
+    - El objeto HMAC con la clave se crea una vez y se copia por token
+      (sin volver a derivar los bloques ipad/opad de la clave)
+    - La cabecera codificada se calcula una vez por algoritmo/kid; al
+      verificar, una cabecera idéntica se acepta sin parsear JSON
+    - Claims con orjson
+    """
+
+    def __init__(self, key: str, algorithm: str = "HS256", kid: Optional[str] = None):
+        if algorithm not in HMAC_ALGORITHMS:
+            raise ValueError(f"HMACCodec does not support {algorithm}")
+
+        self.algorithm = algorithm
+        self.kid = kid
+        key_bytes = key.encode() if isinstance(key, str) else key
+        self._mac = hmac.new(key_bytes, digestmod=HMAC_ALGORITHMS[algorithm])
+
+        header = {"alg": algorithm, "typ": "JWT"}
+        if kid:
+            header["kid"] = kid
+        self._header_segment = _b64encode(orjson.dumps(header, option=orjson.OPT_SORT_KEYS))
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        signing_input = self._header_segment + b"." + _b64encode(orjson.dumps(claims))
+        return (signing_input + b"." + _b64encode(self._sign(signing_input))).decode()
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        try:
+            signing_input, signature_segment = token.encode().rsplit(b".", 1)
+            header_segment, payload_segment = signing_input.split(b".")
+            signature = _b64decode(signature_segment)
+        except ValueError:
+            raise InvalidTokenException()
+
+        if header_segment != self._header_segment:
+            self._check_header(header_segment)
+
+        if not hmac.compare_digest(self._sign(signing_input), signature):
+            raise InvalidTokenException()
+
+        try:
+            claims = orjson.loads(_b64decode(payload_segment))
+        except (ValueError, orjson.JSONDecodeError):
+            raise InvalidTokenException()
+        if not isinstance(claims, dict):
+            raise InvalidTokenException()
+        return claims
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def _check_header(self, header_segment: bytes) -> None:
+        # Cabecera distinta a la propia (otro orden de campos, otro emisor):
+        # solo se acepta si declara el mismo algoritmo
+        try:
+            header = orjson.loads(_b64decode(header_segment))
+        except (ValueError, orjson.JSONDecodeError):
+            raise InvalidTokenException()
+        if not isinstance(header, dict) or header.get("alg") != self.algorithm:
+            raise InvalidTokenException()
+
+def create_codec(
+    backend: str,
+    key: Any,
+    algorithm: str = "HS256",
+    kid: Optional[str] = None,
+    key_ring: Any = None
+) -> JWTCodec:
+    """
+    Crear el codec configurado (JWT_CODEC)
+
+    Args:
+        backend: "auto" (HMAC rápido si el algoritmo es HS*, si no jose), "hmac" o "jose"
+        key_ring: KeyRing para EdDSA/RS256/ES256 (claves rotadas con kid)
+    """
+    if algorithm in ASYMMETRIC_ALGORITHMS:
+        if key_ring is None:
+            raise ValueError(f"{algorithm} requires a key ring (JWT_KEYS_FILE)")
+        return key_ring.codec()
+    if backend == "jose":
+        return JoseCodec(key, algorithm, kid)
+    if backend == "hmac" or (backend == "auto" and algorithm in HMAC_ALGORITHMS):
+        return HMACCodec(key, algorithm, kid)
+    if backend == "auto":
+        return JoseCodec(key, algorithm, kid)
+    raise ValueError(f"Unsupported JWT codec: {backend}")
+
+def asymmetric_sign(private_key: Any, algorithm: str, signing_input: bytes) -> bytes:
+    """Firma JWS (ES256 en formato r||s, no DER)"""
+    if algorithm == "EdDSA":
+        return private_key.sign(signing_input)
+
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec, padding
+    from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+    if algorithm == "RS256":
+        return private_key.sign(signing_input, padding.PKCS1v15(), hashes.SHA256())
+    if algorithm == "ES256":
+        r, s = decode_dss_signature(private_key.sign(signing_input, ec.ECDSA(hashes.SHA256())))
+        return r.to_bytes(32, "big") + s.to_bytes(32, "big")
+    raise ValueError(f"Unsupported algorithm: {algorithm}")
+
+def asymmetric_verify(public_key: Any, algorithm: str, signing_input: bytes, signature: bytes) -> bool:
+    """Comprobar una firma JWS con la clave pública del algoritmo indicado"""
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, padding, rsa
+    from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+
+    try:
+        if algorithm == "EdDSA" and isinstance(public_key, ed25519.Ed25519PublicKey):
+            public_key.verify(signature, signing_input)
+        elif algorithm == "RS256" and isinstance(public_key, rsa.RSAPublicKey):
+            public_key.verify(signature, signing_input, padding.PKCS1v15(), hashes.SHA256())
+        elif algorithm == "ES256" and isinstance(public_key, ec.EllipticCurvePublicKey):
+            if len(signature) != 64:
+                return False
+            der = encode_dss_signature(
+                int.from_bytes(signature[:32], "big"),
+                int.from_bytes(signature[32:], "big")
+            )
+            public_key.verify(der, signing_input, ec.ECDSA(hashes.SHA256()))
+        else:
+            return False
+    except InvalidSignature:
+        return False
+    return True
+
+def split_token(token: str):
+    """(cabecera, signing_input, payload_segment, firma) de un JWS compacto"""
+    try:
+        signing_input, signature_segment = token.encode().rsplit(b".", 1)
+        header_segment, payload_segment = signing_input.split(b".")
+        header = orjson.loads(_b64decode(header_segment))
+        signature = _b64decode(signature_segment)
+    except (ValueError, orjson.JSONDecodeError):
+        raise InvalidTokenException()
+    if not isinstance(header, dict):
+        raise InvalidTokenException()
+    return header, signing_input, payload_segment, signature
+
+def load_claims(payload_segment: bytes) -> Dict[str, Any]:
+    try:
+        claims = orjson.loads(_b64decode(payload_segment))
+    except (ValueError, orjson.JSONDecodeError):
+        raise InvalidTokenException()
+    if not isinstance(claims, dict):
+        raise InvalidTokenException()
+    return claims
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+def _b64decode(data) -> bytes:
+    if isinstance(data, str):
+        data = data.encode()
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
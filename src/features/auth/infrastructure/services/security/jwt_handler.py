@@ -1,98 +1,97 @@
 # src/features/auth/infrastructure/services/security/jwt_handler.py
+import uuid
+from calendar import timegm
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
-from jose import JWTError, jwt
-from jose.exceptions import JWTError, ExpiredSignatureError
 from ....application.interfaces.services.token_service import ITokenService
+from ....domain.exceptions.auth_exceptions import InvalidTokenException, TokenExpiredException
+from .jwt_codecs import JWTCodec, JWTVerifier, create_codec
+from .token_cache import VerifiedTokenCache
 
-class JWTService(ITokenService):
-    """Implementación del servicio de tokens JWT usando python-jose"""
+class JWTVerificationService:
+    """Verificación de tokens JWT: firma (JWTVerifier) + claims
+    
+    Los claims se validan aquí con las mismas reglas que python-jose. Sin
+    codec de firma: otros servicios la usan con un JWKSVerifier.
+    """
     
     def __init__(
         self,
-        secret_key: str,
-        algorithm: str = "HS256",
+        verifier: JWTVerifier,
         issuer: Optional[str] = None,
-        audience: Optional[str] = None
+        audience: Optional[str] = None,
+        token_cache: Optional[VerifiedTokenCache] = None
     ):
-        self.secret_key = secret_key
-        self.algorithm = algorithm
+        self.verifier = verifier
         self.issuer = issuer
         self.audience = audience
+        self.token_cache = token_cache
     
-    def create_access_token(self, data: Dict[str, Any], expires_in: int = 900) -> str:
-        """Crear access token JWT"""
-        to_encode = data.copy()
+    def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """Verificar y decodificar token"""
+        if self.token_cache is not None:
+            # Entradas verificadas que caducan en su exp: no hace falta revalidar
+            payload = self.token_cache.get(token)
+            if payload is not None:
+                return payload
         
-        # Agregar claims estándar
-        now = datetime.utcnow()
-        expire = now + timedelta(seconds=expires_in)
+        try:
+            payload = self.verifier.decode(token)
+            self._validate_claims(payload)
+        except (InvalidTokenException, TokenExpiredException):
+            return None
         
-        to_encode.update({
-            "exp": expire,
-            "iat": now,
-            "nbf": now,
-            "type": "access"
-        })
+        if self.token_cache is not None:
+            self.token_cache.set(token, payload)
+        return payload
+    
+    def invalidate_token(self, token: str) -> None:
+        """Olvidar la verificación cacheada de un token (revocación)"""
+        if self.token_cache is not None:
+            self.token_cache.invalidate(token)
+    
+    def invalidate_subject(self, user_id: str) -> None:
+        """Olvidar las verificaciones cacheadas de un usuario"""
+        if self.token_cache is not None:
+            self.token_cache.invalidate_where(lambda payload: payload.get("sub") == user_id)
+    
+    def _validate_claims(self, claims: Dict[str, Any]) -> None:
+        """Mismas reglas que jose.jwt.decode con verify_iss/verify_aud según configuración"""
+        now = _numeric_date(datetime.utcnow())
         
-        if self.issuer:
-            to_encode["iss"] = self.issuer
-        if self.audience:
-            to_encode["aud"] = self.audience
+        for claim in ("iat", "nbf", "exp"):
+            if claim in claims and not _is_integer(claims[claim]):
+                raise InvalidTokenException(f"Invalid {claim} claim")
         
-        return jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-    
-    def create_refresh_token(self, data: Dict[str, Any], expires_in: int = 2592000) -> str:
-        """Crear refresh token JWT"""
-        to_encode = data.copy()
+        if "nbf" in claims and int(claims["nbf"]) > now:
+            raise InvalidTokenException("The token is not yet valid (nbf)")
         
-        now = datetime.utcnow()
-        expire = now + timedelta(seconds=expires_in)
+        if "exp" in claims and int(claims["exp"]) < now:
+            raise TokenExpiredException()
         
-        to_encode.update({
-            "exp": expire,
-            "iat": now,
-            "nbf": now,
-            "type": "refresh"
-        })
+        if self.audience and "aud" in claims:
+            audience_claims = claims["aud"]
+            if isinstance(audience_claims, str):
+                audience_claims = [audience_claims]
+            if not isinstance(audience_claims, list) or any(not isinstance(c, str) for c in audience_claims):
+                raise InvalidTokenException("Invalid claim format in token")
+            if self.audience not in audience_claims:
+                raise InvalidTokenException("Invalid audience")
         
-        if self.issuer:
-            to_encode["iss"] = self.issuer
-        if self.audience:
-            to_encode["aud"] = self.audience
+        if self.issuer and claims.get("iss") != self.issuer:
+            raise InvalidTokenException("Invalid issuer")
         
-        return jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-    
-    def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
-        """Verificar y decodificar token"""
-        try:
-            payload = jwt.decode(
-                token,
-                self.secret_key,
-                algorithms=[self.algorithm],
-                issuer=self.issuer,
-                audience=self.audience,
-                options={
-                    "verify_exp": True,
-                    "verify_iss": bool(self.issuer),
-                    "verify_aud": bool(self.audience),
-                    "verify_signature": True
-                }
-            )
-            return payload
-        except (JWTError, ExpiredSignatureError):
-            return None
+        if "sub" in claims and not isinstance(claims["sub"], str):
+            raise InvalidTokenException("Subject must be a string")
+        
+        if "jti" in claims and not isinstance(claims["jti"], str):
+            raise InvalidTokenException("JWT ID must be a string")
     
     def decode_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Decodificar token sin verificar"""
         try:
-            return jwt.decode(
-                token,
-                self.secret_key,
-                algorithms=[self.algorithm],
-                options={"verify_signature": False}
-            )
-        except JWTError:
+            return self.verifier.decode_unverified(token)
+        except InvalidTokenException:
             return None
     
     def is_token_expired(self, token: str) -> bool:
@@ -109,4 +108,66 @@ class JWTService(ITokenService):
         payload = self.decode_token(token)
         if payload and "exp" in payload:
             return datetime.fromtimestamp(payload["exp"])
-        return None
\ No newline at end of file
+        return None
+
+class JWTService(JWTVerificationService, ITokenService):
+    """Implementación del servicio de tokens JWT
+    
+    La firma la hace un codec intercambiable (JWT_CODEC): HMAC rápido
+    para HS256/384/512, python-jose o el KeyRing (EdDSA/RS256/ES256).
+    """
+    
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str = "HS256",
+        issuer: Optional[str] = None,
+        audience: Optional[str] = None,
+        codec: Optional[JWTCodec] = None,
+        token_cache: Optional[VerifiedTokenCache] = None
+    ):
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self.codec = codec or create_codec("auto", secret_key, algorithm)
+        super().__init__(self.codec, issuer, audience, token_cache)
+    
+    def create_access_token(self, data: Dict[str, Any], expires_in: int = 900) -> str:
+        """Crear access token JWT"""
+        return self.codec.encode(self._claims(data, expires_in, "access"))
+    
+    def create_refresh_token(self, data: Dict[str, Any], expires_in: int = 2592000) -> str:
+        """Crear refresh token JWT"""
+        return self.codec.encode(self._claims(data, expires_in, "refresh"))
+    
+    def _claims(self, data: Dict[str, Any], expires_in: int, token_type: str) -> Dict[str, Any]:
+        to_encode = data.copy()
+        
+        # Agregar claims estándar (NumericDate, como python-jose)
+        now = datetime.utcnow()
+        expire = now + timedelta(seconds=expires_in)
+        
+        to_encode.update({
+            "exp": _numeric_date(expire),
+            "iat": _numeric_date(now),
+            "nbf": _numeric_date(now),
+            "type": token_type
+        })
+        # Identificador único: permite revocar un token concreto (denylist)
+        to_encode.setdefault("jti", uuid.uuid4().hex)
+        
+        if self.issuer:
+            to_encode["iss"] = self.issuer
+        if self.audience:
+            to_encode["aud"] = self.audience
+        
+        return to_encode
+
+def _numeric_date(value: datetime) -> int:
+    return timegm(value.utctimetuple())
+
+def _is_integer(value: Any) -> bool:
+    try:
+        int(value)
+        return True
+    except (TypeError, ValueError):
+        return False
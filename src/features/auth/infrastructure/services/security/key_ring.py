@@ -0,0 +1,240 @@
+# src/features/auth/infrastructure/services/security/key_ring.py
+import json
+import os
+import secrets
+import threading
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import orjson
+from .jwks import JWKSVerifier, public_jwk
+from .jwt_codecs import ASYMMETRIC_ALGORITHMS, JWTCodec, asymmetric_sign, _b64encode
+
+@dataclass
+class SigningKey:
+    """Clave privada de firma con su calendario de rotación (epoch en segundos)"""
+    kid: str
+    algorithm: str
+    private_key_pem: str
+    created_at: float
+    activates_at: float
+    retired_at: Optional[float] = None
+    expires_at: Optional[float] = None
+
+    @classmethod
+    def generate(cls, algorithm: str, activates_at: Optional[float] = None) -> "SigningKey":
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+        if algorithm == "EdDSA":
+            private_key = ed25519.Ed25519PrivateKey.generate()
+        elif algorithm == "RS256":
+            private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        elif algorithm == "ES256":
+            private_key = ec.generate_private_key(ec.SECP256R1())
+        else:
+            raise ValueError(f"Unsupported signing algorithm: {algorithm}")
+
+        now = time.time()
+        pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        ).decode()
+        kid = f"{datetime.utcnow():%Y%m%d}-{secrets.token_hex(4)}"
+        return cls(kid, algorithm, pem, created_at=now, activates_at=activates_at or now)
+
+    def load_private_key(self) -> Any:
+        from cryptography.hazmat.primitives import serialization
+        return serialization.load_pem_private_key(self.private_key_pem.encode(), password=None)
+
+class KeyRing:
+    """Claves de firma asimétricas (EdDSA/RS256/ES256) identificadas por kid
+
+    Calendario de rotación:
+    - Una clave nueva se publica en el JWKS `publish_ahead` segundos antes
+      de empezar a firmar con ella, para que las cachés de JWKS de otros
+      servicios ya la conozcan cuando lleguen los primeros tokens
+    - La clave anterior deja de firmar en ese momento pero se sigue
+      publicando `retain` segundos (vida máxima de un token) y después se
+      elimina del fichero
+
+    El fichero (JSON, permisos 0600) es compartido por todos los workers;
+    se relee cuando cambia, como mucho cada `reload_interval` segundos.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        algorithm: str = "EdDSA",
+        publish_ahead: float = 600,
+        retain: float = 2592000,
+        reload_interval: float = 5.0
+    ):
+        if algorithm not in ASYMMETRIC_ALGORITHMS:
+            raise ValueError(f"Unsupported signing algorithm: {algorithm}")
+
+        self.path = path
+        self.algorithm = algorithm
+        self.publish_ahead = publish_ahead
+        self.retain = retain
+        self.reload_interval = reload_interval
+        self._keys: List[SigningKey] = []
+        self._private_keys: Dict[str, Any] = {}
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._load()
+        if not self._keys:
+            self._create_first_key()
+
+    def signing_key(self) -> Tuple[str, str, Any]:
+        """(kid, algoritmo, clave privada) con la que firmar ahora"""
+        self._maybe_reload()
+        now = time.time()
+        active = [
+            key for key in self._keys
+            if key.activates_at <= now and (key.retired_at is None or key.retired_at > now)
+        ]
+        if not active:
+            # Solo hay claves aún no activas: usar la más nueva
+            active = self._keys
+        key = max(active, key=lambda k: k.activates_at)
+        return key.kid, key.algorithm, self._private_key(key)
+
+    def jwks(self) -> Dict[str, Any]:
+        """Claves públicas vigentes (activas, pre-publicadas y en retención)"""
+        self._maybe_reload()
+        now = time.time()
+        return {
+            "keys": [
+                public_jwk(key.kid, key.algorithm, self._private_key(key).public_key())
+                for key in self._keys
+                if key.expires_at is None or key.expires_at > now
+            ]
+        }
+
+    def rotate(self, algorithm: Optional[str] = None) -> SigningKey:
+        """Generar la siguiente clave, retirar la actual y purgar las caducadas"""
+        with self._lock:
+            self._load()
+            now = time.time()
+            new_key = SigningKey.generate(algorithm or self.algorithm, activates_at=now + self.publish_ahead)
+
+            for key in self._keys:
+                if key.retired_at is None:
+                    key.retired_at = new_key.activates_at
+                    key.expires_at = new_key.activates_at + self.retain
+
+            self._keys = [key for key in self._keys if key.expires_at is None or key.expires_at > now]
+            self._keys.append(new_key)
+            self._save()
+            return new_key
+
+    def due_for_rotation(self, max_age: float) -> bool:
+        """La clave más nueva tiene más de `max_age` segundos"""
+        self._maybe_reload()
+        newest = max(self._keys, key=lambda k: k.created_at)
+        return time.time() - newest.created_at >= max_age
+
+    def keys(self) -> List[SigningKey]:
+        self._maybe_reload()
+        return list(self._keys)
+
+    def codec(self) -> "KeyRingCodec":
+        return KeyRingCodec(self)
+
+    def _private_key(self, key: SigningKey) -> Any:
+        private_key = self._private_keys.get(key.kid)
+        if private_key is None:
+            private_key = self._private_keys[key.kid] = key.load_private_key()
+        return private_key
+
+    def _maybe_reload(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self.reload_interval:
+            return
+        self._checked_at = now
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except FileNotFoundError:
+            return
+        if mtime != self._mtime:
+            with self._lock:
+                self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path) as f:
+                self._mtime = os.fstat(f.fileno()).st_mtime
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        self._keys = [SigningKey(**key) for key in data.get("keys", [])]
+        kids = {key.kid for key in self._keys}
+        self._private_keys = {kid: key for kid, key in self._private_keys.items() if kid in kids}
+
+    def _create_first_key(self) -> None:
+        # Si varios workers arrancan a la vez, os.link solo lo gana uno y el resto lee su clave
+        tmp_path = self._write_tmp([SigningKey.generate(self.algorithm)])
+        try:
+            os.link(tmp_path, self.path)
+        except FileExistsError:
+            pass
+        finally:
+            os.unlink(tmp_path)
+        self._load()
+
+    def _save(self) -> None:
+        os.replace(self._write_tmp(self._keys), self.path)
+        self._mtime = os.stat(self.path).st_mtime
+
+    def _write_tmp(self, keys: List[SigningKey]) -> str:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"keys": [asdict(key) for key in keys]}, f, indent=2)
+        return tmp_path
+
+class KeyRingCodec(JWTCodec):
+    """Firma con la clave activa del KeyRing (cabecera con kid) y verifica
+    con un JWKSVerifier alimentado por el propio KeyRing (sin red)"""
+
+    def __init__(self, key_ring: KeyRing):
+        self.key_ring = key_ring
+        self.algorithm = key_ring.algorithm
+        self.verifier = JWKSVerifier(
+            key_ring.jwks,
+            ttl=key_ring.reload_interval,
+            min_refresh_interval=key_ring.reload_interval
+        )
+        self._header_segments: Dict[str, bytes] = {}
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        kid, algorithm, private_key = self.key_ring.signing_key()
+        header_segment = self._header_segments.get(kid)
+        if header_segment is None:
+            header = {"alg": algorithm, "kid": kid, "typ": "JWT"}
+            header_segment = self._header_segments[kid] = _b64encode(orjson.dumps(header))
+
+        signing_input = header_segment + b"." + _b64encode(orjson.dumps(claims))
+        signature = asymmetric_sign(private_key, algorithm, signing_input)
+        return (signing_input + b"." + _b64encode(signature)).decode()
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        return self.verifier.decode(token)
+
+def create_key_ring(
+    path: str,
+    algorithm: str,
+    publish_ahead: float = 600,
+    retain: float = 2592000
+) -> Optional[KeyRing]:
+    """KeyRing para algoritmos asimétricos; None con HS256/384/512 (secreto compartido)"""
+    if algorithm not in ASYMMETRIC_ALGORITHMS:
+        return None
+    return KeyRing(path, algorithm, publish_ahead, retain)
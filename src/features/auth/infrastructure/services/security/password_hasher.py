@@ -1,22 +1,35 @@
-import bcrypt
-from argon2 import PasswordHasher as Argon2Hasher
-from argon2.exceptions import VerifyMismatchError, InvalidHashError
-from typing import Tuple
+from functools import cached_property
+from typing import Optional, Tuple
+from .hashing_profile import HashingProfile
 import os
 
 class PasswordHasher:
-    """Servicio para hashing y verificación de passwords"""
+    """Servicio para hashing y verificación de passwords
+
+    argon2 y bcrypt se importan en el primer uso, no al arrancar la app.
+    """
+    
+    # Formatos de hash que entiende verify()
+    SUPPORTED_HASH_PREFIXES = ("$2b$", "$2a$", "$argon2")
     
-    def __init__(self, algorithm: str = "argon2"):
-        self.algorithm = algorithm
-        if algorithm == "argon2":
-            self.argon2_hasher = Argon2Hasher(
-                time_cost=2,
-                memory_cost=102400,
-                parallelism=8,
-                hash_len=32,
-                salt_len=16
-            )
+    def __init__(self, algorithm: str = "argon2", profile: Optional[HashingProfile] = None):
+        # Un perfil calibrado (flask auth calibrate-hashing) fija algoritmo y costes
+        self.profile = profile or HashingProfile(name="default", algorithm=algorithm)
+        self.algorithm = self.profile.algorithm
+        self.bcrypt_rounds = self.profile.bcrypt_rounds
+    
+    @cached_property
+    def argon2_hasher(self):
+        """Hasher argon2 (se importa en el primer hash/verify, también con
+        algoritmo bcrypt: verify() debe aceptar hashes argon2 existentes)"""
+        from argon2 import PasswordHasher as Argon2Hasher
+        return Argon2Hasher(
+            time_cost=self.profile.time_cost,
+            memory_cost=self.profile.memory_cost,
+            parallelism=self.profile.parallelism,
+            hash_len=32,
+            salt_len=16
+        )
     
     def hash(self, password: str) -> Tuple[str, str]:
         """
@@ -26,7 +39,8 @@ class PasswordHasher:
             Tuple[str, str]: (hashed_password, algorithm_used)
         """
         if self.algorithm == "bcrypt":
-            salt = bcrypt.gensalt()
+            import bcrypt
+            salt = bcrypt.gensalt(self.bcrypt_rounds)
             hashed = bcrypt.hashpw(password.encode(), salt)
             return hashed.decode(), "bcrypt"
         
@@ -49,15 +63,16 @@ class PasswordHasher:
             bool: True si el password es válido
         """
         # Detectar algoritmo por el formato del hash
-        if hashed_password.startswith("$2b$") or hashed_password.startswith("$2a$"):
-            # bcrypt
+        scheme = self.detect_scheme(hashed_password)
+        if scheme == "bcrypt":
+            import bcrypt
             try:
                 return bcrypt.checkpw(password.encode(), hashed_password.encode())
             except ValueError:
                 return False
         
-        elif hashed_password.startswith("$argon2"):
-            # argon2
+        elif scheme == "argon2":
+            from argon2.exceptions import VerifyMismatchError, InvalidHashError
             try:
                 self.argon2_hasher.verify(hashed_password, password)
                 return True
@@ -68,15 +83,65 @@ class PasswordHasher:
             # Hash desconocido
             return False
     
+    @property
+    def memory_cost_kib(self) -> int:
+        """Memoria aproximada de un hash (KiB), para dimensionar el pool de hashing"""
+        if self.algorithm == "argon2":
+            return self.profile.memory_cost
+        return 4  # bcrypt: ~4 KiB de estado
+    
+    @property
+    def threads_per_hash(self) -> int:
+        """Hilos que usa un hash (lanes de argon2)"""
+        if self.algorithm == "argon2":
+            return self.profile.parallelism
+        return 1
+    
+    @classmethod
+    def is_supported_hash(cls, hashed_password: str) -> bool:
+        """Comprobar si un hash existente (p. ej. importado) es verificable"""
+        return hashed_password.startswith(cls.SUPPORTED_HASH_PREFIXES)
+    
+    @staticmethod
+    def detect_scheme(hashed_password: str) -> Optional[str]:
+        """Algoritmo de un hash almacenado según su prefijo ("bcrypt", "argon2" o None)"""
+        if hashed_password.startswith("$2b$") or hashed_password.startswith("$2a$"):
+            return "bcrypt"
+        if hashed_password.startswith("$argon2"):
+            return "argon2"
+        return None
+    
+    @classmethod
+    def hash_scheme(cls, hashed_password: str) -> str:
+        """Esquema y parámetros de un hash (p. ej. argon2id v=19 m=65536,t=3,p=4)"""
+        scheme = cls.detect_scheme(hashed_password)
+        parts = hashed_password.split("$")
+        if scheme == "bcrypt" and len(parts) > 3:
+            return f"bcrypt ${parts[1]}$ rounds={parts[2]}"
+        if scheme == "argon2" and len(parts) > 4:
+            return " ".join(parts[1:4])
+        return "unknown"
+    
     def needs_rehash(self, hashed_password: str) -> bool:
         """
-        Verificar si necesita re-hash (para migración de algoritmos)
+        Verificar si necesita re-hash (otro algoritmo o costes distintos de la política)
+        
+        Un hash del algoritmo actual cuyos parámetros no se pueden leer
+        (legado o malformado) también se re-hashea.
         """
-        if self.algorithm == "argon2":
-            return self.argon2_hasher.check_needs_rehash(hashed_password)
+        scheme = self.detect_scheme(hashed_password)
+        if scheme != self.algorithm:
+            return scheme is not None
         
-        # Para bcrypt, siempre retornar False (no tiene método de verificación)
-        return False
+        try:
+            if scheme == "argon2":
+                return self.argon2_hasher.check_needs_rehash(hashed_password)
+            
+            # bcrypt: "$2b$<rounds>$..."; $2a$ se migra a $2b$
+            parts = hashed_password.split("$")
+            return parts[1] != "2b" or int(parts[2]) != self.bcrypt_rounds
+        except (IndexError, ValueError):
+            return True
     
     def generate_salt(self) -> str:
         """Generar sal aleatoria"""
@@ -0,0 +1,84 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+from flask import current_app, has_app_context
+from ....domain.exceptions.auth_exceptions import HashingOverloadedException
+from .hashing_executor import HashingExecutor
+from .password_hasher import PasswordHasher
+
+class PasswordRehasher:
+    """Actualización en segundo plano de hashes antiguos tras un login correcto
+
+    El hash nuevo se calcula en el pool de hashing (solo si no hay cola:
+    nunca compite con logins en espera) y se guarda con compare-and-set,
+    de modo que un cambio de password concurrente no se pierde. Si se
+    descarta, se reintenta en el siguiente login del usuario.
+
+    Se llama con el login ya confirmado: ningún error de aquí puede hacer
+    fallar el login (se registra y se cuenta como "failed").
+    """
+
+    def __init__(
+        self,
+        password_hasher: PasswordHasher,
+        hashing_executor: HashingExecutor,
+        repository_factory: Callable[[], Any]
+    ):
+        self.password_hasher = password_hasher
+        self.hashing_executor = hashing_executor
+        self.repository_factory = repository_factory
+        self._lock = threading.Lock()
+        self._stats = {"scheduled": 0, "upgraded": 0, "skipped": 0, "conflicts": 0, "failed": 0}
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        try:
+            return self.password_hasher.needs_rehash(hashed_password)
+        except Exception:
+            self._log_failure("Password rehash check failed")
+            return False
+
+    def schedule(self, user_id: str, password: str, current_hash: str) -> Optional[Future]:
+        """Programar el rehash (no bloquea el login)"""
+        if not has_app_context() or self.hashing_executor.queue_depth > 0:
+            self._count("skipped")
+            return None
+
+        app = current_app._get_current_object()
+        try:
+            future = self.hashing_executor.submit(self._rehash, app, user_id, password, current_hash)
+        except HashingOverloadedException:
+            self._count("skipped")
+            return None
+        except Exception:
+            self._log_failure("Password rehash could not be scheduled for user %s", user_id)
+            return None
+
+        self._count("scheduled")
+        return future
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _rehash(self, app, user_id: str, password: str, current_hash: str) -> bool:
+        try:
+            new_hash, _ = self.password_hasher.hash(password)
+            # Contexto propio: sesión de base de datos independiente del request
+            with app.app_context():
+                updated = self.repository_factory().update_password_hash(user_id, current_hash, new_hash)
+        except Exception:
+            app.logger.exception("Password rehash failed for user %s", user_id)
+            self._count("failed")
+            return False
+
+        self._count("upgraded" if updated else "conflicts")
+        return updated
+
+    def _log_failure(self, message: str, *args: Any) -> None:
+        if has_app_context():
+            current_app.logger.exception(message, *args)
+        self._count("failed")
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
@@ -0,0 +1,248 @@
+# src/features/auth/infrastructure/services/security/rate_limiter.py
+import fcntl
+import hashlib
+import math
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+RATE_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+_RATE_PATTERN = re.compile(r"^\s*(\d+)\s*(?:/|per)\s*(\d*)\s*(second|minute|hour|day)s?\s*$", re.IGNORECASE)
+
+# Cabecera: magic, nº de slots, nº de franjas. Slot: hash de la clave (0 = libre) y TAT
+_HEADER = struct.Struct("<8sII")
+_HEADER_SIZE = 64
+_SLOT = struct.Struct("<Qd")
+_MAGIC = b"AUTHRL01"
+
+def parse_rate(rate: Optional[str]) -> Optional[Tuple[int, float]]:
+    """'10/minute', '5 per second', '100/5minutes' -> (límite, periodo en segundos)
+
+    None si el límite está vacío o es "off" (desactivado).
+    """
+    if rate is None or not str(rate).strip() or str(rate).strip().lower() == "off":
+        return None
+    match = _RATE_PATTERN.match(str(rate))
+    if not match:
+        raise ValueError(f"Invalid rate limit: {rate!r}")
+    limit, multiplier, unit = match.groups()
+    if int(limit) <= 0:
+        raise ValueError(f"Invalid rate limit: {rate!r}")
+    return int(limit), float(int(multiplier or 1) * RATE_PERIODS[unit.lower()])
+
+class SharedRateLimiter:
+    """Token bucket (GCRA) por clave en una tabla compartida por mmap
+
+    Todos los workers del host mapean el mismo fichero, así que un
+    atacante que reparte sus peticiones entre workers consume el mismo
+    cupo. Cada slot guarda solo el hash de la clave y su "theoretical
+    arrival time" (16 bytes): comprobar un límite es un hash, unas pocas
+    lecturas del mapa y un lock de rango (fcntl) sobre la franja de la
+    tabla, sin I/O de red ni de base de datos.
+
+    - Hash abierto con sondeo lineal dentro de la franja; un slot con el
+      TAT en el pasado equivale a un cubo lleno y se reutiliza
+    - Si las `max_probes` posiciones están ocupadas se desaloja la de
+      menor TAT (la más cercana a estar llena de nuevo)
+    - Sin `path` la tabla es anónima (por proceso), útil en desarrollo
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        slots: int = 65536,
+        stripes: int = 64,
+        max_probes: int = 16
+    ):
+        self.path = path
+        self.stripes = max(1, stripes)
+        self.stripe_slots = max(1, math.ceil(slots / self.stripes))
+        self.max_probes = max(1, min(max_probes, self.stripe_slots))
+        self._mm: Optional[mmap.mmap] = None
+        self._fd: Optional[int] = None
+        self._pid: Optional[int] = None
+        self._open_lock = threading.Lock()
+        self._stripe_locks: List[threading.Lock] = []
+        self._stats = {"checks": 0, "limited": 0, "evictions": 0}
+
+    @property
+    def slots(self) -> int:
+        return self.stripes * self.stripe_slots
+
+    def hit(self, key: str, limit: int, period: float, cost: int = 1) -> Tuple[bool, float]:
+        """Consumir `cost` del cubo de `key` (`limit` por `period` segundos)
+
+        Returns:
+            (permitido, segundos hasta poder reintentar)
+        """
+        if self._pid != os.getpid():
+            self._open()
+
+        key_hash = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") or 1
+        stripe = key_hash % self.stripes
+        first = (key_hash >> 32) % self.stripe_slots
+        base = _HEADER_SIZE + stripe * self.stripe_slots * _SLOT.size
+        interval = period / limit
+        mm = self._mm
+
+        self._stats["checks"] += 1
+        with self._stripe_locks[stripe]:
+            if self._fd is not None:
+                fcntl.lockf(self._fd, fcntl.LOCK_EX, self.stripe_slots * _SLOT.size, base)
+            try:
+                now = time.time()
+                offset, tat, evicted = self._find_slot(mm, base, first, key_hash, now)
+                new_tat = max(tat, now) + interval * cost
+                if new_tat - now > period:
+                    self._stats["limited"] += 1
+                    return False, new_tat - now - period
+
+                _SLOT.pack_into(mm, offset, key_hash, new_tat)
+                if evicted:
+                    self._stats["evictions"] += 1
+                return True, 0.0
+            finally:
+                if self._fd is not None:
+                    fcntl.lockf(self._fd, fcntl.LOCK_UN, self.stripe_slots * _SLOT.size, base)
+
+    def reset(self) -> None:
+        """Vaciar la tabla (todos los workers)"""
+        if self._pid != os.getpid():
+            self._open()
+        for stripe, lock in enumerate(self._stripe_locks):
+            base = _HEADER_SIZE + stripe * self.stripe_slots * _SLOT.size
+            length = self.stripe_slots * _SLOT.size
+            with lock:
+                if self._fd is not None:
+                    fcntl.lockf(self._fd, fcntl.LOCK_EX, length, base)
+                self._mm[base:base + length] = bytes(length)
+                if self._fd is not None:
+                    fcntl.lockf(self._fd, fcntl.LOCK_UN, length, base)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "shared": self.path is not None,
+            "slots": self.slots,
+            **self._stats,
+        }
+
+    def _find_slot(self, mm: mmap.mmap, base: int, first: int, key_hash: int, now: float) -> Tuple[int, float, bool]:
+        # (offset, TAT actual, desalojo); nunca se vacía un slot, así que un 0 cierra la secuencia
+        free = None
+        victim, victim_tat = None, math.inf
+        for probe in range(self.max_probes):
+            offset = base + ((first + probe) % self.stripe_slots) * _SLOT.size
+            slot_hash, tat = _SLOT.unpack_from(mm, offset)
+            if slot_hash == key_hash:
+                return offset, tat, False
+            if slot_hash == 0:
+                return (free if free is not None else offset), 0.0, False
+            if tat <= now:
+                if free is None:
+                    free = offset
+            elif tat < victim_tat:
+                victim, victim_tat = offset, tat
+
+        if free is not None:
+            return free, 0.0, False
+        return victim, 0.0, True
+
+    def _open(self) -> None:
+        # Perezoso y de nuevo tras un fork: los locks de fcntl no se heredan
+        with self._open_lock:
+            if self._pid == os.getpid():
+                return
+            size = _HEADER_SIZE + self.slots * _SLOT.size
+            if self.path is None:
+                self._mm = mmap.mmap(-1, size)
+            else:
+                self._fd, self._mm = self._map_file(size)
+            self._stripe_locks = [threading.Lock() for _ in range(self.stripes)]
+            self._pid = os.getpid()
+
+    def _map_file(self, size: int) -> Tuple[int, mmap.mmap]:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            header = os.pread(fd, _HEADER.size, 0)
+            if len(header) == _HEADER.size and header[:8] == _MAGIC:
+                # Otro worker ya la creó: adoptar su geometría (no truncar un mapa en uso)
+                _, slots, stripes = _HEADER.unpack(header)
+                self.stripes, self.stripe_slots = stripes, slots // stripes
+                self.max_probes = min(self.max_probes, self.stripe_slots)
+                size = _HEADER_SIZE + slots * _SLOT.size
+            else:
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, size)
+                os.pwrite(fd, _HEADER.pack(_MAGIC, self.slots, self.stripes), 0)
+            return fd, mmap.mmap(fd, size)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+class RateLimitPolicy:
+    """Límites de los endpoints de credenciales: por IP, por email y global del host
+
+    Se comprueban en ese orden y se corta en el primero que falla, así
+    que el tráfico de una IP abusiva no consume el cupo global.
+    `proxy_hops` es el nº de proxies propios delante de la app (la IP se
+    toma de X-Forwarded-For solo si es > 0).
+    """
+
+    def __init__(
+        self,
+        limiter: SharedRateLimiter,
+        per_ip: Optional[str] = "30/minute",
+        per_email: Optional[str] = "10/minute",
+        global_limit: Optional[str] = "100/second",
+        proxy_hops: int = 0,
+        enabled: bool = True
+    ):
+        self.limiter = limiter
+        self.proxy_hops = proxy_hops
+        self.enabled = enabled
+        self.per_ip = parse_rate(per_ip)
+        self.per_email = parse_rate(per_email)
+        self.global_limit = parse_rate(global_limit)
+
+    def check(
+        self, scope: str, ip: Optional[str], email: Union[str, Callable[[], Optional[str]], None]
+    ) -> Optional[float]:
+        """None si se permite; si no, segundos hasta poder reintentar
+
+        `email` puede ser una función: solo se evalúa (p. ej. validando el
+        cuerpo) si la IP no ha agotado su cupo.
+        """
+        if not self.enabled:
+            return None
+        for rate, key in (
+            (self.per_ip, f"{scope}:ip:{ip}" if ip else None),
+            (self.per_email, lambda: self._email_key(scope, email)),
+            (self.global_limit, f"{scope}:global"),
+        ):
+            if rate is None:
+                continue
+            if callable(key):
+                key = key()
+            if key is None:
+                continue
+            allowed, retry_after = self.limiter.hit(key, *rate)
+            if not allowed:
+                return retry_after
+        return None
+
+    @staticmethod
+    def _email_key(scope: str, email: Union[str, Callable[[], Optional[str]], None]) -> Optional[str]:
+        if callable(email):
+            email = email()
+        return f"{scope}:email:{email}" if email else None
+
+    def stats(self) -> Dict[str, Any]:
+        return {"enabled": self.enabled, **self.limiter.stats()}
@@ -0,0 +1,83 @@
+# src/features/auth/infrastructure/services/security/token_cache.py
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+from cachetools import TLRUCache
+
+class VerifiedTokenCache:
+    """Caché acotada de payloads ya verificados, por digest del token
+
+    - Cada entrada caduca exactamente en el `exp` del token (TLRU)
+    - Solo entran tokens ya verificados: un atacante que envía tokens
+      falsos no puede llenarla; además hay un máximo de entradas y de
+      tamaño de token (memoria <= maxsize * max_token_bytes aprox.)
+    - La clave es un digest de 16 bytes, no el token
+    """
+
+    def __init__(self, maxsize: int = 10000, max_token_bytes: int = 4096):
+        self.max_token_bytes = max_token_bytes
+        self._cache: TLRUCache = TLRUCache(maxsize=maxsize, ttu=_expires_at, timer=time.time)
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "inserts": 0, "oversize": 0, "invalidations": 0}
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        key = self.digest(token)
+        with self._lock:
+            payload = self._cache.get(key)
+            self._stats["hits" if payload is not None else "misses"] += 1
+        return dict(payload) if payload is not None else None
+
+    def set(self, token: str, payload: Dict[str, Any]) -> None:
+        # Sin exp no hay caducidad que aplicar: no se cachea
+        if "exp" not in payload:
+            return
+        if len(token) > self.max_token_bytes:
+            with self._lock:
+                self._stats["oversize"] += 1
+            return
+
+        key = self.digest(token)
+        with self._lock:
+            self._cache[key] = dict(payload)
+            self._stats["inserts"] += 1
+
+    def invalidate(self, token: str) -> None:
+        """Sacar un token concreto (p. ej. al revocarlo)"""
+        with self._lock:
+            if self._cache.pop(self.digest(token), None) is not None:
+                self._stats["invalidations"] += 1
+
+    def invalidate_where(self, predicate: Callable[[Dict[str, Any]], bool]) -> int:
+        """Sacar los payloads que cumplan `predicate` (p. ej. todos los de un usuario)"""
+        with self._lock:
+            keys = [key for key, payload in self._cache.items() if predicate(payload)]
+            for key in keys:
+                self._cache.pop(key, None)
+            self._stats["invalidations"] += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                "size": self._cache.currsize,
+                "maxsize": self._cache.maxsize,
+                "hit_ratio": round(self._stats["hits"] / lookups, 4) if lookups else None,
+                **self._stats,
+            }
+
+def create_token_cache(maxsize: int, max_token_bytes: int = 4096) -> Optional[VerifiedTokenCache]:
+    """Caché configurada (JWT_VERIFIED_CACHE_SIZE=0 la desactiva)"""
+    return VerifiedTokenCache(maxsize, max_token_bytes) if maxsize else None
+
+def _expires_at(key: bytes, payload: Dict[str, Any], now: float) -> float:
+    return float(payload["exp"])
@@ -0,0 +1,226 @@
+# src/features/auth/infrastructure/services/security/token_denylist.py
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+from cachetools import TTLCache
+from flask import current_app, has_app_context
+from .background_poller import start_poller
+
+# "bloom": filtro en memoria por worker + hilo de recarga; "full": consulta por petición
+REVOCATION_MODES = ("bloom", "full")
+
+class BloomFilter:
+    """Filtro de Bloom sobre un bytearray (sin falsos negativos)
+
+    Los k índices salen de un único blake2b de 128 bits por doble hashing
+    (h1 + i*h2), así que comprobar un jti cuesta un hash y k accesos.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def add(self, key: str) -> bool:
+        """Añadir una clave; False si ya estaba (las recargas solapadas no inflan `count`)"""
+        if key in self:
+            return False
+        for index in self._indexes(key):
+            self._bits[index >> 3] |= 1 << (index & 7)
+        self.count += 1
+        return True
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[index >> 3] & (1 << (index & 7)) for index in self._indexes(key))
+
+    def _indexes(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        return ((h1 + i * h2) % size for i in range(self.hash_count))
+
+class TokenDenylist:
+    """Revocación de access tokens por jti: tabla persistente + filtro en memoria
+
+    - La tabla revoked_tokens es la fuente de verdad (una fila por jti
+      hasta el exp del token)
+    - Cada worker mantiene un filtro de Bloom con los jti revocados: el
+      caso común (token no revocado) se resuelve en memoria, sin I/O. Un
+      positivo se confirma contra la tabla (falsos positivos ~error_rate)
+      y la respuesta se recuerda
+    - Un hilo por worker lee cada `refresh_interval` segundos las filas
+      nuevas (revoked_at >= cursor - grace, el solape cubre transacciones
+      que confirman tarde) y cada `rebuild_interval` reconstruye el filtro
+      solo con las revocaciones vigentes (un Bloom no permite borrar)
+
+    Las revocaciones de otros workers se ven como mucho `refresh_interval`
+    segundos después; las del propio worker, al momento (también si llegan
+    durante una reconstrucción).
+
+    Con mode="full" no hay filtro ni hilo: cada comprobación consulta la
+    tabla (revocación inmediata entre workers a cambio de una consulta).
+    """
+
+    page_size = 10000  # filas por consulta de la recarga incremental
+
+    def __init__(
+        self,
+        repository_factory: Callable[[], Any],
+        capacity: int = 100000,
+        error_rate: float = 0.001,
+        refresh_interval: float = 2.0,
+        rebuild_interval: float = 600.0,
+        grace: float = 30.0,
+        mode: str = "bloom"
+    ):
+        if mode not in REVOCATION_MODES:
+            raise ValueError(f"Unsupported revocation mode: {mode}")
+        self.repository_factory = repository_factory
+        self.mode = mode
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.refresh_interval = refresh_interval
+        self.rebuild_interval = rebuild_interval
+        self.grace = timedelta(seconds=grace)
+        self._filter: Optional[BloomFilter] = None
+        self._cursor: Optional[datetime] = None
+        self._built_at = 0.0
+        self._refreshed_at = 0.0
+        self._confirmed: TTLCache = TTLCache(maxsize=10000, ttl=rebuild_interval)
+        # Revocaciones de este worker: las que la instantánea de _rebuild no vio
+        # se vuelven a añadir al filtro nuevo
+        self._local_revocations: Dict[str, datetime] = {}
+        # Reentrante: la primera carga (_start) reconstruye con el lock tomado
+        self._lock = threading.RLock()
+        self._poller: Optional[threading.Thread] = None
+        self._stats = {"checks": 0, "filtered": 0, "confirmed": 0, "false_positives": 0,
+                       "db_checks": 0, "refreshes": 0, "rebuilds": 0, "errors": 0}
+
+    def revoke(self, jti: str, user_id: Optional[str], expires_at: datetime) -> None:
+        """Persistir la revocación y añadirla al filtro local"""
+        self.repository_factory().revoke(jti, user_id, expires_at)
+        with self._lock:
+            if self._filter is not None:
+                self._filter.add(jti)
+            self._confirmed[jti] = True
+            if self.mode == "bloom":
+                self._local_revocations[jti] = datetime.utcnow()
+
+    def is_revoked(self, jti: str) -> bool:
+        """Comprobación en memoria; solo consulta la tabla ante un positivo del filtro"""
+        self._stats["checks"] += 1
+        if self.mode == "full":
+            self._stats["db_checks"] += 1
+            return self.repository_factory().is_revoked(jti)
+
+        if self._filter is None:
+            self._start()
+
+        if jti not in self._filter:
+            self._stats["filtered"] += 1
+            return False
+
+        with self._lock:
+            revoked = self._confirmed.get(jti)
+        if revoked is None:
+            self._stats["db_checks"] += 1
+            revoked = self.repository_factory().is_revoked(jti)
+            with self._lock:
+                self._confirmed[jti] = revoked
+
+        self._stats["confirmed" if revoked else "false_positives"] += 1
+        return revoked
+
+    def stats(self) -> Dict[str, Any]:
+        bloom = self._filter
+        now = time.monotonic()
+        return {
+            "mode": self.mode,
+            "entries": bloom.count if bloom else None,
+            "capacity": bloom.capacity if bloom else self.capacity,
+            "filter_bytes": bloom.nbytes if bloom else 0,
+            "refresh_age_seconds": round(now - self._refreshed_at, 1) if bloom else None,
+            **self._stats,
+        }
+
+    def _start(self) -> None:
+        # Primera carga síncrona (el filtro debe estar completo antes de responder)
+        with self._lock:
+            if self._filter is not None:
+                return
+            self._rebuild()
+            if has_app_context() and self._poller is None:
+                self._poller = start_poller(
+                    current_app._get_current_object(), "token-denylist", self.refresh_interval,
+                    self._tick, on_error=self._count_error
+                )
+
+    def _tick(self) -> None:
+        # Sin lock: lo revocado durante la reconstrucción llega en el siguiente refresh
+        if time.monotonic() - self._built_at >= self.rebuild_interval:
+            self._rebuild()
+        else:
+            self._refresh()
+
+    def _count_error(self) -> None:
+        self._stats["errors"] += 1
+
+    def _rebuild(self) -> None:
+        started = datetime.utcnow()
+        repository = self.repository_factory()
+        entries = list(repository.iter_active())
+        # Margen para crecer hasta la siguiente reconstrucción
+        bloom = BloomFilter(max(self.capacity, len(entries) * 2), self.error_rate)
+        for jti, _ in entries:
+            bloom.add(jti)
+
+        with self._lock:
+            # Revocadas aquí mientras se leía la tabla (o confirmadas tarde):
+            # sin esto el token volvería a aceptarse hasta el siguiente refresh
+            since = started - self.grace
+            self._local_revocations = {
+                jti: revoked_at for jti, revoked_at in self._local_revocations.items() if revoked_at >= since
+            }
+            for jti in self._local_revocations:
+                bloom.add(jti)
+            self._filter = bloom
+            self._cursor = started
+            self._built_at = self._refreshed_at = time.monotonic()
+            self._confirmed.clear()
+            self._confirmed.update(dict.fromkeys(self._local_revocations, True))
+        self._stats["rebuilds"] += 1
+
+    def _refresh(self) -> None:
+        repository = self.repository_factory()
+        since, after_jti = self._cursor - self.grace, None
+        limit = self.page_size
+        while True:
+            rows = repository.revoked_since(since, limit, after_jti)
+            with self._lock:
+                for jti, revoked_at in rows:
+                    self._filter.add(jti)
+                    # Un "no revocado" ya confirmado puede haber cambiado
+                    if not self._confirmed.get(jti, True):
+                        del self._confirmed[jti]
+                    self._cursor = max(self._cursor, revoked_at)
+            if len(rows) < limit:
+                break
+            # Siguiente página tras la última fila (revoked_at, jti)
+            after_jti, since = rows[-1]
+
+        self._refreshed_at = time.monotonic()
+        self._stats["refreshes"] += 1
+        if self._filter.count > self._filter.capacity:
+            self._rebuild()
@@ -0,0 +1,109 @@
+# src/features/auth/infrastructure/services/security/token_epochs.py
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+from flask import current_app, has_app_context
+from .background_poller import start_poller
+
+class TokenEpochMap:
+    """Época de tokens por usuario, en memoria
+
+    Un token es válido si su claim `epc` es >= la época actual del usuario.
+    Desactivar la cuenta o cambiar el password incrementa la época y deja
+    inválidos de golpe todos sus tokens; la comprobación es un dict.get.
+
+    Solo se guardan los usuarios con época > 0 (los que alguna vez se
+    invalidaron). Un hilo por worker lee cada `refresh_interval` segundos
+    los cambios (token_epoch_at >= cursor - grace); los cambios hechos en
+    el propio worker se aplican al momento con `observe`.
+    """
+
+    page_size = 10000  # filas por consulta de la recarga incremental
+
+    def __init__(
+        self,
+        repository_factory: Callable[[], Any],
+        refresh_interval: float = 2.0,
+        grace: float = 30.0
+    ):
+        self.repository_factory = repository_factory
+        self.refresh_interval = refresh_interval
+        self.grace = timedelta(seconds=grace)
+        self._epochs: Optional[Dict[str, int]] = None
+        self._cursor: Optional[datetime] = None
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+        self._poller: Optional[threading.Thread] = None
+        self._stats = {"checks": 0, "stale": 0, "refreshes": 0, "errors": 0}
+
+    def current(self, user_id: str) -> int:
+        if self._epochs is None:
+            self._start()
+        return self._epochs.get(user_id, 0)
+
+    def is_current(self, payload: Dict[str, Any]) -> bool:
+        """El token no es anterior a la última invalidación de su usuario"""
+        self._stats["checks"] += 1
+        try:
+            token_epoch = int(payload.get("epc", 0))
+        except (TypeError, ValueError):
+            token_epoch = -1
+        if token_epoch < self.current(payload.get("sub")):
+            self._stats["stale"] += 1
+            return False
+        return True
+
+    def observe(self, user_id: str, epoch: int) -> None:
+        """Aplicar una época conocida (escritura del propio worker o recarga)"""
+        if epoch <= 0 or self._epochs is None:
+            return
+        with self._lock:
+            if epoch > self._epochs.get(user_id, 0):
+                self._epochs[user_id] = epoch
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "users": len(self._epochs) if self._epochs is not None else None,
+            "refresh_age_seconds": (
+                round(time.monotonic() - self._refreshed_at, 1) if self._epochs is not None else None
+            ),
+            **self._stats,
+        }
+
+    def _start(self) -> None:
+        # Primera carga síncrona; después solo cambios incrementales
+        with self._lock:
+            if self._epochs is not None:
+                return
+            started = datetime.utcnow()
+            self._epochs = {
+                user_id: epoch for user_id, epoch, _ in self.repository_factory().iter_token_epochs()
+            }
+            self._cursor = started
+            self._refreshed_at = time.monotonic()
+            if has_app_context() and self._poller is None:
+                self._poller = start_poller(
+                    current_app._get_current_object(), "token-epochs", self.refresh_interval,
+                    self._refresh, on_error=self._count_error
+                )
+
+    def _refresh(self) -> None:
+        repository = self.repository_factory()
+        since, after_id = self._cursor - self.grace, None
+        limit = self.page_size
+        while True:
+            rows = repository.token_epochs_since(since, limit, after_id)
+            for user_id, epoch, changed_at in rows:
+                self.observe(user_id, epoch)
+                self._cursor = max(self._cursor, changed_at)
+            if len(rows) < limit:
+                break
+            # Siguiente página tras la última fila (token_epoch_at, id)
+            after_id, _, since = rows[-1]
+
+        self._refreshed_at = time.monotonic()
+        self._stats["refreshes"] += 1
+
+    def _count_error(self) -> None:
+        self._stats["errors"] += 1
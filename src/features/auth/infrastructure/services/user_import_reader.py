@@ -0,0 +1,45 @@
+import csv
+import io
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple
+import orjson
+
+IMPORT_FORMATS = ("ndjson", "csv")
+
+def read_user_rows(stream: BinaryIO, fmt: str = "ndjson") -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Leer filas de usuarios en streaming (sin cargar el fichero entero)
+
+    Yields:
+        Tuple[int, Optional[dict], Optional[str]]: (línea, fila, error de lectura)
+    """
+    if fmt == "ndjson":
+        return _read_ndjson(stream)
+    if fmt == "csv":
+        return _read_csv(stream)
+    raise ValueError(f"Unsupported import format: {fmt}")
+
+def _read_ndjson(stream: BinaryIO):
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            yield line_number, None, f"Invalid JSON: {e}"
+            continue
+
+        if not isinstance(row, dict):
+            yield line_number, None, "Row must be a JSON object"
+            continue
+
+        yield line_number, row, None
+
+def _read_csv(stream: BinaryIO):
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    reader = csv.DictReader(text)
+    for row in reader:
+        # Celdas vacías = campo ausente (p. ej. password o hashed_password)
+        yield reader.line_num, {
+            key: value for key, value in row.items()
+            if key and value not in ("", None)
+        }, None
@@ -0,0 +1,58 @@
+import time
+from flask import Blueprint, request, g
+from dependency_injector.wiring import inject, Provide
+from .....infrastructure.services.admission_controller import AdmissionController
+
+# Clase de admisión por endpoint.
+# Sin clase (health, JWKS) no se limita: la monitorización debe responder
+ENDPOINT_CLASSES = {
+    "login": "credentials",
+    "register": "credentials",
+    "logout": "tokens",
+    "verify_token": "tokens",
+    "introspect_batch": "tokens",
+    "import_users": "admin",
+}
+
+@inject
+def admit_request(
+    admission_controller: AdmissionController = Provide["auth.admission_controller"]
+):
+    """before_request: admitir o rechazar (503 + Retry-After) antes de la vista"""
+    view_name = (request.endpoint or "").rsplit(".", 1)[-1]
+    endpoint_class = ENDPOINT_CLASSES.get(view_name)
+    if endpoint_class is None:
+        return None
+    
+    g.admission_limit = admission_controller.acquire(endpoint_class)
+    g.admission_started = time.monotonic()
+    g.admission_congested = False
+    g.admission_sample = True
+    return None
+
+def record_response(response):
+    """after_request: las respuestas 503/504 cuentan como congestión; un 429
+    que llegue a la vista no es una muestra de latencia (bajaría la media)"""
+    if response.status_code in (503, 504):
+        g.admission_congested = True
+    elif response.status_code == 429:
+        g.admission_sample = False
+    return response
+
+def release_request(error=None):
+    """teardown_request: liberar el hueco con la latencia observada"""
+    limit = g.pop('admission_limit', None)
+    if limit is None:
+        return
+    latency = time.monotonic() - g.pop('admission_started')
+    limit.release(
+        latency,
+        congested=g.pop('admission_congested', False),
+        sample=g.pop('admission_sample', True)
+    )
+
+def install_admission_control(blueprint: Blueprint) -> None:
+    """Registrar el control de admisión en un blueprint"""
+    blueprint.before_request(admit_request)
+    blueprint.after_request(record_response)
+    blueprint.teardown_request(release_request)
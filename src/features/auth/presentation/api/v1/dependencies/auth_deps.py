@@ -1,10 +1,13 @@
 from functools import wraps
-from flask import request, jsonify, g
+from flask import request, jsonify, g, current_app, abort
 from typing import Optional
 from .....infrastructure.services.security.jwt_handler import JWTService
+from .....infrastructure.services.security.token_denylist import TokenDenylist
+from .....infrastructure.services.security.token_epochs import TokenEpochMap
 from .....application.interfaces.repositories.user_repository import IUserRepository
+from .....domain.entities.user import User
+from .....domain.value_objects.email import Email
 from dependency_injector.wiring import inject, Provide
-from src.core.dependencies.containers import MainContainer as Container
 
 def get_current_user():
     """Obtener usuario actual del contexto"""
@@ -14,69 +17,154 @@ def get_current_user_id():
     """Obtener ID del usuario actual"""
     return getattr(g, 'current_user_id', None)
 
-@inject
-def token_required(
-    user_repository: IUserRepository = Provide[Container.auth.user_repository],
-    jwt_service: JWTService = Provide[Container.auth.jwt_service]
+# Modos de autenticación de token_required/admin_required:
+# - "full": carga el usuario (find_by_id, con caché) y comprueba is_active
+# - "claims": construye el usuario con los claims del token, sin I/O; la
+#   desactivación o el cambio de password llegan por la época de tokens
+AUTH_MODES = ("full", "claims")
+
+def _user_from_claims(payload: dict) -> Optional[User]:
+    """Usuario a partir de los claims del access token (None si faltan datos)"""
+    email, username = payload.get('email'), payload.get('username')
+    if not email or not username:
+        return None
+    try:
+        return User(
+            id=payload['sub'],
+            email=Email.trusted(email),  # viene de un token firmado por nosotros
+            username=username,
+            hashed_password="",
+            is_verified=bool(payload.get('is_verified', False)),
+        )
+    except Exception:
+        return None
+
+def _authenticate(
+    user_repository: IUserRepository,
+    jwt_service: JWTService,
+    token_denylist: TokenDenylist,
+    token_epochs: TokenEpochMap,
+    mode: str = "full"
 ):
-    """Decorator para requerir token JWT válido"""
+    """Validar el Bearer token y cargar el usuario en `g`; devuelve la respuesta de error o None"""
+    auth_header = request.headers.get('Authorization')
+    
+    if not auth_header:
+        return jsonify({"error": "Missing authorization header"}), 401
+    
+    # Verificar formato "Bearer <token>"
+    parts = auth_header.split()
+    if len(parts) != 2 or parts[0].lower() != 'bearer':
+        return jsonify({"error": "Invalid authorization header format"}), 401
+    
+    token = parts[1]
+    
+    # Verificar token
+    payload = jwt_service.verify_token(token)
+    if not payload:
+        return jsonify({"error": "Invalid or expired token"}), 401
+    
+    # Verificar tipo de token
+    if payload.get('type') != 'access':
+        return jsonify({"error": "Invalid token type"}), 401
+    
+    # Revocación (logout): filtro en memoria, sin consulta en el caso común
+    jti = payload.get('jti')
+    if jti and token_denylist.is_revoked(jti):
+        return jsonify({"error": "Token has been revoked"}), 401
+    
+    # Obtener usuario
+    user_id = payload.get('sub')
+    if not user_id:
+        return jsonify({"error": "Invalid token payload"}), 401
+    
+    # Tokens anteriores a una desactivación o cambio de password
+    if not token_epochs.is_current(payload):
+        return jsonify({"error": "Token has been revoked"}), 401
+    
+    user = _user_from_claims(payload) if mode == "claims" else None
+    if user is None:
+        user = user_repository.find_by_id(user_id)
+        if not user or not user.is_active:
+            return jsonify({"error": "User not found or inactive"}), 401
+    
+    # Agregar al contexto
+    g.current_user = user
+    g.current_user_id = user_id
+    g.token_payload = payload
+    g.access_token = token
+    return None
+
+def token_required(mode: str = "full"):
+    """Decorator para requerir token JWT válido
+    
+    Args:
+        mode: "full" (carga el usuario) o "claims" (sin consulta, para
+            endpoints de lectura con tokens de vida corta)
+    """
+    if mode not in AUTH_MODES:
+        raise ValueError(f"Unsupported auth mode: {mode}")
+    
     def decorator(f):
+        # Inyección por request (como optional_token): el decorator se aplica
+        # al importar las vistas, antes de que el contenedor esté cableado
         @wraps(f)
-        def decorated_function(*args, **kwargs):
-            auth_header = request.headers.get('Authorization')
-            
-            if not auth_header:
-                return jsonify({"error": "Missing authorization header"}), 401
-            
-            # Verificar formato "Bearer <token>"
-            parts = auth_header.split()
-            if len(parts) != 2 or parts[0].lower() != 'bearer':
-                return jsonify({"error": "Invalid authorization header format"}), 401
-            
-            token = parts[1]
-            
-            # Verificar token
-            payload = jwt_service.verify_token(token)
-            if not payload:
-                return jsonify({"error": "Invalid or expired token"}), 401
-            
-            # Verificar tipo de token
-            if payload.get('type') != 'access':
-                return jsonify({"error": "Invalid token type"}), 401
-            
-            # Obtener usuario
-            user_id = payload.get('sub')
-            if not user_id:
-                return jsonify({"error": "Invalid token payload"}), 401
-            
-            user = user_repository.find_by_id(user_id)
-            if not user or not user.is_active:
-                return jsonify({"error": "User not found or inactive"}), 401
-            
-            # Agregar al contexto
-            g.current_user = user
-            g.current_user_id = user_id
-            g.token_payload = payload
+        @inject
+        def decorated_function(
+            *args,
+            user_repository: IUserRepository = Provide["auth.user_repository"],
+            jwt_service: JWTService = Provide["auth.jwt_service"],
+            token_denylist: TokenDenylist = Provide["auth.token_denylist"],
+            token_epochs: TokenEpochMap = Provide["auth.token_epochs"],
+            **kwargs
+        ):
+            error = _authenticate(user_repository, jwt_service, token_denylist, token_epochs, mode)
+            if error:
+                return error
             
             return f(*args, **kwargs)
         return decorated_function
     return decorator
 
-@inject
-def admin_required(
-    user_repository: IUserRepository = Provide[Container.auth.user_repository],
-    jwt_service: JWTService = Provide[Container.auth.jwt_service]
-):
-    """Decorator para requerir rol de admin"""
+def is_admin(user: User) -> bool:
+    """Admin = email verificado incluido en AUTH_ADMIN_EMAILS (lista vacía: ningún admin)"""
+    admin_emails = current_app.config.get('AUTH_ADMIN_EMAILS') or ()
+    return bool(user.is_verified and str(user.email).lower() in admin_emails)
+
+def endpoint_enabled(config_key: str):
+    """Decorator para rutas desactivadas por defecto: 404 salvo que `config_key` sea true"""
     def decorator(f):
         @wraps(f)
-        @token_required(user_repository, jwt_service)
         def decorated_function(*args, **kwargs):
+            if not current_app.config.get(config_key):
+                abort(404)
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
+
+def admin_required(mode: str = "full"):
+    """Decorator para requerir rol de admin (ver is_admin)"""
+    if mode not in AUTH_MODES:
+        raise ValueError(f"Unsupported auth mode: {mode}")
+    
+    def decorator(f):
+        @wraps(f)
+        @inject
+        def decorated_function(
+            *args,
+            user_repository: IUserRepository = Provide["auth.user_repository"],
+            jwt_service: JWTService = Provide["auth.jwt_service"],
+            token_denylist: TokenDenylist = Provide["auth.token_denylist"],
+            token_epochs: TokenEpochMap = Provide["auth.token_epochs"],
+            **kwargs
+        ):
+            error = _authenticate(user_repository, jwt_service, token_denylist, token_epochs, mode)
+            if error:
+                return error
+            
             user = get_current_user()
             
-            # Aquí puedes agregar lógica para verificar rol de admin
-            # Por ahora, solo verificamos si el usuario está verificado
-            if not user.is_verified:
+            if not is_admin(user):
                 return jsonify({"error": "Admin privileges required"}), 403
             
             return f(*args, **kwargs)
@@ -90,8 +178,10 @@ def optional_token():
         @inject
         def decorated_function(
             *args, 
-            user_repository: IUserRepository = Provide[Container.auth.user_repository],
-            jwt_service: JWTService = Provide[Container.auth.jwt_service],
+            user_repository: IUserRepository = Provide["auth.user_repository"],
+            jwt_service: JWTService = Provide["auth.jwt_service"],
+            token_denylist: TokenDenylist = Provide["auth.token_denylist"],
+            token_epochs: TokenEpochMap = Provide["auth.token_epochs"],
             **kwargs
         ):
             auth_header = request.headers.get('Authorization')
@@ -102,7 +192,9 @@ def optional_token():
                     token = parts[1]
                     payload = jwt_service.verify_token(token)
                     
-                    if payload and payload.get('type') == 'access':
+                    jti = payload.get('jti') if payload else None
+                    if payload and payload.get('type') == 'access' and not (jti and token_denylist.is_revoked(jti)) \
+                            and token_epochs.is_current(payload):
                         user_id = payload.get('sub')
                         if user_id:
                             user = user_repository.find_by_id(user_id)
@@ -0,0 +1,82 @@
+import math
+from functools import wraps
+from typing import Optional, Type
+from flask import Blueprint, current_app, g, request
+from pydantic import BaseModel
+from dependency_injector.wiring import inject, Provide
+from .....domain.exceptions.auth_exceptions import RateLimitExceededException
+from .....infrastructure.services.security.rate_limiter import RateLimitPolicy
+
+def client_ip(proxy_hops: int = 0) -> Optional[str]:
+    """IP del cliente; con `proxy_hops` > 0 se toma de X-Forwarded-For
+    (contando desde el final: solo lo que añadieron nuestros proxies)"""
+    if proxy_hops > 0:
+        forwarded = [ip.strip() for ip in request.headers.get('X-Forwarded-For', '').split(',') if ip.strip()]
+        if len(forwarded) >= proxy_hops:
+            return forwarded[-proxy_hops]
+    return request.remote_addr
+
+def _request_email(model: Optional[Type[BaseModel]]) -> Optional[str]:
+    # Solo el campo email del JSON, sin validar el esquema (eso lo hace la
+    # vista después del limitador); normalizado como el DTO
+    if model is None or 'email' not in model.model_fields:
+        return None
+    body = request.get_json(silent=True)
+    email = body.get('email') if isinstance(body, dict) else None
+    if not isinstance(email, str):
+        return None
+    return email.strip().lower()[:320] or None
+
+def _check(policy: RateLimitPolicy, scope: str, model: Optional[Type[BaseModel]]) -> None:
+    if not policy.enabled:
+        return
+    # El cuerpo solo se lee si la IP no ha agotado su cupo
+    retry_after = policy.check(scope, client_ip(policy.proxy_hops), lambda: _request_email(model))
+    if retry_after is not None:
+        raise RateLimitExceededException(retry_after=max(1, math.ceil(retry_after)))
+
+@inject
+def check_rate_limit(
+    rate_limit_policy: RateLimitPolicy = Provide["auth.rate_limit_policy"]
+):
+    """before_request: límites de la vista (si es @rate_limited) antes del
+    control de admisión, para que un 429 no ocupe ni cuente como hueco"""
+    view = current_app.view_functions.get(request.endpoint)
+    rate_limit = getattr(view, 'rate_limit', None)
+    if rate_limit is None:
+        return None
+    g.rate_limit_checked = True
+    _check(rate_limit_policy, *rate_limit)
+    return None
+
+def install_rate_limiting(blueprint: Blueprint) -> None:
+    """Comprobar los límites de las vistas @rate_limited del blueprint antes
+    del resto de before_request (instalar antes que el control de admisión)"""
+    blueprint.before_request(check_rate_limit)
+
+def rate_limited(scope: str, model: Optional[Type[BaseModel]] = None):
+    """Decorator para limitar un endpoint de credenciales antes de tocar el
+    hash (429 + Retry-After vía errorhandler)
+    
+    Args:
+        scope: nombre del cupo ("login", "register"...)
+        model: DTO del cuerpo; si tiene email, ese campo del JSON (normalizado, sin
+            validar el resto del cuerpo) es la clave del cupo por email
+    
+    Con install_rate_limiting la comprobación se hace en before_request y
+    aquí no se repite.
+    """
+    def decorator(f):
+        @wraps(f)
+        @inject
+        def decorated_function(
+            *args,
+            rate_limit_policy: RateLimitPolicy = Provide["auth.rate_limit_policy"],
+            **kwargs
+        ):
+            if not g.get('rate_limit_checked'):
+                _check(rate_limit_policy, scope, model)
+            return f(*args, **kwargs)
+        decorated_function.rate_limit = (scope, model)
+        return decorated_function
+    return decorator
@@ -1,38 +1,76 @@
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify, current_app, g
+from pydantic import ValidationError
 from dependency_injector.wiring import inject, Provide
 from .....application.dto.auth_dto import (
     LoginRequestDTO, RegisterRequestDTO, RefreshTokenRequestDTO,
-    LogoutRequestDTO, VerifyTokenRequestDTO
+    LogoutRequestDTO, VerifyTokenRequestDTO, IntrospectBatchRequestDTO
 )
 from .....application.use_cases.login_user import LoginUserUseCase
 from .....application.use_cases.register_user import RegisterUserUseCase
-# from .....application.use_cases.refresh_token import RefreshTokenUseCase
-# from .....application.use_cases.logout_user import LogoutUserUseCase
-# from .....application.use_cases.verify_token import VerifyTokenUseCase
-from src.core.dependencies.containers import MainContainer as Container
-from ..schemas.auth_schemas import (
-    LoginSchema, RegisterSchema, RefreshTokenSchema,
-    LogoutSchema, VerifyTokenSchema, AuthResponseSchema
+from .....application.use_cases.bulk_import_users import BulkImportUsersUseCase
+from .....domain.exceptions.auth_exceptions import (
+    HashingOverloadedException, RateLimitExceededException, ServiceOverloadedException
 )
+from .....infrastructure.services.admission_controller import AdmissionController
+from .....infrastructure.repositories.cached_user_repository import UserCache
+from .....infrastructure.services.security.hashing_executor import HashingExecutor
+from .....infrastructure.services.security.password_rehasher import PasswordRehasher
+from .....infrastructure.services.security.jwt_handler import JWTService
+from .....infrastructure.services.security.key_ring import KeyRing
+from .....infrastructure.services.user_import_reader import read_user_rows, IMPORT_FORMATS
+from .....infrastructure.services.security.token_denylist import TokenDenylist
+from .....infrastructure.services.security.token_epochs import TokenEpochMap
+from .....infrastructure.services.security.rate_limiter import RateLimitPolicy
+from ..dependencies.auth_deps import admin_required, endpoint_enabled, token_required
+from ..dependencies.rate_limit_deps import install_rate_limiting, rate_limited
+from ..dependencies.admission_deps import install_admission_control
+# from .....application.use_cases.refresh_token import RefreshTokenUseCase
+from .....application.use_cases.logout_user import LogoutUserUseCase
+from .....application.use_cases.verify_token import VerifyTokenUseCase
+from .....application.use_cases.introspect_tokens import IntrospectTokensUseCase
+from ..schemas.auth_schemas import parse_body, validation_error_body
 
 # Crear blueprint para auth v1
 auth_bp = Blueprint('auth_v1', __name__, url_prefix='/api/v1/auth')
+# Rate limiting antes que la admisión: un 429 no ocupa hueco ni rechaza a otros con 503
+install_rate_limiting(auth_bp)
+install_admission_control(auth_bp)
+
+@auth_bp.errorhandler(ValidationError)
+def validation_error(error: ValidationError):
+    """Cuerpo inválido: 400 con los errores por campo"""
+    return jsonify(validation_error_body(error)), 400
+
+@auth_bp.errorhandler(HashingOverloadedException)
+def hashing_overloaded(error: HashingOverloadedException):
+    """Backpressure del pool de hashing: 503 + Retry-After"""
+    response = jsonify({"error": error.message, "code": error.code})
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response, 503
+
+@auth_bp.errorhandler(ServiceOverloadedException)
+def service_overloaded(error: ServiceOverloadedException):
+    """Control de admisión: 503 + Retry-After sin llegar a la vista"""
+    response = jsonify({"error": error.message, "code": error.code})
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response, 503
+
+@auth_bp.errorhandler(RateLimitExceededException)
+def rate_limit_exceeded(error: RateLimitExceededException):
+    """Límite de peticiones superado: 429 + Retry-After"""
+    response = jsonify({"error": error.message, "code": error.code})
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response, 429
 
 @auth_bp.route('/login', methods=['POST'])
+@rate_limited("login", LoginRequestDTO)
 @inject
 def login(
-    login_use_case: LoginUserUseCase = Provide[Container.auth.login_use_case]
+    login_use_case: LoginUserUseCase = Provide["auth.login_use_case"]
 ):
     """Login de usuario"""
-    # Validar input
-    schema = LoginSchema()
-    try:
-        data = schema.load(request.json)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
-    
-    # Convertir a DTO
-    login_request = LoginRequestDTO(**data)
+    # Cuerpo crudo -> DTO en una sola validación (ValidationError -> 400)
+    login_request = parse_body(LoginRequestDTO)
     
     # Ejecutar caso de uso
     result, error = login_use_case.execute(login_request)
@@ -40,51 +78,32 @@ def login(
     if error:
         return jsonify({"error": error}), 401
     
-    # Serializar respuesta
-    response_schema = AuthResponseSchema()
-    return jsonify(response_schema.dump(result)), 200
+    # DTO -> JSON con ORJSONProvider (mismo formato de fechas que un dict)
+    return jsonify(result), 200
 
 @auth_bp.route('/register', methods=['POST'])
+@rate_limited("register", RegisterRequestDTO)
 @inject
 def register(
-    register_use_case: RegisterUserUseCase = Provide[Container.auth.register_use_case]
+    register_use_case: RegisterUserUseCase = Provide["auth.register_use_case"]
 ):
     """Registro de usuario"""
-    schema = RegisterSchema()
-    try:
-        data = schema.load(request.json)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
-    
-    register_request = RegisterRequestDTO(**data)
+    register_request = parse_body(RegisterRequestDTO)
     
     result, error = register_use_case.execute(register_request)
     
     if error:
         return jsonify({"error": error}), 400
     
-    return jsonify({
-        "id": result.id,
-        "email": result.email,
-        "username": result.username,
-        "is_verified": result.is_verified,
-        "created_at": result.created_at.isoformat(),
-        "message": result.message
-    }), 201
+    return jsonify(result), 201
 
 # @auth_bp.route('/refresh', methods=['POST'])
 # @inject
 # def refresh_token(
-#     refresh_use_case: RefreshTokenUseCase = Provide[Container.auth.refresh_token_use_case]
+#     refresh_use_case: RefreshTokenUseCase = Provide["auth.refresh_token_use_case"]
 # ):
 #     """Refresh token"""
-#     schema = RefreshTokenSchema()
-#     try:
-#         data = schema.load(request.json)
-#     except Exception as e:
-#         return jsonify({"error": str(e)}), 400
-    
-#     refresh_request = RefreshTokenRequestDTO(**data)
+#     refresh_request = parse_body(RefreshTokenRequestDTO)
     
 #     result, error = refresh_use_case.execute(refresh_request)
     
@@ -98,55 +117,96 @@ def register(
 #         "expires_in": result.expires_in
 #     }), 200
 
-# @auth_bp.route('/logout', methods=['POST'])
-# @inject
-# def logout(
-#     logout_use_case: LogoutUserUseCase = Provide[Container.auth.logout_use_case]
-# ):
-#     """Logout de usuario"""
-#     schema = LogoutSchema()
-#     try:
-#         data = schema.load(request.json)
-#     except Exception as e:
-#         return jsonify({"error": str(e)}), 400
+@auth_bp.route('/logout', methods=['POST'])
+@token_required()
+@inject
+def logout(
+    logout_use_case: LogoutUserUseCase = Provide["auth.logout_use_case"]
+):
+    """Logout de usuario (revoca el access token del header)"""
+    logout_request = parse_body(LogoutRequestDTO)
     
-#     logout_request = LogoutRequestDTO(**data)
+    success, error = logout_use_case.execute(logout_request, g.access_token)
+    
+    if error:
+        return jsonify({"error": error}), 400
     
-#     success, error = logout_use_case.execute(logout_request)
+    return jsonify({"message": "Logged out successfully"}), 200
+
+@auth_bp.route('/verify', methods=['POST'])
+@inject
+def verify_token(
+    verify_use_case: VerifyTokenUseCase = Provide["auth.verify_token_use_case"]
+):
+    """Verificar token"""
+    verify_request = parse_body(VerifyTokenRequestDTO)
     
-#     if error:
-#         return jsonify({"error": error}), 400
+    result, error = verify_use_case.execute(verify_request)
     
-#     return jsonify({"message": "Logged out successfully"}), 200
+    if error:
+        return jsonify({"error": error}), 401
+    
+    return jsonify(result), 200
 
-# @auth_bp.route('/verify', methods=['POST'])
-# @inject
-# def verify_token(
-#     verify_use_case: VerifyTokenUseCase = Provide[Container.auth.verify_token_use_case]
-# ):
-#     """Verificar token"""
-#     schema = VerifyTokenSchema()
-#     try:
-#         data = schema.load(request.json)
-#     except Exception as e:
-#         return jsonify({"error": str(e)}), 400
+@auth_bp.route('/introspect/batch', methods=['POST'])
+@inject
+def introspect_batch(
+    introspect_use_case: IntrospectTokensUseCase = Provide["auth.introspect_tokens_use_case"]
+):
+    """Introspección de varios tokens en una llamada (gateways)"""
+    introspect_request = parse_body(IntrospectBatchRequestDTO)
     
-#     verify_request = VerifyTokenRequestDTO(**data)
+    result, error = introspect_use_case.execute(introspect_request)
     
-#     result, error = verify_use_case.execute(verify_request)
+    if error:
+        return jsonify({"error": error}), 413
     
-#     if error:
-#         return jsonify({"error": error}), 401
+    # El gateway cachea cada resultado hasta su `exp`; la respuesta en sí no
+    response = jsonify(result)
+    response.headers['Cache-Control'] = 'no-store'
+    return response, 200
+
+@auth_bp.route('/admin/users/import', methods=['POST'])
+@endpoint_enabled('AUTH_ADMIN_IMPORT_ENABLED')
+@admin_required()
+@inject
+def import_users(
+    bulk_import_use_case: BulkImportUsersUseCase = Provide["auth.bulk_import_users_use_case"]
+):
+    """Importación masiva de usuarios (cuerpo NDJSON o CSV en streaming)"""
+    fmt = request.args.get('format') or ('csv' if request.mimetype == 'text/csv' else 'ndjson')
+    if fmt not in IMPORT_FORMATS:
+        return jsonify({"error": f"Unsupported format: {fmt}"}), 400
     
-#     return jsonify({
-#         "is_valid": result.is_valid,
-#         "user_id": result.user_id,
-#         "email": result.email,
-#         "expires_at": result.expires_at.isoformat() if result.expires_at else None
-#     }), 200
+    report = bulk_import_use_case.execute(read_user_rows(request.stream, fmt))
+    return jsonify(report), 200
+
+@auth_bp.route('/.well-known/jwks.json', methods=['GET'])
+@inject
+def jwks(
+    jwt_key_ring: KeyRing = Provide["auth.jwt_key_ring"]
+):
+    """Claves públicas de firma para verificar tokens sin llamar a este servicio"""
+    response = jsonify(jwt_key_ring.jwks() if jwt_key_ring else {"keys": []})
+    # Una clave nueva se publica JWT_KEY_PUBLISH_AHEAD segundos antes de usarse,
+    # así que una caché de JWT_JWKS_MAX_AGE segundos nunca se queda atrás
+    response.cache_control.public = True
+    response.cache_control.max_age = current_app.config.get('JWT_JWKS_MAX_AGE', 300)
+    response.add_etag()
+    return response.make_conditional(request)
 
 @auth_bp.route('/health', methods=['GET'])
-def auth_health():
+@inject
+def auth_health(
+    user_cache: UserCache = Provide["auth.user_cache"],
+    hashing_executor: HashingExecutor = Provide["auth.hashing_executor"],
+    password_rehasher: PasswordRehasher = Provide["auth.password_rehasher"],
+    jwt_service: JWTService = Provide["auth.jwt_service"],
+    token_denylist: TokenDenylist = Provide["auth.token_denylist"],
+    token_epochs: TokenEpochMap = Provide["auth.token_epochs"],
+    rate_limit_policy: RateLimitPolicy = Provide["auth.rate_limit_policy"],
+    admission_controller: AdmissionController = Provide["auth.admission_controller"]
+):
     """Health check para feature auth"""
     return jsonify({
         "status": "healthy",
@@ -157,7 +217,17 @@ def auth_health():
             "/api/v1/auth/register",
             # "/api/v1/auth/refresh",
             "/api/v1/auth/logout",
-            "/api/v1/auth/verify"
-        ]
+            "/api/v1/auth/verify",
+            "/api/v1/auth/introspect/batch",
+            "/api/v1/auth/.well-known/jwks.json"
+        ],
+        "user_cache": user_cache.stats(),
+        "hashing": hashing_executor.stats(),
+        "rehash": password_rehasher.stats(),
+        "token_cache": jwt_service.token_cache.stats() if jwt_service.token_cache else None,
+        "revocation": token_denylist.stats(),
+        "token_epochs": token_epochs.stats(),
+        "rate_limits": rate_limit_policy.stats(),
+        "admission": admission_controller.stats()
     })
 
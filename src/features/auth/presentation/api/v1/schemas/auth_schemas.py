@@ -1,74 +1,31 @@
 # src/features/auth/presentation/api/v1/schemas/auth_schemas.py - VERSIÓN PYDANTIC
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional
-from datetime import datetime
+from typing import Any, Dict, Type, TypeVar
+from flask import request
+from pydantic import BaseModel, ValidationError
 
-class LoginSchema(BaseModel):
-    """Schema para login usando Pydantic"""
-    email: EmailStr
-    password: str = Field(..., min_length=1)
-    remember_me: bool = False
+# Los DTOs de application/dto son el esquema de cada request: una sola
+# validación, del cuerpo crudo al DTO, con el validador ya compilado del modelo
+M = TypeVar("M", bound=BaseModel)
 
-class RegisterSchema(BaseModel):
-    """Schema para registro usando Pydantic"""
-    email: EmailStr
-    username: str = Field(..., min_length=3, max_length=50, pattern=r'^[a-zA-Z0-9_]+$')
-    password: str = Field(..., min_length=8)
-    confirm_password: str = Field(..., min_length=8)
-    
-    @validator('password')
-    def validate_password(cls, v):
-        """Validar fortaleza del password"""
-        import re
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Must contain uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Must contain lowercase letter')
-        if not re.search(r'[0-9]', v):
-            raise ValueError('Must contain number')
-        if not re.search(r'[^A-Za-z0-9]', v):
-            raise ValueError('Must contain special character')
-        return v
-    
-    @validator('confirm_password')
-    def passwords_match(cls, v, values):
-        """Verificar que los passwords coincidan"""
-        if 'password' in values and v != values['password']:
-            raise ValueError('Passwords do not match')
-        return v
+def parse_body(model: Type[M]) -> M:
+    """DTO validado en una sola pasada desde el cuerpo crudo (JSON -> DTO en pydantic-core)
 
-class RefreshTokenSchema(BaseModel):
-    """Schema para refresh token"""
-    refresh_token: str
+    Un cuerpo vacío equivale a {}. Los errores se lanzan como ValidationError
+    y el errorhandler del blueprint responde 400 con `validation_error_body`.
+    """
+    return model.model_validate_json(request.get_data() or b"{}")
 
-class LogoutSchema(BaseModel):
-    """Schema para logout"""
-    refresh_token: Optional[str] = None
-
-class VerifyTokenSchema(BaseModel):
-    """Schema para verificar token"""
-    token: str
-
-# Schema para respuesta de usuario
-class UserResponseSchema(BaseModel):
-    """Schema para serializar usuario (response)"""
-    id: str
-    email: str
-    username: str
-    is_active: bool
-    is_verified: bool
-    last_login: Optional[datetime] = None
-    created_at: datetime
-    updated_at: datetime
-    
-    class Config:
-        from_attributes = True  # Permite crear desde ORM objects
-
-# Schema para respuesta de auth
-class AuthResponseSchema(BaseModel):
-    """Schema para respuestas de auth"""
-    access_token: str
-    refresh_token: str
-    token_type: str = "bearer"
-    expires_in: int
-    user: UserResponseSchema
\ No newline at end of file
+def validation_error_body(error: ValidationError) -> Dict[str, Any]:
+    """Cuerpo del 400: campo, tipo y mensaje de cada error (sin devolver los valores enviados)"""
+    return {
+        "error": "Invalid request body",
+        "code": "VALIDATION_ERROR",
+        "details": [
+            {
+                "field": ".".join(str(part) for part in item["loc"]),
+                "type": item["type"],
+                "message": item["msg"],
+            }
+            for item in error.errors(include_url=False, include_context=False, include_input=False)
+        ],
+    }
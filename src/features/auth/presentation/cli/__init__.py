@@ -0,0 +1,4 @@
+# src/features/auth/presentation/cli/__init__.py
+from .commands import auth_cli
+
+__all__ = ['auth_cli']
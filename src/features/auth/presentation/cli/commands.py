@@ -0,0 +1,249 @@
+# src/features/auth/presentation/cli/commands.py
+import json
+import time
+from collections import Counter
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from src.core.database.db import db
+from src.core.dependencies.containers import instance_file
+from ...infrastructure.services.security.jwt_handler import JWTService
+from ...infrastructure.services.security.jwt_codecs import JoseCodec, HMACCodec, HMAC_ALGORITHMS, ASYMMETRIC_ALGORITHMS
+from ...infrastructure.services.security.key_ring import KeyRing
+from ...infrastructure.services.security.hashing_profile import (
+    calibrate_argon2, calibrate_bcrypt, save_profile
+)
+from ...infrastructure.migrations.normalize_emails import normalize_emails, EMAIL_INDEX
+from ...infrastructure.migrations.token_epoch import add_token_epoch_columns, TOKEN_EPOCH_INDEX
+from ...infrastructure.migrations.lockout import add_lockout_column
+from ...infrastructure.services.user_import_reader import read_user_rows, IMPORT_FORMATS
+
+# Comandos de la feature auth: `flask auth <comando>`
+auth_cli = AppGroup('auth', help='Comandos de mantenimiento de autenticación')
+
+@auth_cli.command('prune-refresh-tokens')
+@click.option('--batch-size', default=10000, show_default=True, help='Filas borradas por lote')
+def prune_refresh_tokens(batch_size: int):
+    """Eliminar los refresh tokens expirados"""
+    user_repository = current_app.container.auth.user_repository()
+    deleted = user_repository.prune_expired_refresh_tokens(batch_size=batch_size)
+    click.echo(f"🧹 Refresh tokens expirados eliminados: {deleted}")
+
+@auth_cli.command('prune-revoked-tokens')
+@click.option('--batch-size', default=10000, show_default=True, help='Filas borradas por lote')
+def prune_revoked_tokens(batch_size: int):
+    """Eliminar de la denylist los tokens ya expirados"""
+    revoked_token_repository = current_app.container.auth.revoked_token_repository()
+    deleted = revoked_token_repository.prune_expired(batch_size=batch_size)
+    click.echo(f"🧹 Revocaciones expiradas eliminadas: {deleted}")
+
+@auth_cli.command('import-users')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(IMPORT_FORMATS), default=None,
+              help='Formato del fichero (por defecto según la extensión)')
+@click.option('--batch-size', type=int, default=None, help='Filas por lote (COPY)')
+@click.option('--workers', type=int, default=None, help='Procesos de hashing (por defecto nº de CPUs)')
+@click.option('--report', 'report_path', type=click.Path(dir_okay=False), default=None,
+              help='Guardar el reporte de errores por fila en JSON')
+def import_users(path: str, fmt: str, batch_size: int, workers: int, report_path: str):
+    """Importar usuarios desde NDJSON o CSV"""
+    fmt = fmt or ('csv' if path.lower().endswith('.csv') else 'ndjson')
+    
+    overrides = {}
+    if batch_size:
+        overrides['batch_size'] = batch_size
+    if workers:
+        overrides['parallel_hasher'] = current_app.container.auth.parallel_hasher(workers=workers)
+    use_case = current_app.container.auth.bulk_import_users_use_case(**overrides)
+    
+    with open(path, 'rb') as stream:
+        report = use_case.execute(read_user_rows(stream, fmt))
+    
+    click.echo(f"📥 Filas: {report.total} | importadas: {report.imported} | con error: {report.failed}")
+    for error in report.errors[:20]:
+        click.echo(f"   ❌ línea {error.line} ({error.email or '-'}): {error.error}")
+    if report.failed > 20:
+        click.echo(f"   ... y {report.failed - 20} errores más")
+    
+    if report_path:
+        with open(report_path, 'w') as f:
+            json.dump(report.model_dump(), f, indent=2)
+        click.echo(f"📝 Reporte guardado en {report_path}")
+
+@auth_cli.command('normalize-emails')
+@click.option('--dry-run', is_flag=True, help='Solo mostrar duplicados y filas a migrar')
+@click.option('--batch-size', default=10000, show_default=True, help='Filas actualizadas por lote')
+def normalize_emails_command(dry_run: bool, batch_size: int):
+    """Migrar emails a minúsculas y crear el índice único lower(email)"""
+    summary = normalize_emails(db.session, db.engine, dry_run=dry_run, batch_size=batch_size)
+    
+    for email, user_ids in summary["duplicates"].items():
+        click.echo(f"   👥 {email}: se conserva {user_ids[0]}, se eliminan {', '.join(user_ids[1:])}")
+    click.echo(f"📧 Emails a minúsculas: {summary['emails_lowercased']}")
+    click.echo(f"🗑️  Duplicados eliminados: {summary['duplicates_removed']} (grupos: {summary['duplicate_groups']})")
+    
+    if dry_run:
+        click.echo("ℹ️  Dry run: no se ha modificado nada")
+    else:
+        click.echo(f"✅ Índice {EMAIL_INDEX} creado")
+
+@auth_cli.command('add-lockout')
+def add_lockout():
+    """Añadir la columna locked_until (bloqueo temporal por intentos fallidos)"""
+    if add_lockout_column(db.engine):
+        click.echo("✅ Columna locked_until añadida")
+    else:
+        click.echo("ℹ️  La columna ya existía")
+
+@auth_cli.command('add-token-epoch')
+def add_token_epoch():
+    """Añadir las columnas de época de tokens (modo de autenticación "claims")"""
+    if add_token_epoch_columns(db.engine):
+        click.echo("✅ Columnas token_epoch y token_epoch_at añadidas")
+    else:
+        click.echo("ℹ️  Las columnas ya existían")
+    click.echo(f"✅ Índice {TOKEN_EPOCH_INDEX} disponible")
+
+@auth_cli.command('calibrate-hashing')
+@click.option('--name', required=True, help='Nombre del perfil (p. ej. small-node, large-node)')
+@click.option('--algorithm', type=click.Choice(['argon2', 'bcrypt']), default=None,
+              help='Algoritmo del perfil (por defecto PASSWORD_ALGORITHM)')
+@click.option('--target-ms', default=250.0, show_default=True, help='Latencia objetivo de verify (ms)')
+@click.option('--memory-budget-mb', type=int, default=None,
+              help='Memoria máxima para hashes simultáneos (por defecto PASSWORD_HASH_MEMORY_BUDGET_MB)')
+@click.option('--parallelism', type=int, default=None, help='Lanes de argon2 (por defecto según CPUs)')
+@click.option('--file', 'path', default=None, help='Fichero de perfiles (por defecto PASSWORD_HASH_PROFILES_FILE)')
+def calibrate_hashing(name: str, algorithm: str, target_ms: float, memory_budget_mb: int, parallelism: int, path: str):
+    """Medir argon2 y bcrypt en este host y guardar un perfil de costes"""
+    algorithm = algorithm or current_app.config.get('PASSWORD_ALGORITHM', 'argon2')
+    memory_budget_mb = memory_budget_mb or current_app.config.get('PASSWORD_HASH_MEMORY_BUDGET_MB', 1024)
+    path = path or instance_file(current_app, current_app.config.get('PASSWORD_HASH_PROFILES_FILE', 'hashing_profiles.json'))
+    
+    click.echo(f"⏱️  Calibrando para {target_ms:.0f} ms por verify (presupuesto {memory_budget_mb} MiB)...")
+    profiles = {
+        'argon2': calibrate_argon2(name, target_ms, memory_budget_mb, parallelism),
+        'bcrypt': calibrate_bcrypt(name, target_ms),
+    }
+    
+    argon2_profile = profiles['argon2']
+    click.echo(
+        f"   argon2: time_cost={argon2_profile.time_cost} memory_cost={argon2_profile.memory_cost} KiB "
+        f"parallelism={argon2_profile.parallelism} -> {argon2_profile.verify_ms} ms"
+    )
+    click.echo(f"   bcrypt: rounds={profiles['bcrypt'].bcrypt_rounds} -> {profiles['bcrypt'].verify_ms} ms")
+    
+    # El perfil guarda los costes de ambos algoritmos; `algorithm` decide con cuál se hashea
+    profile = profiles[algorithm]
+    profile.time_cost = argon2_profile.time_cost
+    profile.memory_cost = argon2_profile.memory_cost
+    profile.parallelism = argon2_profile.parallelism
+    profile.bcrypt_rounds = profiles['bcrypt'].bcrypt_rounds
+    
+    save_profile(path, profile)
+    click.echo(f"✅ Perfil '{name}' ({algorithm}) guardado en {path}")
+    click.echo(f"   Activar con PASSWORD_HASH_PROFILE={name}")
+
+@auth_cli.command('hash-report')
+@click.option('--batch-size', default=10000, show_default=True, help='Filas leídas por lote')
+def hash_report(batch_size: int):
+    """Usuarios por esquema y parámetros de hash (pendientes de migrar)"""
+    password_hasher = current_app.container.auth.password_hasher()
+    user_repository = current_app.container.auth.user_repository()
+    
+    counts = Counter()
+    outdated = {}
+    for hashed_password in user_repository.iter_password_hashes(batch_size):
+        scheme = password_hasher.hash_scheme(hashed_password)
+        counts[scheme] += 1
+        if scheme not in outdated:
+            outdated[scheme] = password_hasher.needs_rehash(hashed_password)
+    
+    total = sum(counts.values())
+    pending = sum(count for scheme, count in counts.items() if outdated[scheme])
+    click.echo(f"🔐 Usuarios: {total} | pendientes de rehash: {pending}")
+    for scheme, count in counts.most_common():
+        status = "⚠️  rehash" if outdated[scheme] else "✅ actual"
+        click.echo(f"   {status}  {count:>8}  {scheme}")
+
+@auth_cli.command('benchmark-jwt')
+@click.option('--iterations', default=20000, show_default=True, help='Tokens por medición')
+@click.option('--algorithm', type=click.Choice(sorted(HMAC_ALGORITHMS)), default=None,
+              help='Algoritmo HMAC (por defecto JWT_ALGORITHM)')
+def benchmark_jwt(iterations: int, algorithm: str):
+    """Comparar el codec HMAC con python-jose (crear y verificar access tokens)"""
+    algorithm = algorithm or current_app.config.get('JWT_ALGORITHM', 'HS256')
+    if algorithm not in HMAC_ALGORITHMS:
+        raise click.BadParameter(f"{algorithm} no es un algoritmo HMAC", param_hint='--algorithm')
+    
+    secret_key = current_app.config['JWT_SECRET_KEY']
+    issuer = current_app.config.get('JWT_ISSUER')
+    audience = current_app.config.get('JWT_AUDIENCE')
+    claims = {"sub": "00000000-0000-0000-0000-000000000000", "email": "bench@example.com",
+              "username": "bench", "is_verified": True}
+    
+    results = {}
+    for name, codec in (('jose', JoseCodec(secret_key, algorithm)), ('hmac', HMACCodec(secret_key, algorithm))):
+        service = JWTService(secret_key, algorithm, issuer, audience, codec=codec)
+        
+        start = time.perf_counter()
+        for _ in range(iterations):
+            token = service.create_access_token(claims)
+        encode_us = (time.perf_counter() - start) / iterations * 1e6
+        
+        start = time.perf_counter()
+        for _ in range(iterations):
+            payload = service.verify_token(token)
+        verify_us = (time.perf_counter() - start) / iterations * 1e6
+        
+        if payload is None or payload["sub"] != claims["sub"]:
+            raise click.ClickException(f"El codec {name} no verifica sus propios tokens")
+        results[name] = (encode_us, verify_us)
+        click.echo(f"   {name:<5} encode: {encode_us:8.2f} µs/token   verify: {verify_us:8.2f} µs/token")
+    
+    # Los tokens deben ser intercambiables entre backends
+    jose_service = JWTService(secret_key, algorithm, issuer, audience, codec=JoseCodec(secret_key, algorithm))
+    hmac_service = JWTService(secret_key, algorithm, issuer, audience, codec=HMACCodec(secret_key, algorithm))
+    if not jose_service.verify_token(hmac_service.create_access_token(claims)) \
+            or not hmac_service.verify_token(jose_service.create_access_token(claims)):
+        raise click.ClickException("Los tokens no son compatibles entre codecs")
+    
+    (jose_encode, jose_verify), (hmac_encode, hmac_verify) = results['jose'], results['hmac']
+    click.echo(f"⚡ {algorithm}: encode x{jose_encode / hmac_encode:.1f}, verify x{jose_verify / hmac_verify:.1f} (hmac vs jose)")
+
+@auth_cli.command('rotate-keys')
+@click.option('--algorithm', type=click.Choice(ASYMMETRIC_ALGORITHMS), default=None,
+              help='Algoritmo de la nueva clave (por defecto JWT_ALGORITHM)')
+@click.option('--force', is_flag=True, help='Rotar aunque la clave actual no haya cumplido JWT_KEY_ROTATION_DAYS')
+def rotate_keys(algorithm: str, force: bool):
+    """Rotar la clave de firma JWT (pensado para cron: solo rota cuando toca)"""
+    config = current_app.config
+    key_ring = current_app.container.auth.jwt_key_ring()
+    if key_ring is None:
+        # Con HS* se pueden preparar las claves antes de cambiar ALGORITHM
+        if not algorithm:
+            raise click.UsageError(f"JWT_ALGORITHM={config.get('JWT_ALGORITHM')} no usa claves; indica --algorithm")
+        key_ring = KeyRing(
+            instance_file(current_app, config.get('JWT_KEYS_FILE', 'jwt_keys.json')),
+            algorithm,
+            publish_ahead=config.get('JWT_KEY_PUBLISH_AHEAD', 600),
+            retain=config.get('JWT_KEY_RETAIN_SECONDS', 2592000)
+        )
+    
+    max_age = config.get('JWT_KEY_ROTATION_DAYS', 30) * 86400
+    if force or key_ring.due_for_rotation(max_age):
+        new_key = key_ring.rotate(algorithm)
+        click.echo(f"🔑 Nueva clave {new_key.kid} ({new_key.algorithm}), "
+                   f"firma a partir de {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(new_key.activates_at))}")
+    else:
+        click.echo("✅ La clave actual aún no necesita rotación (usa --force para rotar igualmente)")
+    
+    now = time.time()
+    for key in key_ring.keys():
+        if key.activates_at > now:
+            status = "publicada"
+        elif key.retired_at is None or key.retired_at > now:
+            status = "activa"
+        else:
+            status = "retirada"
+        expires = time.strftime('%Y-%m-%d', time.localtime(key.expires_at)) if key.expires_at else '-'
+        click.echo(f"   {status:<10} {key.kid}  {key.algorithm:<6} caduca: {expires}")
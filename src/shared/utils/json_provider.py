@@ -0,0 +1,59 @@
+# src/shared/utils/json_provider.py
+from datetime import datetime
+from typing import Any, Union
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+from pydantic import BaseModel
+
+# Fechas y horas pasan por `default` para mantener el formato del provider anterior
+_DUMPS_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON de Flask (request.get_json, jsonify) con orjson
+
+    - datetime como '%Y-%m-%dT%H:%M:%S' (igual que el provider anterior);
+      el resto de tipos extra (date, Decimal, Markup...) como en Flask
+    - `jsonify(dto)` con un modelo pydantic vuelca sus campos (sin
+      revalidación) y los serializa con orjson, así las fechas de los DTOs
+      salen con el mismo formato que las de un dict
+    - Si orjson no puede (p. ej. enteros > 64 bits o kwargs de json.dumps),
+      se usa la implementación de la librería estándar
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if not kwargs:
+            try:
+                return self._dumps_bytes(obj).decode()
+            except orjson.JSONEncodeError:
+                pass
+        kwargs.setdefault("default", self._default)
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+
+        try:
+            body = self._dumps_bytes(obj, orjson.OPT_INDENT_2 if indent else 0)
+        except orjson.JSONEncodeError:
+            return super().response(obj)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+    def _dumps_bytes(self, obj: Any, option: int = 0) -> bytes:
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self._default, option=_DUMPS_OPTIONS | option)
+
+    def _default(self, obj: Any) -> Any:
+        if isinstance(obj, datetime):
+            return obj.strftime('%Y-%m-%dT%H:%M:%S')
+        if isinstance(obj, BaseModel):
+            # Modo python: los datetime vuelven a pasar por aquí
+            return obj.model_dump()
+        return self.default(obj)
@@ -0,0 +1,67 @@
+# tests/conftest.py
+import os
+import sys
+
+import pytest
+from flask import Flask
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# config lee el entorno al importarse: fijarlo antes de crear la app
+os.environ.update({
+    "FLASK_ENV": "testing",
+    "DATABASE_URL": "sqlite://",
+    "JWT_KEY": "test-jwt-key",
+    "SECRET_KEY": "test-secret-key",
+    "LAZY_STARTUP": "true",
+    "PASSWORD_ALGORITHM": "bcrypt",
+    "AUTH_RATE_LIMIT_FILE": "",
+})
+
+@pytest.fixture
+def make_app(tmp_path, monkeypatch):
+    """Crear una app de test con su propia base SQLite; `overrides` ajusta la configuración"""
+    from app import create_app
+    from config import TestingConfig
+    from src.core.database.db import db, Base
+
+    # instance/ (ficheros de claves, perfiles, tabla de rate limit) dentro de tmp_path
+    monkeypatch.setattr(Flask, "auto_find_instance_path", lambda self: str(tmp_path / "instance"))
+
+    def factory(**overrides):
+        settings = {
+            "DATABASE_URL": f"sqlite:///{tmp_path / 'auth.db'}",
+            # Sin recargas de fondo durante los tests
+            "AUTH_REVOCATION_REFRESH_SECONDS": 3600,
+            **overrides,
+        }
+        for name, value in settings.items():
+            monkeypatch.setattr(TestingConfig, name, value, raising=False)
+
+        app = create_app(testing=True)
+        with app.app_context():
+            Base.metadata.create_all(db.engine)
+        return app
+
+    return factory
+
+@pytest.fixture
+def app(make_app):
+    return make_app()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def register_user():
+    """Registrar un usuario por la API y devolver sus credenciales"""
+    def register(client, email="ana@example.com", username="ana", password="Passw0rd!"):
+        response = client.post('/api/v1/auth/register', json={
+            "email": email, "username": username,
+            "password": password, "confirm_password": password,
+        })
+        assert response.status_code == 201, response.get_json()
+        return {"email": email, "password": password, "id": response.get_json()["id"]}
+    return register
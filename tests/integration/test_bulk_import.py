@@ -0,0 +1,66 @@
+# tests/integration/test_bulk_import.py
+from sqlalchemy import text
+
+from src.core.database.db import db
+
+IMPORT_URL = '/api/v1/auth/admin/users/import'
+ADMIN = {"email": "admin@example.com", "username": "admin", "password": "Passw0rd!"}
+
+def _admin_headers(app, client, register_user):
+    register_user(client, **ADMIN)
+    with app.app_context():
+        db.session.execute(text("UPDATE users SET is_verified = 1"))
+        db.session.commit()
+    app.container.auth.user_cache().clear()
+    response = client.post('/api/v1/auth/login', json={"email": ADMIN["email"], "password": ADMIN["password"]})
+    return {"Authorization": f"Bearer {response.get_json()['access_token']}"}
+
+def _import_app(make_app):
+    return make_app(
+        AUTH_ADMIN_IMPORT_ENABLED=True,
+        AUTH_ADMIN_EMAILS=frozenset({ADMIN["email"]}),
+        AUTH_IMPORT_HASH_WORKERS=1,
+        AUTH_RATE_LIMIT_ENABLED=False,
+    )
+
+def test_import_is_disabled_by_default(app, client, register_user):
+    headers = _admin_headers(app, client, register_user)
+    assert client.post(IMPORT_URL, data="", headers=headers).status_code == 404
+
+def test_import_requires_admin_allowlist(make_app, register_user):
+    app = make_app(AUTH_ADMIN_IMPORT_ENABLED=True, AUTH_RATE_LIMIT_ENABLED=False)
+    client = app.test_client()
+    headers = _admin_headers(app, client, register_user)
+    assert client.post(IMPORT_URL, data="", headers=headers).status_code == 403
+
+def test_ndjson_import_reports_invalid_and_duplicate_rows(make_app, register_user):
+    app = _import_app(make_app)
+    client = app.test_client()
+    headers = _admin_headers(app, client, register_user)
+
+    body = "\n".join([
+        '{"email": "bea@example.com", "username": "bea", "password": "Passw0rd!"}',
+        '{"email": "not-an-email", "username": "bad", "password": "Passw0rd!"}',
+        '{"email": "ADMIN@example.com", "username": "other", "password": "Passw0rd!"}',
+        '{"email": "carl@example.com", "username": "carl", "hashed_password": "$2b$04$abcdefghijklmnopqrstuu5Zy0zNXqOC9XnO1uCYHNbkPqPmpbIy"}',
+    ])
+    response = client.post(IMPORT_URL, data=body, headers=headers)
+
+    assert response.status_code == 200
+    report = response.get_json()
+    assert (report["total"], report["imported"], report["failed"]) == (4, 2, 2)
+    assert sorted(error["line"] for error in report["errors"]) == [2, 3]
+
+    login = client.post('/api/v1/auth/login', json={"email": "bea@example.com", "password": "Passw0rd!"})
+    assert login.status_code == 200
+
+def test_csv_import(make_app, register_user):
+    app = _import_app(make_app)
+    client = app.test_client()
+    headers = {**_admin_headers(app, client, register_user), "Content-Type": "text/csv"}
+
+    body = "email,username,password\ndana@example.com,dana,Passw0rd!\n"
+    response = client.post(IMPORT_URL, data=body, headers=headers)
+
+    assert response.status_code == 200
+    assert response.get_json()["imported"] == 1
@@ -0,0 +1,70 @@
+# tests/integration/test_email_case.py
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+from sqlalchemy import text
+
+from src.core.database.db import db
+from src.features.auth.infrastructure.migrations.normalize_emails import normalize_emails
+from src.features.auth.infrastructure.models.user_model import UserModel
+from src.features.auth.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+@pytest.fixture
+def app(make_app):
+    return make_app(AUTH_RATE_LIMIT_ENABLED=False)
+
+def test_email_is_stored_lowercase_and_found_in_any_case(app, client, register_user):
+    user = register_user(client, email="Ana.Perez@Example.COM")
+
+    with app.app_context():
+        assert db.session.get(UserModel, UUID(user["id"])).email == "ana.perez@example.com"
+        repository = UserRepositoryImpl(db.session)
+        assert repository.find_by_email("ANA.PEREZ@example.com").id == user["id"]
+        assert repository.exists_by_email(" ana.perez@EXAMPLE.com ")
+
+    response = client.post('/api/v1/auth/login', json={
+        "email": "ana.perez@EXAMPLE.com", "password": user["password"]
+    })
+    assert response.status_code == 200
+
+def test_email_uniqueness_ignores_case(client, register_user):
+    register_user(client, email="ana@example.com")
+
+    response = client.post('/api/v1/auth/register', json={
+        "email": "ANA@example.com", "username": "ana2",
+        "password": "Passw0rd!", "confirm_password": "Passw0rd!",
+    })
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Email already exists"}
+
+def test_migration_merges_case_duplicates_and_creates_the_index(app, client, register_user):
+    keep = register_user(client, email="ana@example.com", username="ana")
+    drop = register_user(client, email="otra@example.com", username="ana2")
+    register_user(client, email="luis@example.com", username="luis")
+
+    with app.app_context():
+        # Estado previo a la migración: índice antiguo y emails con mayúsculas
+        with db.engine.begin() as connection:
+            connection.execute(text("DROP INDEX uq_users_email_lower"))
+            connection.execute(text("CREATE UNIQUE INDEX ix_users_email ON users (email)"))
+        db.session.query(UserModel).filter_by(username="ana2").update({"email": "ANA@Example.com"})
+        db.session.query(UserModel).filter_by(username="ana").update({"last_login": datetime.utcnow()})
+        db.session.query(UserModel).filter_by(username="luis").update({"email": "Luis@Example.com"})
+        db.session.commit()
+
+        dry_run = normalize_emails(db.session, db.engine, dry_run=True)
+        assert dry_run["duplicates"] == {"ana@example.com": [keep["id"], drop["id"]]}
+        assert dry_run["emails_lowercased"] == 2
+        assert not dry_run["index_created"]
+
+        summary = normalize_emails(db.session, db.engine, batch_size=1)
+        assert summary["duplicates_removed"] == 1 and summary["index_created"]
+
+        emails = dict(db.session.query(UserModel.username, UserModel.email))
+        assert emails == {"ana": "ana@example.com", "luis": "luis@example.com"}
+        # SQLAlchemy no refleja índices de expresión en SQLite
+        indexes = set(db.session.scalars(text(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'users'"
+        )))
+        assert "uq_users_email_lower" in indexes and "ix_users_email" not in indexes
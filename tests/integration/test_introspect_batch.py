@@ -0,0 +1,80 @@
+# tests/integration/test_introspect_batch.py
+import pytest
+
+from src.features.auth.infrastructure.repositories.cached_user_repository import CachedUserRepository
+
+URL = '/api/v1/auth/introspect/batch'
+
+def _login(client, user):
+    response = client.post('/api/v1/auth/login', json={
+        "email": user["email"], "password": user["password"]
+    })
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()["access_token"]
+
+@pytest.fixture
+def tokens(make_app, register_user):
+    app = make_app(AUTH_RATE_LIMIT_ENABLED=False, AUTH_INTROSPECT_MAX_TOKENS=5)
+    client = app.test_client()
+    ana = register_user(client)
+    luis = register_user(client, email="luis@example.com", username="luis")
+    return app, client, _login(client, ana), _login(client, luis)
+
+def test_results_follow_request_order_with_duplicates(tokens):
+    app, client, ana, luis = tokens
+
+    response = client.post(URL, json={"tokens": [luis, "no-es-un-jwt", ana, luis]})
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'no-store'
+
+    results = response.get_json()["results"]
+    assert [result["active"] for result in results] == [True, False, True, True]
+    assert [result.get("email") for result in results] == [
+        "luis@example.com", None, "ana@example.com", "luis@example.com"
+    ]
+    assert results[1]["error"] == "Invalid or expired token"
+    # El duplicado repite el mismo resultado
+    assert results[3] == results[0]
+
+def test_each_distinct_token_is_verified_once(tokens, monkeypatch):
+    app, client, ana, luis = tokens
+    token_service = app.container.auth.jwt_service()
+    verified, lookups = [], []
+
+    verify_token = token_service.verify_token
+    monkeypatch.setattr(token_service, "verify_token",
+                        lambda token: verified.append(token) or verify_token(token))
+    # El repositorio es Factory: espiar la clase
+    find_by_ids = CachedUserRepository.find_by_ids
+    monkeypatch.setattr(CachedUserRepository, "find_by_ids",
+                        lambda self, ids: lookups.append(list(ids)) or find_by_ids(self, ids))
+
+    response = client.post(URL, json={"tokens": [ana, ana, luis, ana, luis]})
+    assert response.status_code == 200
+    assert len(response.get_json()["results"]) == 5
+
+    assert sorted(verified) == sorted([ana, luis])
+    # Un único find_by_ids para todos los usuarios del lote
+    assert len(lookups) == 1 and len(lookups[0]) == 2
+
+def test_revoked_token_is_reported(tokens):
+    app, client, ana, luis = tokens
+
+    assert client.post('/api/v1/auth/logout', json={},
+                       headers={"Authorization": f"Bearer {ana}"}).status_code == 200
+
+    results = client.post(URL, json={"tokens": [ana, luis]}).get_json()["results"]
+    assert results[0] == {**results[0], "active": False, "error": "Token has been revoked"}
+    assert results[1]["active"] is True
+
+def test_batch_over_the_limit_is_rejected(tokens):
+    app, client, ana, luis = tokens
+
+    response = client.post(URL, json={"tokens": [ana] * 6})
+    assert response.status_code == 413
+    assert "error" in response.get_json()
+
+def test_empty_batch_is_a_validation_error(tokens):
+    app, client, ana, luis = tokens
+
+    assert client.post(URL, json={"tokens": []}).status_code == 400
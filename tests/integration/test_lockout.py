@@ -0,0 +1,91 @@
+# tests/integration/test_lockout.py
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import update
+
+from src.core.database.db import db
+from src.features.auth.application.dto.auth_dto import LoginRequestDTO
+from src.features.auth.infrastructure.models.user_model import UserModel
+
+LOCKED = "Account is locked due to multiple failed attempts"
+
+def _login(client, email, password):
+    return client.post('/api/v1/auth/login', json={"email": email, "password": password})
+
+def _user_row(app, user_id):
+    with app.app_context():
+        return db.session.get(UserModel, UUID(user_id))
+
+def test_account_locks_after_max_failed_attempts(make_app, register_user):
+    app = make_app(AUTH_MAX_FAILED_LOGIN_ATTEMPTS=3, AUTH_RATE_LIMIT_ENABLED=False)
+    client = app.test_client()
+    user = register_user(client)
+
+    for _ in range(3):
+        assert _login(client, user["email"], "Wrong-pass1").status_code == 401
+
+    # Bloqueada: ni siquiera el password correcto entra
+    response = _login(client, user["email"], user["password"])
+    assert response.status_code == 401
+    assert response.get_json()["error"] == LOCKED
+
+    row = _user_row(app, user["id"])
+    assert row.failed_login_attempts == 3
+    assert row.locked_until > datetime.utcnow()
+
+def test_lock_expires_and_successful_login_resets_counter(make_app, register_user):
+    app = make_app(AUTH_MAX_FAILED_LOGIN_ATTEMPTS=2, AUTH_RATE_LIMIT_ENABLED=False)
+    client = app.test_client()
+    user = register_user(client)
+
+    for _ in range(2):
+        _login(client, user["email"], "Wrong-pass1")
+    assert _login(client, user["email"], user["password"]).get_json()["error"] == LOCKED
+
+    # Ventana de bloqueo vencida
+    with app.app_context():
+        db.session.execute(
+            update(UserModel)
+            .where(UserModel.id == UUID(user["id"]))
+            .values(locked_until=datetime.utcnow() - timedelta(seconds=1))
+        )
+        db.session.commit()
+    app.container.auth.user_cache().clear()
+
+    assert _login(client, user["email"], user["password"]).status_code == 200
+    row = _user_row(app, user["id"])
+    assert row.failed_login_attempts == 0
+    assert row.locked_until is None
+
+def test_failed_attempts_below_threshold_do_not_lock(make_app, register_user):
+    app = make_app(AUTH_MAX_FAILED_LOGIN_ATTEMPTS=3, AUTH_RATE_LIMIT_ENABLED=False)
+    client = app.test_client()
+    user = register_user(client)
+
+    for _ in range(2):
+        _login(client, user["email"], "Wrong-pass1")
+
+    assert _login(client, user["email"], user["password"]).status_code == 200
+
+def test_correct_password_does_not_clear_a_concurrent_lock(make_app, register_user):
+    app = make_app(AUTH_RATE_LIMIT_ENABLED=False)
+    client = app.test_client()
+    user = register_user(client)
+
+    with app.test_request_context():
+        use_case = app.container.auth.login_use_case()
+        # Lectura sin el bloqueo (réplica con retraso o intento fallido concurrente)
+        stale = use_case.user_repository.find_by_email(user["email"])
+        locked_until = datetime.utcnow() + timedelta(minutes=15)
+        db.session.execute(
+            update(UserModel).where(UserModel.id == UUID(user["id"])).values(locked_until=locked_until)
+        )
+        db.session.commit()
+        use_case.user_repository.find_by_email = lambda email: stale
+
+        response, error = use_case.execute(LoginRequestDTO(email=user["email"], password=user["password"]))
+
+    assert response is None
+    assert error == LOCKED
+    assert _user_row(app, user["id"]).locked_until == locked_until
@@ -0,0 +1,55 @@
+# tests/integration/test_login.py
+from datetime import datetime, timedelta
+from uuid import UUID
+
+import pytest
+from sqlalchemy import event
+
+from src.core.database.db import db
+from src.features.auth.infrastructure.models.user_model import UserModel
+
+@pytest.fixture
+def app(make_app):
+    return make_app(AUTH_RATE_LIMIT_ENABLED=False)
+
+def _login(client, user, password=None):
+    return client.post('/api/v1/auth/login', json={
+        "email": user["email"], "password": password or user["password"]
+    })
+
+def test_login_is_one_read_one_write_and_one_commit(app, client, register_user):
+    user = register_user(client)
+    with app.app_context():
+        engine = db.engine
+
+    statements = []
+    on_execute = lambda conn, cursor, statement, *args: statements.append(statement.split()[0])
+    on_commit = lambda conn: statements.append("COMMIT")
+    event.listen(engine, "before_cursor_execute", on_execute)
+    event.listen(engine, "commit", on_commit)
+    try:
+        assert _login(client, user).status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+        event.remove(engine, "commit", on_commit)
+
+    # Lectura del usuario, UPDATE ... RETURNING e INSERT del refresh token (SQLite)
+    assert statements == ["SELECT", "UPDATE", "INSERT", "COMMIT"]
+
+def test_login_resets_attempts_and_returns_the_user(app, client, register_user):
+    user = register_user(client)
+    assert _login(client, user, password="Wr0ngpass!").status_code == 401
+
+    started = datetime.utcnow() - timedelta(seconds=1)
+    response = _login(client, user)
+    assert response.status_code == 200
+    assert response.get_json()["user"] == {
+        "id": user["id"], "email": user["email"], "username": "ana",
+        "is_verified": False, "is_active": True,
+    }
+
+    with app.app_context():
+        row = db.session.get(UserModel, UUID(user["id"]))
+        assert row.failed_login_attempts == 0
+        assert row.locked_until is None
+        assert row.last_login >= started
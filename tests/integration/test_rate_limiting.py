@@ -0,0 +1,26 @@
+# tests/integration/test_rate_limiting.py
+def _register(client, email, password="weak"):
+    return client.post('/api/v1/auth/register', json={
+        "email": email, "username": "ana", "password": password, "confirm_password": password,
+    })
+
+def test_email_limit_applies_before_body_validation(make_app):
+    app = make_app(AUTH_RATE_LIMIT_PER_IP="100/minute", AUTH_RATE_LIMIT_PER_EMAIL="2/minute")
+    client = app.test_client()
+
+    # Cuerpo inválido (password débil): el limitador solo lee el email
+    assert _register(client, "ana@example.com").status_code == 400
+    assert _register(client, " Ana@Example.com").status_code == 400
+    response = _register(client, "ANA@example.com")
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert _register(client, "bea@example.com").status_code == 400
+
+def test_ip_limit_applies_to_unparseable_bodies(make_app):
+    app = make_app(AUTH_RATE_LIMIT_PER_IP="2/minute")
+    client = app.test_client()
+
+    for _ in range(2):
+        assert client.post('/api/v1/auth/login', data="not json").status_code == 400
+    assert client.post('/api/v1/auth/login', data="not json").status_code == 429
@@ -0,0 +1,87 @@
+# tests/integration/test_refresh_tokens.py
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from src.core.database.db import db
+from src.features.auth.infrastructure.models.refresh_token_model import RefreshTokenModel
+from src.features.auth.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+@pytest.fixture
+def app(make_app):
+    return make_app(AUTH_RATE_LIMIT_ENABLED=False)
+
+def _login(client, user):
+    response = client.post('/api/v1/auth/login', json={
+        "email": user["email"], "password": user["password"]
+    })
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+def _rows():
+    return db.session.scalars(select(RefreshTokenModel)).all()
+
+def test_login_stores_one_hashed_row_per_token(app, client, register_user):
+    user = register_user(client)
+    first, second = _login(client, user), _login(client, user)
+
+    with app.app_context():
+        rows = _rows()
+        assert {row.token_hash for row in rows} == {
+            RefreshTokenModel.hash_token(first["refresh_token"]),
+            RefreshTokenModel.hash_token(second["refresh_token"]),
+        }
+        # Cada login abre su propia familia y guarda la expiración real
+        assert len({row.family_id for row in rows}) == 2
+        assert all(row.expires_at > datetime.utcnow() + timedelta(days=6) for row in rows)
+
+        repository = UserRepositoryImpl(db.session)
+        assert repository.has_refresh_token(user["id"], first["refresh_token"])
+        assert not repository.has_refresh_token(user["id"], "otro-token")
+
+def test_logout_removes_only_the_sent_refresh_token(app, client, register_user):
+    user = register_user(client)
+    first, second = _login(client, user), _login(client, user)
+
+    response = client.post('/api/v1/auth/logout', json={"refresh_token": first["refresh_token"]},
+                           headers={"Authorization": f"Bearer {first['access_token']}"})
+    assert response.status_code == 200
+
+    with app.app_context():
+        repository = UserRepositoryImpl(db.session)
+        assert not repository.has_refresh_token(user["id"], first["refresh_token"])
+        assert repository.has_refresh_token(user["id"], second["refresh_token"])
+
+def test_add_is_idempotent_and_revocations_by_family_and_user(app, client, register_user):
+    ana = register_user(client)
+    luis = register_user(client, email="luis@example.com", username="luis")
+
+    with app.app_context():
+        repository = UserRepositoryImpl(db.session)
+        repository.add_refresh_token(ana["id"], "a1", family_id="f1")
+        repository.add_refresh_token(ana["id"], "a1", family_id="f1")
+        repository.add_refresh_token(ana["id"], "a2", family_id="f1")
+        repository.add_refresh_token(ana["id"], "a3", family_id="f2")
+        repository.add_refresh_token(luis["id"], "l1", family_id="f3")
+        assert len(_rows()) == 4
+
+        assert repository.revoke_refresh_token_family("f1") == 2
+        assert repository.has_refresh_token(ana["id"], "a3")
+        assert repository.revoke_all_refresh_tokens(ana["id"]) == 1
+        assert [str(row.user_id) for row in _rows()] == [luis["id"]]
+
+def test_expired_tokens_are_invisible_and_pruned_in_batches(app, client, register_user):
+    user = register_user(client)
+    now = datetime.utcnow()
+
+    with app.app_context():
+        repository = UserRepositoryImpl(db.session)
+        for index in range(5):
+            repository.add_refresh_token(user["id"], f"old-{index}", expires_at=now - timedelta(minutes=1))
+        repository.add_refresh_token(user["id"], "live", expires_at=now + timedelta(days=1))
+
+        assert not repository.has_refresh_token(user["id"], "old-0")
+        assert repository.prune_expired_refresh_tokens(batch_size=2) == 5
+        assert db.session.scalar(select(func.count()).select_from(RefreshTokenModel)) == 1
+        assert repository.has_refresh_token(user["id"], "live")
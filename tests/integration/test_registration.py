@@ -0,0 +1,51 @@
+# tests/integration/test_registration.py
+import pytest
+from sqlalchemy import event
+
+from src.core.database.db import db
+from src.features.auth.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+@pytest.fixture
+def app(make_app):
+    return make_app(AUTH_RATE_LIMIT_ENABLED=False)
+
+def _register(client, email, username):
+    return client.post('/api/v1/auth/register', json={
+        "email": email, "username": username,
+        "password": "Passw0rd!", "confirm_password": "Passw0rd!",
+    })
+
+def test_register_is_a_single_insert(app, client):
+    statements = []
+    with app.app_context():
+        engine = db.engine
+    listener = lambda conn, cursor, statement, *args: statements.append(statement.split()[0])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        assert _register(client, "ana@example.com", "ana").status_code == 201
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    # Sin SELECT de exists_by_email / exists_by_username antes del INSERT
+    assert statements == ["INSERT"]
+
+@pytest.mark.parametrize("email, username, error", [
+    ("ana@example.com", "otra", "Email already exists"),
+    ("otra@example.com", "ana", "Username already exists"),
+])
+def test_duplicates_map_to_domain_errors(app, client, email, username, error):
+    assert _register(client, "ana@example.com", "ana").status_code == 201
+
+    response = _register(client, email, username)
+    assert response.status_code == 400
+    assert response.get_json() == {"error": error}
+
+def test_failed_insert_leaves_the_session_usable(app, client, monkeypatch):
+    assert _register(client, "ana@example.com", "ana").status_code == 201
+
+    exists_calls = []
+    monkeypatch.setattr(UserRepositoryImpl, "exists_by_email",
+                        lambda self, email: exists_calls.append(email))
+    assert _register(client, "ana@example.com", "ana").status_code == 400
+    assert _register(client, "luis@example.com", "luis").status_code == 201
+    assert exists_calls == []
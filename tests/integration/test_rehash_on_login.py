@@ -0,0 +1,61 @@
+# tests/integration/test_rehash_on_login.py
+import time
+from uuid import UUID
+
+from src.core.database.db import db
+from src.features.auth.infrastructure.models.user_model import UserModel
+from src.features.auth.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+def _stored_hash(app, user_id):
+    with app.app_context():
+        return db.session.get(UserModel, UUID(user_id)).hashed_password
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+def test_login_migrates_an_outdated_hash(make_app, register_user):
+    bcrypt_app = make_app(PASSWORD_ALGORITHM="bcrypt")
+    user = register_user(bcrypt_app.test_client())
+    assert _stored_hash(bcrypt_app, user["id"]).startswith("$2")
+
+    # Misma base, algoritmo nuevo: el siguiente login migra el hash
+    app = make_app(PASSWORD_ALGORITHM="argon2", AUTH_RATE_LIMIT_ENABLED=False)
+    response = app.test_client().post('/api/v1/auth/login', json={
+        "email": user["email"], "password": user["password"]
+    })
+    assert response.status_code == 200
+
+    assert _wait_for(lambda: _stored_hash(app, user["id"]).startswith("$argon2"))
+    assert app.container.auth.password_rehasher().stats()["upgraded"] == 1
+    # Y el password sigue siendo válido con el hash nuevo
+    assert app.test_client().post('/api/v1/auth/login', json={
+        "email": user["email"], "password": user["password"]
+    }).status_code == 200
+
+def test_hash_update_is_compare_and_set(app, client, register_user):
+    user = register_user(client)
+    current_hash = _stored_hash(app, user["id"])
+
+    with app.app_context():
+        repository = UserRepositoryImpl(db.session)
+        assert not repository.update_password_hash(user["id"], "stale-hash", "new-hash")
+        assert repository.update_password_hash(user["id"], current_hash, "new-hash")
+    assert _stored_hash(app, user["id"]) == "new-hash"
+
+def test_rehash_check_failure_never_fails_the_login(app, client, register_user):
+    user = register_user(client)
+    rehasher = app.container.auth.password_rehasher()
+
+    def broken(hashed_password):
+        raise RuntimeError("boom")
+    rehasher.password_hasher.needs_rehash = broken
+
+    response = client.post('/api/v1/auth/login', json={"email": user["email"], "password": user["password"]})
+
+    assert response.status_code == 200
+    assert rehasher.stats()["failed"] == 1
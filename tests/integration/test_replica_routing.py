@@ -0,0 +1,61 @@
+# tests/integration/test_replica_routing.py
+import pytest
+from sqlalchemy import text
+
+from src.core.database.db import db
+from src.core.database.routing import ReplicaSet, mark_write
+from src.features.auth.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+@pytest.fixture
+def routed_app(make_app, register_user, tmp_path):
+    """Primario y réplica en dos ficheros SQLite con usuarios distintos"""
+    replica_url = f"sqlite:///{tmp_path / 'replica.db'}"
+    register_user(make_app(DATABASE_URL=replica_url).test_client(), "rep@example.com", "rep")
+
+    app = make_app(DATABASE_URL=f"sqlite:///{tmp_path / 'primary.db'}", DATABASE_REPLICA_URLS=[replica_url])
+    primary_user = register_user(app.test_client(), "pri@example.com", "pri")
+    return app, primary_user
+
+def test_read_only_lookups_go_to_the_replica(routed_app):
+    app, _ = routed_app
+
+    with app.test_request_context():
+        repository = UserRepositoryImpl(db.session)
+        assert repository.find_by_email("rep@example.com") is not None
+        assert repository.find_by_email("pri@example.com") is None
+        assert repository.exists_by_username("rep")
+        assert app.extensions["db_replicas"].stats()["routed"] >= 3
+
+def test_reads_after_a_write_stay_on_the_primary(routed_app):
+    app, _ = routed_app
+
+    with app.test_request_context():
+        repository = UserRepositoryImpl(db.session)
+        mark_write(db.session)
+        assert repository.find_by_email("pri@example.com") is not None
+        assert repository.find_by_email("rep@example.com") is None
+
+def test_primary_lookup_bypasses_the_replica(routed_app):
+    app, primary_user = routed_app
+
+    with app.test_request_context():
+        repository = UserRepositoryImpl(db.session)
+        assert repository.find_by_id(primary_user["id"]) is None
+        assert repository.find_by_id(primary_user["id"], primary=True) is not None
+
+def test_unmarked_queries_use_the_primary(routed_app):
+    app, _ = routed_app
+
+    with app.test_request_context():
+        emails = {row.email for row in db.session.execute(text("SELECT email FROM users"))}
+    assert emails == {"pri@example.com"}
+
+def test_ejected_replica_falls_back_to_the_primary(routed_app):
+    app, _ = routed_app
+    replicas: ReplicaSet = app.extensions["db_replicas"]
+    replicas.eject(replicas.engines[0])
+
+    with app.test_request_context():
+        assert UserRepositoryImpl(db.session).find_by_email("pri@example.com") is not None
+    assert replicas.stats()["healthy"] == 0
+    assert replicas.stats()["fallbacks"] >= 1
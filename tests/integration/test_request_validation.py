@@ -0,0 +1,46 @@
+# tests/integration/test_request_validation.py
+import pytest
+
+REGISTER = '/api/v1/auth/register'
+
+@pytest.fixture
+def client(make_app):
+    return make_app(AUTH_RATE_LIMIT_ENABLED=False).test_client()
+
+def _fields(response):
+    body = response.get_json()
+    assert response.status_code == 400
+    assert body["error"] == "Invalid request body"
+    assert body["code"] == "VALIDATION_ERROR"
+    return {detail["field"]: detail["type"] for detail in body["details"]}
+
+def test_each_invalid_field_is_reported(client):
+    response = client.post(REGISTER, json={"email": "no-es-email", "username": "ab", "password": "x"})
+
+    fields = _fields(response)
+    assert set(fields) == {"email", "username", "password", "confirm_password"}
+    assert fields["confirm_password"] == "missing"
+
+def test_submitted_values_are_not_echoed(client):
+    response = client.post(REGISTER, json={
+        "email": "ana@example.com", "username": "ana",
+        "password": "secreto-sin-mayusculas", "confirm_password": "secreto-sin-mayusculas",
+    })
+
+    assert "secreto-sin-mayusculas" not in response.get_data(as_text=True)
+    assert "password" in _fields(response)
+
+def test_model_level_errors_have_an_empty_field(client):
+    response = client.post(REGISTER, json={
+        "email": "ana@example.com", "username": "ana",
+        "password": "Passw0rd!", "confirm_password": "Passw0rd?",
+    })
+
+    assert _fields(response) == {"": "value_error"}
+
+@pytest.mark.parametrize("body", [b"", b"{", b"[]", b'"texto"'])
+def test_empty_or_malformed_bodies_are_validation_errors(client, body):
+    response = client.post(REGISTER, data=body, content_type="application/json")
+
+    assert response.status_code == 400
+    assert response.get_json()["code"] == "VALIDATION_ERROR"
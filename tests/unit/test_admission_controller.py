@@ -0,0 +1,89 @@
+# tests/unit/test_admission_controller.py
+import pytest
+
+from src.features.auth.domain.exceptions.auth_exceptions import ServiceOverloadedException
+from src.features.auth.infrastructure.services.admission_controller import (
+    AdaptiveLimit, AdmissionController, create_admission_controller
+)
+
+def _limit(**kwargs):
+    # window=0: cada release con suficientes muestras recalcula el límite
+    options = {"max_limit": 10, "target_latency": 0.1, "initial_limit": 4, "window": 0, "min_samples": 1}
+    options.update(kwargs)
+    return AdaptiveLimit("test", **options)
+
+def test_rejects_over_the_limit():
+    limit = _limit(initial_limit=2)
+
+    assert limit.try_acquire()
+    assert limit.try_acquire()
+    assert not limit.try_acquire()
+    assert limit.stats()["rejected"] == 1
+
+def test_additive_increase_when_fast_and_busy():
+    limit = _limit()
+    for _ in range(4):
+        limit.try_acquire()
+
+    limit.release(0.01)
+
+    assert limit.stats()["limit"] == 5
+    assert limit.stats()["increases"] == 1
+
+def test_no_increase_when_limit_is_unused():
+    limit = _limit(initial_limit=8)
+    limit.try_acquire()
+
+    limit.release(0.01)
+
+    assert limit.stats()["limit"] == 8
+
+def test_multiplicative_decrease_on_high_latency():
+    limit = _limit(initial_limit=8)
+    limit.try_acquire()
+
+    # Latencia 4x el objetivo: factor acotado a 0.5
+    limit.release(0.4)
+
+    assert limit.stats()["limit"] == 4
+    assert limit.stats()["decreases"] == 1
+
+def test_congestion_decreases_even_when_fast():
+    limit = _limit(initial_limit=8, backoff=0.75)
+    limit.try_acquire()
+
+    limit.release(0.01, congested=True)
+
+    assert limit.stats()["limit"] == 6
+
+def test_limit_never_goes_below_minimum():
+    limit = _limit(initial_limit=2, min_limit=2)
+    for _ in range(5):
+        limit.try_acquire()
+        limit.release(1.0)
+
+    assert limit.stats()["limit"] == 2
+
+def test_unsampled_release_frees_slot_without_adapting():
+    limit = _limit(initial_limit=1)
+    limit.try_acquire()
+
+    limit.release(5.0, sample=False)
+
+    assert limit.stats()["limit"] == 1
+    assert limit.stats()["inflight"] == 0
+    assert limit.try_acquire()
+
+def test_controller_raises_503_with_retry_after():
+    controller = AdmissionController({"credentials": _limit(initial_limit=1)})
+    controller.acquire("credentials")
+
+    with pytest.raises(ServiceOverloadedException) as error:
+        controller.acquire("credentials")
+    assert error.value.retry_after >= 1
+
+def test_controller_ignores_unknown_classes_and_disabled_mode():
+    controller = create_admission_controller(enabled=False)
+
+    assert controller.acquire("credentials") is None
+    assert create_admission_controller().acquire("health") is None
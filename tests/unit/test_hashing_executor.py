@@ -0,0 +1,48 @@
+# tests/unit/test_hashing_executor.py
+import threading
+
+import pytest
+
+from src.features.auth.domain.exceptions.auth_exceptions import HashingOverloadedException
+from src.features.auth.infrastructure.services.security.hashing_executor import HashingExecutor
+
+@pytest.fixture
+def executor():
+    executor = HashingExecutor(max_workers=1, max_queue=1, max_wait=0.2)
+    yield executor
+    executor.shutdown(wait=True)
+
+def _block(executor):
+    """Ocupar el único hilo hasta liberar el evento"""
+    release = threading.Event()
+    executor.submit(release.wait, 5)
+    return release
+
+def test_run_returns_the_result(executor):
+    assert executor.run(pow, 2, 10) == 1024
+    assert executor.stats()["completed"] == 1
+
+def test_run_gives_up_after_max_wait_in_queue(executor):
+    release = _block(executor)
+    try:
+        with pytest.raises(HashingOverloadedException):
+            executor.run(pow, 2, 10)
+    finally:
+        release.set()
+
+    stats = executor.stats()
+    assert stats["expired"] == 1
+    assert stats["queue_depth"] == 0
+    # El hueco de la tarea cancelada se liberó
+    assert executor.run(pow, 2, 3) == 8
+
+def test_full_queue_rejects_immediately(executor):
+    release = _block(executor)
+    try:
+        executor.submit(pow, 2, 2)
+        with pytest.raises(HashingOverloadedException):
+            executor.submit(pow, 2, 2)
+    finally:
+        release.set()
+
+    assert executor.stats()["rejected"] == 1
@@ -0,0 +1,32 @@
+# tests/unit/test_hashing_profile.py
+import pytest
+
+from src.features.auth.infrastructure.services.security.hashing_profile import (
+    HashingProfile, load_profile, load_profiles, save_profile
+)
+
+def test_profiles_roundtrip(tmp_path):
+    path = str(tmp_path / "profiles" / "hashing_profiles.json")
+    save_profile(path, HashingProfile("small-node", "argon2", time_cost=3, memory_cost=19456, parallelism=2))
+    save_profile(path, HashingProfile("large-node", "bcrypt", bcrypt_rounds=13))
+
+    assert set(load_profiles(path)) == {"small-node", "large-node"}
+    profile = load_profile(path, "small-node")
+    assert (profile.time_cost, profile.memory_cost, profile.parallelism) == (3, 19456, 2)
+
+def test_missing_profile_fails_loudly(tmp_path):
+    assert load_profile(str(tmp_path / "none.json"), None) is None
+    with pytest.raises(ValueError):
+        load_profile(str(tmp_path / "none.json"), "small-node")
+
+def test_relative_profiles_file_is_read_from_instance_folder(make_app, tmp_path):
+    save_profile(
+        str(tmp_path / "instance" / "hashing_profiles.json"),
+        HashingProfile("test-node", "bcrypt", bcrypt_rounds=11)
+    )
+
+    app = make_app(PASSWORD_HASH_PROFILE="test-node", PASSWORD_HASH_PROFILES_FILE="hashing_profiles.json")
+
+    password_hasher = app.container.auth.password_hasher()
+    assert password_hasher.profile.name == "test-node"
+    assert password_hasher.bcrypt_rounds == 11
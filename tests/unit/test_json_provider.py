@@ -0,0 +1,35 @@
+# tests/unit/test_json_provider.py
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from flask import jsonify
+from pydantic import BaseModel
+
+class SampleDTO(BaseModel):
+    name: str
+    created_at: datetime
+    last_login: Optional[datetime] = None
+
+CREATED = datetime(2024, 5, 17, 9, 30, 15, 123456)
+
+def test_datetimes_keep_the_previous_format(app):
+    assert app.json.dumps({"at": CREATED}) == '{"at":"2024-05-17T09:30:15"}'
+
+def test_dto_serializes_like_a_dict(app):
+    with app.test_request_context():
+        from_dto = jsonify(SampleDTO(name="ana", created_at=CREATED)).get_json()
+        from_dict = jsonify({"name": "ana", "created_at": CREATED, "last_login": None}).get_json()
+
+    assert from_dto == from_dict == {
+        "name": "ana", "created_at": "2024-05-17T09:30:15", "last_login": None
+    }
+
+def test_falls_back_to_the_standard_library(app):
+    # Enteros > 64 bits y kwargs de json.dumps no los acepta orjson
+    assert app.json.dumps({"n": 2 ** 70}) == '{"n": %d}' % 2 ** 70
+    assert app.json.dumps({"b": 1, "a": 2}, indent=None, sort_keys=True) == '{"a": 2, "b": 1}'
+    assert app.json.dumps({"d": Decimal("1.5")}) == '{"d":"1.5"}'
+
+def test_loads_accepts_bytes_and_str(app):
+    assert app.json.loads(b'{"a": [1, 2]}') == app.json.loads('{"a": [1, 2]}') == {"a": [1, 2]}
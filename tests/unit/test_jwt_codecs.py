@@ -0,0 +1,44 @@
+# tests/unit/test_jwt_codecs.py
+import pytest
+
+from src.features.auth.domain.exceptions.auth_exceptions import InvalidTokenException
+from src.features.auth.infrastructure.services.security.jwt_codecs import (
+    HMACCodec, JoseCodec, _b64encode, create_codec
+)
+
+CLAIMS = {"sub": "ana", "exp": 4102444800, "type": "access"}
+
+@pytest.mark.parametrize("algorithm", ["HS256", "HS384", "HS512"])
+def test_hmac_and_jose_tokens_are_interchangeable(algorithm):
+    hmac_codec = HMACCodec("secret", algorithm)
+    jose_codec = JoseCodec("secret", algorithm)
+
+    assert jose_codec.decode(hmac_codec.encode(CLAIMS)) == CLAIMS
+    assert hmac_codec.decode(jose_codec.encode(CLAIMS)) == CLAIMS
+
+def test_hmac_rejects_wrong_key_and_tampered_tokens():
+    token = HMACCodec("secret").encode(CLAIMS)
+    header, payload, signature = token.split(".")
+
+    with pytest.raises(InvalidTokenException):
+        HMACCodec("other").decode(token)
+    with pytest.raises(InvalidTokenException):
+        HMACCodec("secret").decode(".".join([header, payload + "x", signature]))
+    with pytest.raises(InvalidTokenException):
+        HMACCodec("secret").decode("not-a-token")
+
+def test_hmac_rejects_a_different_algorithm_in_the_header():
+    token = HMACCodec("secret", "HS256").encode(CLAIMS)
+    _, payload, signature = token.split(".")
+    header = _b64encode(b'{"alg":"none","typ":"JWT"}').decode()
+
+    with pytest.raises(InvalidTokenException):
+        HMACCodec("secret", "HS256").decode(".".join([header, payload, signature]))
+
+def test_create_codec_picks_the_backend():
+    assert isinstance(create_codec("auto", "secret", "HS256"), HMACCodec)
+    assert isinstance(create_codec("jose", "secret", "HS256"), JoseCodec)
+    with pytest.raises(ValueError):
+        create_codec("auto", None, "EdDSA")
+    with pytest.raises(ValueError):
+        create_codec("fast", "secret", "HS256")
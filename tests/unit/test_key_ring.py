@@ -0,0 +1,83 @@
+# tests/unit/test_key_ring.py
+import os
+import stat
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.dependencies.containers import instance_file
+from src.features.auth.infrastructure.services.security.jwks import JWKSVerifier
+from src.features.auth.infrastructure.services.security.jwt_codecs import JWTCodec, JWTVerifier
+from src.features.auth.infrastructure.services.security.jwt_handler import JWTService, JWTVerificationService
+from src.features.auth.infrastructure.services.security.key_ring import KeyRing, create_key_ring
+
+@pytest.fixture
+def key_ring(tmp_path):
+    return KeyRing(str(tmp_path / "keys" / "signing_keys.json"), "EdDSA", publish_ahead=600, reload_interval=0)
+
+def test_first_key_is_created_with_private_permissions(key_ring):
+    assert len(key_ring.keys()) == 1
+    assert stat.S_IMODE(os.stat(key_ring.path).st_mode) == 0o600
+
+def test_other_workers_share_the_key_file(key_ring):
+    other = KeyRing(key_ring.path, "EdDSA", reload_interval=0)
+
+    assert other.signing_key()[0] == key_ring.signing_key()[0]
+
+def test_rotation_publishes_before_signing(key_ring):
+    current_kid = key_ring.signing_key()[0]
+
+    new_key = key_ring.rotate()
+
+    # La clave nueva ya está en el JWKS pero aún no firma
+    assert {key["kid"] for key in key_ring.jwks()["keys"]} == {current_kid, new_key.kid}
+    assert key_ring.signing_key()[0] == current_kid
+
+def test_rotated_key_signs_once_active(tmp_path):
+    key_ring = KeyRing(str(tmp_path / "keys.json"), "EdDSA", publish_ahead=0, reload_interval=0)
+    old_kid = key_ring.signing_key()[0]
+
+    new_key = key_ring.rotate()
+
+    assert key_ring.signing_key()[0] == new_key.kid
+    # La anterior sigue publicada mientras pueda haber tokens firmados con ella
+    assert old_kid in {key["kid"] for key in key_ring.jwks()["keys"]}
+
+def test_codec_roundtrip_across_rotation(tmp_path):
+    key_ring = KeyRing(str(tmp_path / "keys.json"), "EdDSA", publish_ahead=0, reload_interval=0)
+    codec = key_ring.codec()
+    token = codec.encode({"sub": "ana", "type": "access"})
+
+    key_ring.rotate()
+    rotated = key_ring.codec()
+
+    assert rotated.decode(token)["sub"] == "ana"
+    assert rotated.decode(rotated.encode({"sub": "bea"}))["sub"] == "bea"
+
+def test_symmetric_algorithms_have_no_key_ring(tmp_path):
+    assert create_key_ring(str(tmp_path / "keys.json"), "HS256") is None
+    with pytest.raises(ValueError):
+        KeyRing(str(tmp_path / "keys.json"), "HS256")
+
+def test_jwks_verifier_only_verifies(key_ring):
+    verifier = JWKSVerifier(key_ring.jwks)
+    token = key_ring.codec().encode({"sub": "ana"})
+
+    assert isinstance(verifier, JWTVerifier)
+    assert not isinstance(verifier, JWTCodec)
+    assert not hasattr(verifier, "encode")
+    assert verifier.decode(token)["sub"] == "ana"
+
+def test_verification_service_checks_claims_with_a_jwks(key_ring):
+    issuer = JWTService(None, "EdDSA", issuer="auth", codec=key_ring.codec())
+    tokens = JWTVerificationService(JWKSVerifier(key_ring.jwks), issuer="auth")
+
+    assert tokens.verify_token(issuer.create_access_token({"sub": "ana"}))["sub"] == "ana"
+    assert tokens.verify_token(issuer.create_access_token({"sub": "ana"}, expires_in=-60)) is None
+    assert not hasattr(tokens, "create_access_token")
+
+def test_relative_key_file_lives_in_the_instance_folder(tmp_path):
+    app = SimpleNamespace(instance_path=str(tmp_path / "instance"))
+
+    assert instance_file(app, "jwt_keys.json") == str(tmp_path / "instance" / "jwt_keys.json")
+    assert instance_file(app, "/etc/auth/jwt_keys.json") == "/etc/auth/jwt_keys.json"
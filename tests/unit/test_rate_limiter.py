@@ -0,0 +1,90 @@
+# tests/unit/test_rate_limiter.py
+import pytest
+
+from src.features.auth.infrastructure.services.security.rate_limiter import (
+    RateLimitPolicy, SharedRateLimiter, parse_rate
+)
+
+@pytest.mark.parametrize("rate, expected", [
+    ("10/minute", (10, 60.0)),
+    ("5 per second", (5, 1.0)),
+    ("100/5minutes", (100, 300.0)),
+    ("2/hours", (2, 3600.0)),
+    ("off", None),
+    ("", None),
+    (None, None),
+])
+def test_parse_rate(rate, expected):
+    assert parse_rate(rate) == expected
+
+@pytest.mark.parametrize("rate", ["ten/minute", "0/minute", "5/fortnight"])
+def test_parse_rate_rejects_invalid(rate):
+    with pytest.raises(ValueError):
+        parse_rate(rate)
+
+def test_gcra_allows_burst_then_limits():
+    limiter = SharedRateLimiter(slots=64, stripes=1)
+
+    assert all(limiter.hit("k", 5, 60)[0] for _ in range(5))
+    allowed, retry_after = limiter.hit("k", 5, 60)
+
+    assert not allowed
+    # Un hueco nuevo cada periodo/límite = 12 s
+    assert 0 < retry_after <= 12
+    assert limiter.stats()["limited"] == 1
+
+def test_gcra_keys_are_independent():
+    limiter = SharedRateLimiter(slots=64, stripes=1)
+    limiter.hit("a", 1, 60)
+
+    assert not limiter.hit("a", 1, 60)[0]
+    assert limiter.hit("b", 1, 60)[0]
+
+def test_full_stripe_evicts_instead_of_failing():
+    limiter = SharedRateLimiter(slots=4, stripes=1, max_probes=4)
+
+    for i in range(10):
+        assert limiter.hit(f"k{i}", 1, 60)[0]
+    assert limiter.stats()["evictions"] == 6
+
+def test_shared_file_is_seen_by_other_instances(tmp_path):
+    path = str(tmp_path / "limits.bin")
+    first = SharedRateLimiter(path, slots=64, stripes=4)
+    second = SharedRateLimiter(path, slots=64, stripes=4)
+
+    assert first.hit("k", 2, 60)[0]
+    assert second.hit("k", 2, 60)[0]
+    assert not first.hit("k", 2, 60)[0]
+
+def test_reset_empties_the_table():
+    limiter = SharedRateLimiter(slots=64, stripes=1)
+    limiter.hit("k", 1, 60)
+    limiter.reset()
+
+    assert limiter.hit("k", 1, 60)[0]
+
+def test_policy_checks_ip_before_resolving_email():
+    policy = RateLimitPolicy(SharedRateLimiter(slots=64), per_ip="1/minute", per_email="5/minute")
+    resolved = []
+
+    def email():
+        resolved.append(True)
+        return "ana@example.com"
+
+    assert policy.check("login", "10.0.0.1", email) is None
+    assert policy.check("login", "10.0.0.1", email) is not None
+    # La IP agotada corta antes de validar el cuerpo
+    assert len(resolved) == 1
+
+def test_policy_limits_per_email_across_ips():
+    policy = RateLimitPolicy(SharedRateLimiter(slots=64), per_ip="10/minute", per_email="2/minute")
+
+    assert policy.check("login", "10.0.0.1", "ana@example.com") is None
+    assert policy.check("login", "10.0.0.2", "ana@example.com") is None
+    assert policy.check("login", "10.0.0.3", "ana@example.com") is not None
+    assert policy.check("login", "10.0.0.3", "bea@example.com") is None
+
+def test_disabled_policy_allows_everything():
+    policy = RateLimitPolicy(SharedRateLimiter(slots=64), per_ip="1/minute", enabled=False)
+
+    assert all(policy.check("login", "10.0.0.1", None) is None for _ in range(5))
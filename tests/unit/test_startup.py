@@ -0,0 +1,51 @@
+# tests/unit/test_startup.py
+import os
+
+import click
+
+from src.core.startup import HEAVY_MODULES, cli_enabled, parse_importtime, profile_startup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      1500 |       4200 | jose
+import time: garbage
+"""
+
+def test_parse_importtime_skips_header_and_noise():
+    assert parse_importtime(IMPORTTIME) == [
+        {"module": "_io", "self_ms": 0.12, "cumulative_ms": 0.12},
+        {"module": "jose", "self_ms": 1.5, "cumulative_ms": 4.2},
+    ]
+
+def test_cli_is_registered_only_from_click_with_lazy_startup(make_app):
+    app = make_app(LAZY_STARTUP=True)
+    assert not cli_enabled(app)
+    with click.Context(click.Command('flask')):
+        assert cli_enabled(app)
+
+    assert cli_enabled(make_app(LAZY_STARTUP=False))
+
+def test_lazy_startup_defers_heavy_modules():
+    # Proceso nuevo: los tests ya tienen estos módulos en sys.modules
+    summary = profile_startup(ROOT, lazy=True)
+
+    assert summary["loaded"] == []
+    assert summary["lazy_startup"] == "true"
+    assert summary["module_count"] == len(summary["modules"]) > 0
+
+def test_eager_startup_loads_migrations():
+    summary = profile_startup(ROOT, lazy=False)
+
+    assert {"flask_migrate", "alembic"} <= set(summary["loaded"]) <= set(HEAVY_MODULES)
+
+def test_lazy_app_loads_the_hasher_on_first_use(make_app, register_user):
+    app = make_app(LAZY_STARTUP=True, AUTH_RATE_LIMIT_ENABLED=False)
+    client = app.test_client()
+    user = register_user(client)
+
+    assert client.post('/api/v1/auth/login', json={
+        "email": user["email"], "password": user["password"]
+    }).status_code == 200
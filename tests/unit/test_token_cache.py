@@ -0,0 +1,73 @@
+# tests/unit/test_token_cache.py
+import time
+
+from src.features.auth.infrastructure.services.security.jwt_handler import JWTService
+from src.features.auth.infrastructure.services.security.token_cache import VerifiedTokenCache, create_token_cache
+
+def _service(cache):
+    return JWTService("secret", "HS256", token_cache=cache)
+
+def test_verified_payload_is_served_from_the_cache():
+    cache = VerifiedTokenCache()
+    service = _service(cache)
+    token = service.create_access_token({"sub": "ana"})
+
+    decoded = []
+    decode = service.verifier.decode
+    service.verifier.decode = lambda token: decoded.append(token) or decode(token)
+
+    first = service.verify_token(token)
+
+    assert service.verify_token(token) == first
+    assert decoded == [token]
+    assert cache.stats()["hits"] == 1
+
+def test_invalid_tokens_never_enter_the_cache():
+    cache = VerifiedTokenCache()
+    service = _service(cache)
+
+    assert service.verify_token("not-a-token") is None
+    assert service.verify_token(_service(None).create_access_token({"sub": "ana"}) + "x") is None
+    assert cache.stats()["size"] == 0
+
+def test_entries_expire_with_the_token():
+    cache = VerifiedTokenCache()
+    cache.set("token", {"sub": "ana", "exp": time.time() + 0.05})
+    assert cache.get("token") is not None
+
+    time.sleep(0.1)
+
+    assert cache.get("token") is None
+
+def test_tokens_without_exp_or_too_large_are_not_cached():
+    cache = VerifiedTokenCache(max_token_bytes=10)
+    cache.set("short", {"sub": "ana"})
+    cache.set("x" * 11, {"sub": "ana", "exp": time.time() + 60})
+
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["oversize"] == 1
+
+def test_keys_are_digests_and_copies_are_returned():
+    cache = VerifiedTokenCache()
+    cache.set("token", {"sub": "ana", "exp": time.time() + 60})
+    cache.get("token")["sub"] = "changed"
+
+    assert cache.get("token")["sub"] == "ana"
+    assert list(cache._cache) == [VerifiedTokenCache.digest("token")]
+
+def test_invalidate_token_and_subject():
+    cache = VerifiedTokenCache()
+    service = _service(cache)
+    tokens = [service.create_access_token({"sub": sub}) for sub in ("ana", "ana", "bea")]
+    for token in tokens:
+        service.verify_token(token)
+
+    service.invalidate_token(tokens[0])
+    assert cache.stats()["size"] == 2
+
+    service.invalidate_subject("ana")
+    assert cache.get(tokens[1]) is None
+    assert cache.get(tokens[2]) is not None
+
+def test_size_zero_disables_the_cache():
+    assert create_token_cache(0) is None
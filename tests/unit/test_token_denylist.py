@@ -0,0 +1,124 @@
+# tests/unit/test_token_denylist.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.features.auth.infrastructure.services.security.token_denylist import BloomFilter, TokenDenylist
+
+class FakeRevokedTokens:
+    """Tabla revoked_tokens en memoria con la misma paginación por keyset"""
+
+    def __init__(self):
+        self.rows = {}
+        self.queries = 0
+
+    def revoke(self, jti, user_id, expires_at, revoked_at=None):
+        self.rows[jti] = revoked_at or datetime.utcnow()
+
+    def is_revoked(self, jti):
+        self.queries += 1
+        return jti in self.rows
+
+    def iter_active(self):
+        return iter(self.rows.items())
+
+    def revoked_since(self, since, limit, after_jti=None):
+        rows = sorted((revoked_at, jti) for jti, revoked_at in self.rows.items())
+        if after_jti is None:
+            rows = [row for row in rows if row[0] >= since]
+        else:
+            rows = [row for row in rows if row > (since, after_jti)]
+        return [(jti, revoked_at) for revoked_at, jti in rows[:limit]]
+
+@pytest.fixture
+def repository():
+    return FakeRevokedTokens()
+
+def _expires():
+    return datetime.utcnow() + timedelta(minutes=15)
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000, 0.01)
+    keys = [f"jti-{i}" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+def test_unrevoked_token_is_resolved_without_queries(repository):
+    repository.revoke("old", None, _expires())
+    denylist = TokenDenylist(lambda: repository, capacity=1000)
+
+    assert not denylist.is_revoked("fresh")
+    assert denylist.is_revoked("old")
+    assert repository.queries == 1
+    assert denylist.stats()["filtered"] == 1
+
+def test_local_revocation_is_visible_immediately(repository):
+    denylist = TokenDenylist(lambda: repository, capacity=1000)
+    assert not denylist.is_revoked("jti")
+
+    denylist.revoke("jti", "user", _expires())
+
+    assert denylist.is_revoked("jti")
+
+def test_refresh_pages_through_rows_with_equal_timestamps(repository):
+    denylist = TokenDenylist(lambda: repository, capacity=1000, grace=0)
+    denylist.page_size = 3
+    denylist._rebuild()
+
+    # Revocaciones de otro worker, varias con el mismo revoked_at
+    revoked_at = denylist._cursor + timedelta(seconds=1)
+    for i in range(8):
+        repository.revoke(f"jti-{i}", None, _expires(), revoked_at + timedelta(seconds=i // 4))
+    denylist._refresh()
+
+    assert all(denylist.is_revoked(f"jti-{i}") for i in range(8))
+    assert denylist._cursor == revoked_at + timedelta(seconds=1)
+
+def test_refresh_forgets_cached_negative_answers(repository):
+    denylist = TokenDenylist(lambda: repository, capacity=1000, grace=0)
+    denylist._rebuild()
+    denylist._filter.add("jti")  # falso positivo ya confirmado como "no revocado"
+    assert not denylist.is_revoked("jti")
+
+    repository.revoke("jti", None, _expires(), denylist._cursor + timedelta(seconds=1))
+    denylist._refresh()
+
+    assert denylist.is_revoked("jti")
+
+def test_rebuild_keeps_local_revocations_missing_from_the_snapshot(repository):
+    denylist = TokenDenylist(lambda: repository, capacity=1000)
+    denylist._rebuild()
+    snapshot = repository.iter_active
+
+    def iter_active():
+        rows = list(snapshot())
+        # Logout en este worker que confirma después de leer la tabla
+        denylist.revoke("late", "user", _expires())
+        return iter(rows)
+
+    repository.iter_active = iter_active
+    denylist._rebuild()
+    repository.queries = 0
+
+    assert denylist.is_revoked("late")
+    assert repository.queries == 0
+
+def test_full_mode_queries_every_check_without_poller(repository, app):
+    denylist = TokenDenylist(lambda: repository, mode="full")
+
+    with app.app_context():
+        assert not denylist.is_revoked("jti")
+        repository.revoke("jti", None, _expires())
+        assert denylist.is_revoked("jti")
+
+    assert repository.queries == 2
+    assert denylist._filter is None and denylist._poller is None
+    assert denylist.stats()["mode"] == "full"
+
+def test_unknown_mode_is_rejected(repository):
+    with pytest.raises(ValueError):
+        TokenDenylist(lambda: repository, mode="redis")
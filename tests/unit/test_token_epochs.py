@@ -0,0 +1,63 @@
+# tests/unit/test_token_epochs.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.features.auth.infrastructure.services.security.token_epochs import TokenEpochMap
+
+class FakeTokenEpochs:
+    """Columnas token_epoch/token_epoch_at de users, en memoria"""
+
+    def __init__(self):
+        self.rows = {}
+
+    def set(self, user_id, epoch, changed_at=None):
+        self.rows[user_id] = (epoch, changed_at or datetime.utcnow())
+
+    def iter_token_epochs(self):
+        return ((user_id, epoch, at) for user_id, (epoch, at) in self.rows.items() if epoch > 0)
+
+    def token_epochs_since(self, since, limit, after_id=None):
+        rows = sorted((at, user_id, epoch) for user_id, (epoch, at) in self.rows.items())
+        if after_id is None:
+            rows = [row for row in rows if row[0] >= since]
+        else:
+            rows = [row for row in rows if row[:2] > (since, after_id)]
+        return [(user_id, epoch, at) for at, user_id, epoch in rows[:limit]]
+
+@pytest.fixture
+def repository():
+    return FakeTokenEpochs()
+
+def test_is_current_compares_token_claim_with_user_epoch(repository):
+    repository.set("ana", 2)
+    epochs = TokenEpochMap(lambda: repository)
+
+    assert epochs.is_current({"sub": "ana", "epc": 2})
+    assert not epochs.is_current({"sub": "ana", "epc": 1})
+    assert not epochs.is_current({"sub": "ana"})
+    assert epochs.is_current({"sub": "bea"})
+    assert not epochs.is_current({"sub": "bea", "epc": "x"})
+    assert epochs.stats()["stale"] == 3
+
+def test_observe_only_moves_forward(repository):
+    epochs = TokenEpochMap(lambda: repository)
+    epochs.current("ana")
+
+    epochs.observe("ana", 3)
+    epochs.observe("ana", 1)
+
+    assert epochs.current("ana") == 3
+
+def test_refresh_pages_through_rows_with_equal_timestamps(repository):
+    epochs = TokenEpochMap(lambda: repository, grace=0)
+    epochs.page_size = 2
+    epochs.current("user-0")
+
+    changed_at = epochs._cursor + timedelta(seconds=1)
+    for i in range(5):
+        repository.set(f"user-{i}", i + 1, changed_at)
+    epochs._refresh()
+
+    assert [epochs.current(f"user-{i}") for i in range(5)] == [1, 2, 3, 4, 5]
+    assert epochs._cursor == changed_at
@@ -0,0 +1,87 @@
+# tests/unit/test_user_cache.py
+from src.features.auth.domain.entities.user import User
+from src.features.auth.domain.value_objects.email import Email
+from src.features.auth.infrastructure.repositories.cached_user_repository import CachedUserRepository, UserCache
+
+def _user(user_id="u1", username="ana"):
+    return User(email=Email("ana@example.com"), username=username, hashed_password="x", id=user_id)
+
+class FakeRepository:
+    """Repositorio real: registra si la lectura fue al primario"""
+
+    def __init__(self):
+        self.users = {"u1": _user()}
+        self.reads = []
+        self.during_read = None
+
+    def find_by_id(self, user_id, primary=False):
+        self.reads.append(primary)
+        user = self.users.get(user_id)
+        if self.during_read:
+            self.during_read()
+        return user
+
+    def save(self, user):
+        self.users[user.id] = user
+        return user
+
+def test_hit_returns_a_copy():
+    cache = UserCache()
+    cache.set(_user())
+
+    cached = cache.get("u1")
+    cached.username = "changed"
+
+    assert cache.get("u1").username == "ana"
+    assert cache.stats()["hits"] == 2
+
+def test_fill_older_than_an_invalidation_is_discarded():
+    cache = UserCache()
+    generation, recently_invalidated = cache.fill_ticket("u1")
+    assert not recently_invalidated
+
+    cache.invalidate("u1")
+
+    assert not cache.set(_user(), generation)
+    assert cache.get("u1") is None
+    assert cache.stats()["stale_fills"] == 1
+
+def test_clear_discards_fills_started_before_it():
+    cache = UserCache()
+    generation, _ = cache.fill_ticket("u1")
+    cache.clear()
+
+    assert not cache.set(_user(), generation)
+    assert cache.set(_user(), cache.fill_ticket("u1")[0])
+
+def test_invalidation_of_another_user_does_not_block_the_fill():
+    cache = UserCache()
+    generation, _ = cache.fill_ticket("u1")
+    cache.invalidate("u2")
+
+    assert cache.set(_user(), generation)
+
+def test_recently_invalidated_user_is_read_from_the_primary():
+    cache = UserCache(primary_window=60)
+    repository = FakeRepository()
+    cached_repository = CachedUserRepository(repository, cache)
+
+    cached_repository.find_by_id("u1")
+    cached_repository.save(_user(username="bea"))
+    user = cached_repository.find_by_id("u1")
+
+    assert repository.reads == [False, True]
+    assert user.username == "bea"
+    assert cached_repository.find_by_id("u1").username == "bea"
+    assert repository.reads == [False, True]
+
+def test_write_during_the_read_keeps_the_stale_user_out_of_the_cache():
+    cache = UserCache()
+    repository = FakeRepository()
+    cached_repository = CachedUserRepository(repository, cache)
+    # Otro hilo guarda el usuario mientras se lee la versión anterior
+    repository.during_read = lambda: cache.invalidate("u1")
+
+    cached_repository.find_by_id("u1")
+
+    assert cache.get("u1") is None